@@ -1,12 +1,4154 @@
 #!/usr/bin/env python3
 import os
+import sys
+import json
+import errno
+import fcntl
+import threading
+import time
+import re
+import mmap
+import stat
+import zlib
+import queue
 import shutil
-import subprocess
-from pathlib import Path
-import gi
-import urllib.request
-gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, Gdk
+import struct
+import atexit
+import locale
+import fnmatch
+import argparse
+import functools
+import itertools
+import unicodedata
+import collections
+
+# GTK sadece arayüz açılırken yüklenir (bkz. import_gtk); komut satırı kullanımı
+# ekran ve GTK gerektirmez. İsteğe bağlı modüller (zstandard, lz4, numpy) ve tomllib
+# de kullanıldıkları yerde, bulunmazlarsa anlaşılır bir hatayla yüklenir. Açılışı
+# belirgin yavaşlatan ve `list` için gerekmeyen modüller (http.client, multiprocessing,
+# concurrent.futures, subprocess, difflib, lzma, hashlib, urllib.parse) de kullanıldıkları
+# fonksiyonda yüklenir.
+gi = Gtk = Gdk = GLib = Gio = GdkPixbuf = None
+
+
+def import_gtk():
+    global gi, Gtk, Gdk, GLib, Gio, GdkPixbuf
+    import gi
+    gi.require_version('Gtk', '3.0')
+    gi.require_version('GdkPixbuf', '2.0')
+    from gi.repository import Gtk, Gdk, GLib, Gio, GdkPixbuf
+
+
+def data_dir():
+    return os.path.expanduser("~/.local/share/appimage_installer")
+
+
+def desktop_dir():
+    return os.path.expanduser("~/.local/share/applications")
+
+
+def load_json(path, default):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def write_json_atomic(path, data, indent=1):
+    # Önce geçici dosyaya yaz, sonra tek adımda yerine koy
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    if indent is None:
+        text = json.dumps(data, separators=(',', ':'))
+    else:
+        text = json.dumps(data, indent=indent, sort_keys=True)
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class _NullSpan:
+    # İzleme kapalıyken her span() çağrısı bu tek nesneyi döndürür: bellek ayırma yok
+    def __enter__(self):
+        return self
+
+    def __exit__(self, kind, value, traceback):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class TraceSpan:
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, kind, value, traceback):
+        end = time.perf_counter_ns()
+        if kind is not None:
+            self.args['error'] = kind.__name__
+        self.tracer.complete(self.name, self.start, end, self.args)
+        return False
+
+    def set(self, **args):
+        # Span süresince öğrenilen değerler (ör. okunan dosya sayısı)
+        self.args.update(args)
+
+
+class Tracer:
+    # İsteğe bağlı performans izleme: APPIMAGE_INSTALLER_TRACE=<dosya> ortam değişkeni veya
+    # --trace <dosya> ile açılır. Olaylar Chrome trace-event biçimindedir (ph: X süre,
+    # C sayaç, M üst bilgi); dosya .json ile bitiyorsa chrome://tracing ve Perfetto'nun
+    # açtığı dizi biçiminde, aksi halde satır başına bir JSON (JSONL) olarak yazılır.
+    # Dosya MAX_BYTES'ı aşınca <dosya>.1 ... <dosya>.BACKUPS olarak döndürülür.
+    # Kapalıyken span() paylaşılan boş bağlamı döndürür, count() hemen döner.
+    ENV = 'APPIMAGE_INSTALLER_TRACE'
+    MAX_BYTES = 16 * 1024 * 1024
+    BACKUPS = 3
+    # Ana döngü bu süreden uzun yanıt vermezse duraklama olarak kaydedilir
+    STALL_MS = 50
+    HEARTBEAT_MS = 10
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self.file = None
+        self.chrome = False
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def start(self, path):
+        if self.enabled or not path:
+            return
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.chrome = self.path.endswith('.json')
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._open()
+        except OSError as e:
+            # İzleme isteğe bağlıdır: yazılamayan dosya komutu durdurmaz
+            print(f"appimage_installer: trace disabled: {e}", file=sys.stderr)
+            self.path = None
+            return
+        self.enabled = True
+        atexit.register(self.close)
+        self.emit({'name': 'process_name', 'ph': 'M', 'pid': os.getpid(), 'tid': 0,
+                   'args': {'name': 'appimage_installer', 'argv': sys.argv[1:], 'started': time.time()}})
+
+    def _open(self):
+        self.file = open(self.path, 'a', buffering=1)
+        if self.chrome and self.file.tell() == 0:
+            # Kapanış köşeli parantezi isteğe bağlıdır; yarım kalan dosya da açılır
+            self.file.write("[\n")
+
+    def _rotate(self):
+        self.file.close()
+        for index in range(self.BACKUPS - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{index}"):
+                os.replace(f"{self.path}.{index}", f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+        self._open()
+
+    def emit(self, event):
+        line = json.dumps(event, ensure_ascii=False, separators=(',', ':'))
+        with self._lock:
+            if self.file is None:
+                return
+            try:
+                self.file.write(line + (",\n" if self.chrome else "\n"))
+                if self.file.tell() >= self.MAX_BYTES:
+                    self._rotate()
+            except (OSError, ValueError):
+                pass
+
+    def span(self, name, **args):
+        if not self.enabled:
+            return NULL_SPAN
+        return TraceSpan(self, name, args)
+
+    def complete(self, name, start_ns, end_ns, args=None):
+        self.emit({'name': name, 'cat': name.split('.', 1)[0], 'ph': 'X', 'ts': start_ns // 1000,
+                   'dur': (end_ns - start_ns) // 1000, 'pid': os.getpid(), 'tid': threading.get_native_id(),
+                   'args': args or {}})
+
+    def count(self, name, value=1):
+        # Toplam değer sayaç olayı olarak yazılır (Chrome'da zaman içindeki eğri)
+        if not self.enabled:
+            return
+        with self._lock:
+            total = self.counters[name] = self.counters.get(name, 0) + value
+        self.emit({'name': name, 'ph': 'C', 'ts': time.perf_counter_ns() // 1000, 'pid': os.getpid(),
+                   'tid': threading.get_native_id(), 'args': {name: total}})
+
+    def watch_main_loop(self):
+        # GLib ana döngüsünde sık bir zamanlayıcı: beklenenden geç çalışırsa aradaki süre
+        # ana döngünün başka bir işle meşgul kaldığı (kullanıcıya donmuş görünen) süredir
+        if not self.enabled:
+            return
+        state = {'last': time.perf_counter_ns()}
+
+        def heartbeat():
+            now = time.perf_counter_ns()
+            gap = now - state['last']
+            if gap >= self.STALL_MS * 1000000:
+                self.complete('main_loop.stall', state['last'], now, {'ms': gap // 1000000})
+                self.count('main_loop.stalls')
+            state['last'] = now
+            return True
+        GLib.timeout_add(self.HEARTBEAT_MS, heartbeat)
+
+    def close(self):
+        with self._lock:
+            if self.file is None:
+                return
+            self.enabled = False
+            counters = dict(self.counters)
+        # Dönem sonu özeti: panolar son satırdan toplamları okuyabilir
+        self.emit({'name': 'summary', 'ph': 'M', 'pid': os.getpid(), 'tid': 0, 'args': {'counters': counters}})
+        with self._lock:
+            self.file.close()
+            self.file = None
+
+
+trace = Tracer()
+
+
+def traced(name):
+    # Tüm işlemi tek span olarak ölçer; kapalıyken maliyeti tek bir öznitelik kontrolüdür
+
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not trace.enabled:
+                return func(*args, **kwargs)
+            with trace.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def theme_dir():
+    return os.path.expanduser("~/.local/share/icons/hicolor")
+
+
+def refresh_caches(folders):
+    # Menülerin ve ikon temasının önbellekleri; araç kurulu değilse sessizce atlanır
+    import subprocess
+    for folder in sorted(folders):
+        if not os.path.isdir(folder):
+            continue
+        if folder == theme_dir():
+            tool = shutil.which('gtk-update-icon-cache') or shutil.which('gtk4-update-icon-cache')
+            command = [tool, '-q', '-t', '-f', folder]
+        else:
+            tool = shutil.which('update-desktop-database')
+            command = [tool, '-q', folder]
+        if not tool:
+            continue
+        try:
+            subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60, check=False)
+        except (OSError, subprocess.SubprocessError):
+            pass
+
+
+class CacheRefresher:
+    # update-desktop-database / gtk-update-icon-cache her çağrıda yüzlerce ms sürer. İşlemler
+    # değişen klasörleri işaretler; son işaretten DELAY saniye sonra (sürekli işaretlenirse en
+    # geç MAX_DELAY sonra) arka plandaki tek bir iş parçacığı hepsini bir kez yeniler.
+    DELAY = 0.5
+    MAX_DELAY = 10.0
+
+    def __init__(self, runner=None, delay=None, max_delay=None):
+        self.runner = runner or refresh_caches
+        self.delay = self.DELAY if delay is None else delay
+        self.max_delay = self.MAX_DELAY if max_delay is None else max_delay
+        self.dirty = set()
+        self.first = self.last = 0.0
+        self.worker = None
+        self.runs = 0
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+
+    def mark(self, *folders):
+        now = time.monotonic()
+        with self._lock:
+            if not self.dirty:
+                self.first = now
+            self.dirty.update(folders)
+            self.last = now
+            if self.worker is None:
+                self.worker = threading.Thread(target=self._wait, name='cache-refresh', daemon=True)
+                self.worker.start()
+
+    def _wait(self):
+        while True:
+            with self._lock:
+                if not self.dirty:
+                    self.worker = None
+                    return
+                remaining = min(self.last + self.delay, self.first + self.max_delay) - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            else:
+                self.flush()
+
+    def flush(self):
+        # Bekleyen yenilemeyi hemen (çağıran iş parçacığında) yapar; çıkışta çağrılır
+        with self._run_lock:
+            with self._lock:
+                folders, self.dirty = self.dirty, set()
+            if not folders:
+                return False
+            with trace.span('cache.refresh', folders=len(folders)):
+                self.runner(folders)
+            self.runs += 1
+            trace.count('cache_refreshes')
+        return True
+
+    def mark_paths(self, paths):
+        # İşlemin dokunduğu yollardan yenilenecek klasörler
+        apps, icons = desktop_dir(), theme_dir()
+        folders = set()
+        for path in paths:
+            if os.path.dirname(path) == apps:
+                folders.add(apps)
+            elif path.startswith(icons + os.sep):
+                folders.add(icons)
+        if folders:
+            self.mark(*folders)
+
+
+cache_refresh = CacheRefresher()
+
+
+# Bu araçla oluşturulan .desktop dosyalarını işaretleyen anahtar
+MANAGED_KEY = 'X-AppImage-Installer'
+# Hızlı başlatma kipinde AppImage kurulum klasöründe bir kez açılır; .desktop girdisi
+# AppRun'ı çalıştırır ve özgün AppImage bu anahtarda tutulur
+APPIMAGE_KEY = 'X-AppImage-Installer-AppImage'
+# İkon temaya kurulduysa Icon= tema adını taşır, kurulum klasöründeki ikon dosyası bu anahtarda
+ICON_KEY = 'X-AppImage-Installer-Icon'
+# hicolor temasının boyut klasörleri
+THEME_ICON_SIZES = (16, 22, 24, 32, 48, 64, 96, 128, 256, 512)
+
+
+def theme_icon_name(app_name):
+    # Tema ikon adı; diğer paketlerin ikonlarıyla çakışmasın diye önekli. Temizlenen ad
+    # çakışabilir ("Foo Bar" / "Foo-Bar"), bu yüzden uygulama adının kısa özeti eklenir
+    import hashlib
+    slug = ''.join(char if char.isalnum() or char in '-_.' else '-' for char in app_name.lower())
+    return f"appimage-{slug}-{hashlib.sha256(app_name.encode()).hexdigest()[:8]}"
+
+
+def png_size(path):
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(24)
+    except OSError:
+        return None
+    if len(header) < 24 or header[:8] != b'\x89PNG\r\n\x1a\n' or header[12:16] != b'IHDR':
+        return None
+    return struct.unpack('>II', header[16:24])
+
+
+def is_size_dir(name):
+    width, _x, height = name.partition('x')
+    return width.isdigit() and width == height
+
+
+def theme_icon_sources(icon_path):
+    # Temaya kurulacak (boyut klasörü, kaynak) çiftleri; ölçekleme yapılmaz. Kaynak bir tema
+    # ağacındaysa (…/48x48/apps/ad.png) aynı adlı diğer boyutlar da alınır, değilse PNG kendi
+    # boyutuna en yakın (büyük) klasöre konur. SVG "scalable" olur; XPM temaya kurulmaz.
+    ext = os.path.splitext(icon_path)[1].lower()
+    if ext == '.svg':
+        return [('scalable', icon_path)]
+    if ext != '.png':
+        return []
+    apps = os.path.dirname(os.path.abspath(icon_path))
+    size_dir = os.path.dirname(apps)
+    if os.path.basename(apps) == 'apps' and is_size_dir(os.path.basename(size_dir)):
+        root = os.path.dirname(size_dir)
+        found = []
+        for entry in sorted(os.listdir(root), key=lambda name: (len(name), name)):
+            candidate = os.path.join(root, entry, 'apps', os.path.basename(icon_path))
+            if is_size_dir(entry) and os.path.isfile(candidate):
+                found.append((entry, candidate))
+        if found:
+            return found
+    size = png_size(icon_path)
+    if not size:
+        return []
+    side = next((side for side in THEME_ICON_SIZES if side >= max(size)), THEME_ICON_SIZES[-1])
+    return [(f"{side}x{side}", icon_path)]
+
+
+def theme_icon_files(icon_name):
+    # Temada bu ada ait kurulu (boyut klasörü, yol) çiftleri
+    found = []
+    try:
+        sizes = sorted(os.listdir(theme_dir()))
+    except OSError:
+        return found
+    for size in sizes:
+        for ext in ('.png', '.svg'):
+            path = os.path.join(theme_dir(), size, 'apps', icon_name + ext)
+            if os.path.isfile(path):
+                found.append((size, path))
+    return found
+
+
+def theme_icon_plan(app_name, sources):
+    # (kaynak, hedef) çiftleri ve temada kalıp artık kullanılmayacak eski dosyalar
+    icon_name = theme_icon_name(app_name)
+    writes = [(src, os.path.join(theme_dir(), size, 'apps', icon_name + os.path.splitext(src)[1].lower()))
+              for size, src in sources]
+    targets = {dest for _src, dest in writes}
+    return writes, [path for _size, path in theme_icon_files(icon_name) if path not in targets]
+
+
+def build_desktop_entry(name, exec_path, icon_path, categories='Development;', appimage=None, icon_name=None):
+    # appimage verilirse Exec açılmış klasördeki AppRun'dır, özgün AppImage ayrıca kaydedilir.
+    # icon_name verilirse Icon= tema adıdır, ikon dosyasının yolu ICON_KEY'de kalır.
+    categories = categories if categories.endswith(';') else f"{categories};"
+    icon_line = f"Icon={icon_name}\n{ICON_KEY}={icon_path}\n" if icon_name and icon_path else \
+        f"Icon={icon_path}\n" if icon_path else ""
+    appimage_line = f"{APPIMAGE_KEY}={appimage}\n" if appimage else ""
+    return f"""[Desktop Entry]\nName={name}\nExec={exec_path}\n{icon_line}Type=Application\nCategories={categories}\n{MANAGED_KEY}=true\n{appimage_line}"""
+
+
+def read_desktop_entry(path):
+    # Sadece [Desktop Entry] grubundaki, dile özgü olmayan anahtarları okur
+    values = {}
+    in_group = None
+    with open(path, 'r', errors='replace') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('['):
+                if in_group:
+                    break
+                in_group = line == '[Desktop Entry]'
+                continue
+            if in_group is False or '=' not in line or line.startswith('#'):
+                continue
+            key, value = line.split('=', 1)
+            key = key.strip()
+            if key not in values:
+                values[key] = value.strip()
+    exec_line = values.get('Exec', '')
+    exec_target = exec_line.split(' %', 1)[0]
+    extracted = bool(values.get(APPIMAGE_KEY))
+    return {
+        'name': values.get('Name'),
+        'exec': exec_line or None,
+        # Kurulu AppImage dosyası ve (hızlı başlatma kipinde) açıldığı klasör
+        'appimage': values.get(APPIMAGE_KEY) or exec_line or None,
+        'appdir': os.path.dirname(exec_target) if extracted else None,
+        'mode': 'extracted' if extracted else 'appimage',
+        'icon': values.get(ICON_KEY) or values.get('Icon'),
+        'theme_icon': values.get('Icon') if values.get(ICON_KEY) else None,
+        'categories': values.get('Categories', ''),
+        'keywords': values.get('Keywords', ''),
+        'managed': values.get(MANAGED_KEY) == 'true' or exec_target.endswith('.AppImage'),
+    }
+
+
+class AppCatalog:
+    # ~/.local/share/applications içeriğinin diskteki dizini. Her açılışta tek bir
+    # os.scandir/stat geçişi yapılır; sadece mtime/boyutu değişen dosyalar yeniden okunur.
+    VERSION = 2
+
+    def __init__(self, apps_dir=None, index_path=None):
+        self.apps_dir = apps_dir or desktop_dir()
+        self.index_path = index_path or os.path.join(data_dir(), "catalog.json")
+        self.entries = {}
+        self.parsed = 0
+
+    def load(self):
+        # Bozuk, eski sürüm ya da başka klasörün dizini yok sayılır: tam tarama yapılır
+        data = load_json(self.index_path, {})
+        if not isinstance(data, dict):
+            data = {}
+        entries = data.get('entries')
+        if data.get('version') == self.VERSION and data.get('apps_dir') == self.apps_dir and \
+                isinstance(entries, dict) and all(self.valid(record) for record in entries.values()):
+            self.entries = entries
+        else:
+            self.entries = {}
+        return self
+
+    @staticmethod
+    def valid(record):
+        return isinstance(record, dict) and isinstance(record.get('mtime'), int) and isinstance(record.get('size'), int)
+
+    def save(self):
+        write_json_atomic(self.index_path, {
+            'version': self.VERSION,
+            'apps_dir': self.apps_dir,
+            'entries': self.entries,
+        }, indent=None)
+
+    def refresh(self):
+        # (eklenen, değişen, silinen) yol kümelerini döndürür
+        added, changed = set(), set()
+        seen = set()
+        self.parsed = 0
+        try:
+            scanner = os.scandir(self.apps_dir)
+        except OSError:
+            scanner = None
+        if scanner is not None:
+            with scanner:
+                for entry in scanner:
+                    if not entry.name.endswith('.desktop'):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    path = entry.path
+                    seen.add(path)
+                    old = self.entries.get(path)
+                    if old and old['mtime'] == st.st_mtime_ns and old['size'] == st.st_size:
+                        continue
+                    try:
+                        record = read_desktop_entry(path)
+                    except OSError:
+                        seen.discard(path)
+                        continue
+                    self.parsed += 1
+                    record['mtime'] = st.st_mtime_ns
+                    record['size'] = st.st_size
+                    self.entries[path] = record
+                    (changed if old else added).add(path)
+        removed = set(self.entries) - seen
+        for path in removed:
+            del self.entries[path]
+        if self.parsed:
+            trace.count('desktop_files_parsed', self.parsed)
+        if added or changed or removed:
+            try:
+                self.save()
+            except OSError:
+                pass
+        return added, changed, removed
+
+    def apps(self):
+        # Listede gösterilecek (isim, yol) çiftleri
+        return [(record['name'], path) for path, record in self.entries.items() if record.get('name')]
+
+
+class HttpSession:
+    # Sunucu başına tek keep-alive bağlantısını yeniden kullanan küçük HTTP istemcisi.
+    # Bir oturum tek iş parçacığında kullanılmalıdır.
+    MAX_REDIRECTS = 3
+
+    def __init__(self, timeout=10):
+        self.timeout = timeout
+        self.connections = {}
+
+    def _connection(self, scheme, netloc, fresh=False):
+        key = (scheme, netloc)
+        if fresh:
+            self._drop(key)
+        if key not in self.connections:
+            import http.client
+            cls = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+            self.connections[key] = cls(netloc, timeout=self.timeout)
+        return self.connections[key]
+
+    def _send(self, url, headers):
+        import urllib.parse
+        parts = urllib.parse.urlsplit(url)
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+        for attempt in range(2):
+            # Sunucu boştaki bağlantıyı kapatmışsa ya da önceki yanıt yarım okunduysa bir kez
+            # yeni bağlantıyla dene
+            conn = self._connection(parts.scheme, parts.netloc, fresh=attempt > 0)
+            import http.client
+            try:
+                conn.request('GET', target, headers=headers)
+                return conn.getresponse()
+            except (http.client.RemoteDisconnected, http.client.ImproperConnectionState,
+                    ConnectionResetError, BrokenPipeError):
+                self._drop((parts.scheme, parts.netloc))
+                if attempt:
+                    raise
+            except BaseException:
+                # Zaman aşımı vb. sonrası bağlantı "istek gönderildi" durumunda kalır; yeniden kullanılamaz
+                self._drop((parts.scheme, parts.netloc))
+                raise
+
+    def _drop(self, key):
+        conn = self.connections.pop(key, None)
+        if conn is not None:
+            conn.close()
+
+    def get(self, url, headers=None):
+        # Yönlendirmeleri izler; (yanıt, son adres) döndürür. Yanıt gövdesi okunmalıdır.
+        import urllib.parse
+        headers = dict({'User-Agent': 'appimage-installer', 'Connection': 'keep-alive'}, **(headers or {}))
+        current = url
+        for _ in range(self.MAX_REDIRECTS + 1):
+            response = self._send(current, headers)
+            if response.status in (301, 302, 303, 307, 308) and response.getheader('Location'):
+                response.read()
+                current = urllib.parse.urljoin(current, response.getheader('Location'))
+                continue
+            break
+        return response, current
+
+    def close(self):
+        for conn in self.connections.values():
+            conn.close()
+        self.connections = {}
+
+
+class IconFetcher:
+    # İkonları arka planda, sınırlı sayıda iş parçacığıyla ve koşullu isteklerle indirir.
+    # Her iş parçacığı kendi HttpSession'ı ile aynı sunucuya açtığı bağlantıyı yeniden kullanır.
+    def __init__(self, icons, icons_dir, on_icon=None, max_workers=4, timeout=10, manifest_path=None):
+        self.icons = list(icons)
+        self.icons_dir = icons_dir
+        self.on_icon = on_icon
+        self.max_workers = max(1, min(max_workers, len(self.icons) or 1))
+        self.timeout = timeout
+        self.manifest_path = manifest_path or os.path.join(os.path.dirname(icons_dir), "icons_manifest.json")
+        self.manifest = {}
+        self.results = {}
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        thread = threading.Thread(target=self.run, name="icon-fetcher", daemon=True)
+        thread.start()
+        return thread
+
+    def run(self):
+        os.makedirs(self.icons_dir, exist_ok=True)
+        self.manifest = load_json(self.manifest_path, {})
+        jobs = queue.Queue()
+        for item in self.icons:
+            jobs.put(item)
+        workers = [threading.Thread(target=self._worker, args=(jobs,), daemon=True) for _ in range(self.max_workers)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        try:
+            write_json_atomic(self.manifest_path, self.manifest)
+        except OSError:
+            pass
+        self.done.set()
+        return self.results
+
+    def _worker(self, jobs):
+        session = HttpSession(self.timeout)
+        try:
+            while True:
+                try:
+                    name, url = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    status = self._fetch(session, name, url)
+                except Exception:
+                    status = 'error'
+                with self._lock:
+                    self.results[name] = status
+                icon_path = self.icon_path(name)
+                if self.on_icon and os.path.exists(icon_path):
+                    self.on_icon(name, icon_path)
+        finally:
+            session.close()
+
+    def icon_path(self, name):
+        return os.path.join(self.icons_dir, f"{name}.png")
+
+    def _fetch(self, session, name, url):
+        icon_path = self.icon_path(name)
+        with self._lock:
+            entry = dict(self.manifest.get(name) or {})
+        headers = {}
+        if entry.get('url') == url and os.path.exists(icon_path):
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        response, _final_url = session.get(url, headers)
+        if response.status == 304:
+            response.read()
+            return 'not_modified'
+        if response.status != 200:
+            response.read()
+            return 'error'
+        tmp_path = f"{icon_path}.part"
+        try:
+            with open(tmp_path, 'wb') as f:
+                shutil.copyfileobj(response, f)
+            os.replace(tmp_path, icon_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        with self._lock:
+            self.manifest[name] = {
+                'url': url,
+                'etag': response.getheader('ETag'),
+                'last_modified': response.getheader('Last-Modified'),
+            }
+        return 'downloaded'
+
+
+class CopyCancelled(Exception):
+    pass
+
+
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+COPY_CHUNK = 8 * 1024 * 1024
+# Bu hatalarda bir sonraki (daha yavaş) kopyalama yöntemine geçilir
+COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EPERM, errno.EBADF, errno.ENOTTY}
+
+
+def _copy_loop(step, total, progress, cancel):
+    copied = 0
+    while copied < total:
+        if cancel is not None and cancel.is_set():
+            raise CopyCancelled()
+        sent = step(copied, min(COPY_CHUNK, total - copied))
+        if sent == 0:
+            break
+        copied += sent
+        if progress:
+            progress(copied, total)
+    return copied
+
+
+def _copy_fd(src_fd, dst_fd, total, progress=None, cancel=None):
+    # Sırayla: reflink (FICLONE), copy_file_range, sendfile, parça parça okuma/yazma
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        if progress:
+            progress(total, total)
+        return 'reflink'
+    except OSError as e:
+        if e.errno not in COPY_FALLBACK_ERRNOS:
+            raise
+    kernel_copies = []
+    if hasattr(os, 'copy_file_range'):
+        kernel_copies.append(('copy_file_range', lambda offset, count: os.copy_file_range(src_fd, dst_fd, count, offset, offset)))
+    if hasattr(os, 'sendfile'):
+        kernel_copies.append(('sendfile', lambda offset, count: os.sendfile(dst_fd, src_fd, offset, count)))
+    for method, step in kernel_copies:
+        try:
+            copied = _copy_loop(step, total, progress, cancel)
+        except OSError as e:
+            # Hiç veri yazılmadan desteklenmediği anlaşıldıysa sıradaki yönteme geç
+            if e.errno not in COPY_FALLBACK_ERRNOS or os.lseek(dst_fd, 0, os.SEEK_END) != 0:
+                raise
+            continue
+        if copied == total:
+            return method
+        raise OSError(errno.EIO, "kopyalama eksik kaldı")
+    buffer = bytearray(COPY_CHUNK)
+    view = memoryview(buffer)
+    os.lseek(src_fd, 0, os.SEEK_SET)
+
+    def step(offset, count):
+        read = os.readv(src_fd, [view[:count]])
+        written = 0
+        while written < read:
+            written += os.write(dst_fd, view[written:read])
+        return read
+    _copy_loop(step, total, progress, cancel)
+    return 'chunked'
+
+
+def same_filesystem(path_a, folder_b):
+    # folder_b henüz yoksa oluşturulacağı en yakın üst klasöre bakılır
+    folder_b = os.path.abspath(folder_b)
+    while not os.path.exists(folder_b) and os.path.dirname(folder_b) != folder_b:
+        folder_b = os.path.dirname(folder_b)
+    try:
+        return os.stat(path_a).st_dev == os.stat(folder_b).st_dev
+    except OSError:
+        return False
+
+
+def copy_file(src, dst, progress=None, cancel=None, mode='copy'):
+    # mode: 'copy' | 'link' (aynı dosya sisteminde hardlink) | 'move' (taşı).
+    # Hedef önce gizli bir .part dosyasına yazılır, sonra os.replace ile yerine konur.
+    # Kullanılan yöntemin adını döndürür.
+    dst_dir = os.path.dirname(os.path.abspath(dst))
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return 'same'
+    tmp_path = os.path.join(dst_dir, f".{os.path.basename(dst)}.{os.getpid()}.{threading.get_ident()}.part")
+    if mode in ('move', 'link') and same_filesystem(src, dst_dir):
+        method = None
+        if mode == 'move':
+            os.replace(src, dst)
+            method = 'rename'
+        else:
+            try:
+                os.link(src, tmp_path)
+                os.replace(tmp_path, dst)
+                method = 'hardlink'
+            except OSError as e:
+                # Hardlink desteklemeyen dosya sistemi: kopyalamaya geç
+                if e.errno not in COPY_FALLBACK_ERRNOS:
+                    raise
+        if method:
+            if progress:
+                size = os.stat(dst).st_size
+                progress(size, size)
+            return method
+    try:
+        with trace.span('copy', path=dst) as span, open(src, 'rb') as fsrc, open(tmp_path, 'wb') as fdst:
+            total = os.fstat(fsrc.fileno()).st_size
+            method = _copy_fd(fsrc.fileno(), fdst.fileno(), total, progress, cancel)
+            span.set(bytes=total, method=method)
+        trace.count('bytes_copied', total)
+        shutil.copystat(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if mode == 'move':
+        os.remove(src)
+    return method
+
+
+class ProgressTracker:
+    # Birden çok dosyanın toplam ilerlemesini tek bir oranda birleştirir. Her iş parçacığı
+    # aynı anda tek dosya işler; paralel toplu kurulumda da güvenle kullanılabilir.
+    def __init__(self, report, total):
+        self.report = report
+        self.total = max(total, 1)
+        self.done = 0
+        self.active = {}
+        self._lock = threading.Lock()
+
+    def file(self, label):
+        def progress(copied, size):
+            with self._lock:
+                self.active[threading.get_ident()] = copied
+                fraction = (self.done + sum(self.active.values())) / self.total
+            self.report(fraction, label)
+        return progress
+
+    def advance(self, size):
+        with self._lock:
+            self.active.pop(threading.get_ident(), None)
+            self.done += size
+
+
+@traced('desktop.write')
+def write_desktop_file(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(content)
+    os.chmod(tmp_path, 0o755)
+    os.replace(tmp_path, path)
+
+
+def default_install_dir():
+    return os.path.expanduser("~/App")
+
+
+def file_size(path):
+    if not path:
+        return 0
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+HASH_BUFFER = 4 * 1024 * 1024
+
+
+def sha256_file(path, progress=None, cancel=None):
+    # Büyük tamponla akış halinde özet; dosya belleğe alınmaz
+    import hashlib
+    digest = hashlib.sha256()
+    buffer = bytearray(HASH_BUFFER)
+    view = memoryview(buffer)
+    done = 0
+    with trace.span('hash', path=path) as span, open(path, 'rb', buffering=0) as f:
+        total = os.fstat(f.fileno()).st_size
+        while True:
+            if cancel is not None and cancel.is_set():
+                raise CopyCancelled()
+            read = f.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+            done += read
+            if progress:
+                progress(done, total)
+        span.set(bytes=done)
+    trace.count('bytes_hashed', done)
+    return digest.hexdigest()
+
+
+class DigestCache:
+    # Dosya yolu -> sha256; (boyut, mtime, inode) imzası değişmediği sürece dosya yeniden okunmaz
+    def __init__(self, path=None):
+        self.path = path or os.path.join(data_dir(), "digests.json")
+        self.entries = load_json(self.path, {})
+        self.dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def signature(st):
+        return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+    def lookup(self, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self.entries.get(os.path.realpath(path))
+        if entry and entry['sig'] == self.signature(st):
+            return entry['sha256']
+        return None
+
+    def digest(self, path, progress=None, cancel=None):
+        sha = self.lookup(path)
+        if sha is None:
+            sha = sha256_file(path, progress, cancel)
+            self.record(path, sha)
+        return sha
+
+    def record(self, path, sha):
+        st = os.stat(path)
+        with self._lock:
+            self.entries[os.path.realpath(path)] = {'sha256': sha, 'sig': self.signature(st)}
+            self.dirty = True
+
+    def forget(self, path):
+        with self._lock:
+            if self.entries.pop(os.path.realpath(path), None) is not None:
+                self.dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self.dirty:
+                return
+            entries = dict(self.entries)
+            self.dirty = False
+        try:
+            write_json_atomic(self.path, entries, indent=None)
+        except OSError:
+            pass
+
+
+class IntegrityStore:
+    # Kurulu AppImage -> kurulumdaki sha256, boyut, mtime ve son doğrulama (imza + sonuç).
+    # DigestCache'ten farklı olarak dosya değişince kayıt güncellenmez: doğrulamanın temeli odur.
+    def __init__(self, path=None):
+        self.path = path or os.path.join(data_dir(), "integrity.json")
+        self.entries = load_json(self.path, {})
+        self.dirty = False
+
+    def get(self, path):
+        return self.entries.get(os.path.realpath(path))
+
+    def record(self, path, sha):
+        st = os.stat(path)
+        self.entries[os.path.realpath(path)] = {
+            'sha256': sha, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+            'checked': DigestCache.signature(st), 'status': 'ok',
+        }
+        self.dirty = True
+
+    def checked(self, path, st, status):
+        entry = self.get(path)
+        entry['checked'] = DigestCache.signature(st)
+        entry['status'] = status
+        self.dirty = True
+
+    def forget(self, path):
+        if self.entries.pop(os.path.realpath(path), None) is not None:
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.dirty = False
+        try:
+            write_json_atomic(self.path, self.entries, indent=None)
+        except OSError:
+            pass
+
+
+def record_integrity(written, deleted=(), digests=None):
+    # Yazılan AppImage'ların özeti (çoğu zaman kurulumda hesaplanmış, önbellekten) temel alınır
+    written = [path for path in written if path.endswith('.AppImage') and os.path.isfile(path)]
+    deleted = [path for path in deleted if path.endswith('.AppImage') and not os.path.lexists(path)]
+    if not written and not deleted:
+        return
+    digests = digests or DigestCache()
+    store = IntegrityStore()
+    for path in written:
+        try:
+            store.record(path, digests.digest(path))
+        except OSError:
+            continue
+    for path in deleted:
+        store.forget(path)
+    store.save()
+
+
+class BlobStore:
+    # İçerik adresli depo: <kurulum klasörü>/.store/<sha256>. Kurulu dosyalar bu bloblara
+    # hardlink'tir; referans sayısı bağlantı sayısıdır (st_nlink), 1'e düşen blob silinir.
+    _link_support = {}
+    _link_support_lock = threading.Lock()
+
+    def __init__(self, install_dir):
+        self.root = os.path.join(install_dir, ".store")
+
+    def blob_path(self, sha):
+        return os.path.join(self.root, sha)
+
+    def supports_links(self):
+        # FAT/exFAT gibi hardlink desteklemeyen dosya sistemlerinde depo kullanılmaz.
+        # Sadece "desteklenmiyor" hataları saklanır; geçici bir hata (ENOSPC vb.) sonraki
+        # çağrıda yeniden denenir.
+        with BlobStore._link_support_lock:
+            if self.root in self._link_support:
+                return self._link_support[self.root]
+            os.makedirs(self.root, exist_ok=True)
+            probe = os.path.join(self.root, f".probe.{os.getpid()}.{threading.get_ident()}")
+            try:
+                open(probe, 'wb').close()
+                os.link(probe, probe + ".link")
+                os.remove(probe + ".link")
+                supported = True
+            except OSError as e:
+                if e.errno not in COPY_FALLBACK_ERRNOS:
+                    return False
+                supported = False
+            finally:
+                for path in (probe, probe + ".link"):
+                    if os.path.lexists(path):
+                        os.remove(path)
+            self._link_support[self.root] = supported
+            return supported
+
+    def contains(self, path):
+        try:
+            st = os.stat(path)
+            blob_st = os.stat(os.path.join(self.root, self.sha_of(path) or ''))
+        except (OSError, TypeError):
+            return False
+        return st.st_ino == blob_st.st_ino and st.st_dev == blob_st.st_dev
+
+    def sha_of(self, path):
+        try:
+            ino = os.stat(path).st_ino
+            with os.scandir(self.root) as entries:
+                for entry in entries:
+                    if not entry.name.startswith('.') and entry.inode() == ino:
+                        return entry.name
+        except OSError:
+            pass
+        return None
+
+    def link(self, blob, dest):
+        tmp_path = os.path.join(os.path.dirname(dest), f".{os.path.basename(dest)}.{os.getpid()}.part")
+        os.link(blob, tmp_path)
+        os.replace(tmp_path, dest)
+
+    def release(self, path):
+        # Kurulu dosyayı sil; başka kullanan kalmadıysa blobu da sil
+        sha = self.sha_of(path)
+        os.remove(path)
+        self.drop_unused(sha)
+
+    def drop_unused(self, sha):
+        if not sha:
+            return
+        blob = self.blob_path(sha)
+        try:
+            if os.stat(blob).st_nlink <= 1:
+                os.remove(blob)
+        except OSError:
+            pass
+
+    def gc(self):
+        freed = 0
+        try:
+            with os.scandir(self.root) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    st = entry.stat()
+                    if st.st_nlink <= 1:
+                        os.remove(entry.path)
+                        freed += st.st_size
+        except OSError:
+            pass
+        return freed
+
+
+_blob_locks = {}
+_blob_locks_guard = threading.Lock()
+
+
+def blob_lock(blob):
+    # Aynı içeriği paralel kuran iş parçacıkları aynı blobu birbirinin üzerine yazmasın
+    with _blob_locks_guard:
+        return _blob_locks.setdefault(blob, threading.Lock())
+
+
+def store_file(src, dest, tracker, cancel=None, digests=None, move=False, link=False):
+    # Kaynağı depoya al (gerekirse) ve hedefi bloba bağla. İçerik zaten depodaysa
+    # veri kopyalanmaz; yeniden adlandırma sadece yeni bir bağlantıdır. link=True
+    # kaynağın kendisini (ör. silinecek eski kurulu dosya) kopyalamadan depoya bağlar.
+    size = file_size(src)
+    mode = 'move' if move else 'link' if link else 'copy'
+    store = BlobStore(os.path.dirname(os.path.abspath(dest)))
+    if not store.supports_links():
+        copy_file(src, dest, tracker.file(dest), cancel, mode)
+        tracker.advance(2 * size)
+        return
+    digests = digests or DigestCache()
+    sha = digests.digest(src, tracker.file(src), cancel)
+    tracker.advance(size)
+    blob = store.blob_path(sha)
+    with blob_lock(blob):
+        if os.path.exists(dest) and os.path.exists(blob) and os.path.samefile(dest, blob):
+            tracker.advance(size)
+            return
+        if not os.path.exists(blob):
+            copy_file(src, blob, tracker.file(dest), cancel, mode)
+        elif move and not os.path.samefile(src, blob):
+            os.remove(src)
+        tracker.advance(size)
+        previous = store.sha_of(dest) if os.path.exists(dest) else None
+        store.link(blob, dest)
+    store.drop_unused(previous)
+    digests.record(dest, sha)
+
+
+def release_file(path, digests=None):
+    if not path or not os.path.lexists(path):
+        return
+    BlobStore(os.path.dirname(os.path.abspath(path))).release(path)
+    if digests is not None:
+        digests.forget(path)
+
+
+def journal_dir():
+    return os.path.join(data_dir(), "journal")
+
+
+def fsync_path(path):
+    # Dosya veya klasör içeriğini diske yazdırır; klasörde yeniden adlandırmaları kalıcı kılar
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class Transaction:
+    # Yazma öncesi günlük (write-ahead journal): ~/.local/share/appimage_installer/journal/<id>.jsonl
+    # Her satır bir işlemdir: begin, write (yedekli/yedeksiz), delete, move, commit.
+    # - write: hedef varsa önce gizli bir yedeğe hardlink'lenir; hedef sonra atomik değiştirilir.
+    # - delete: dosya commit'e kadar yerinde kalır, commit kaydından sonra silinir.
+    # - move: taşınan kaynak, geri almada eski yerine döner.
+    # Günlük, dosya sistemi değişmeden önce fsync edilir (prepare başına bir kez); yazılan dosya
+    # ve klasörler commit'te topluca fsync edilir. Yarım kalan işlemler açılışta
+    # recover_transactions ile geri alınır, commit kaydı olanlar tamamlanır.
+    _counter = 0
+    _counter_lock = threading.Lock()
+
+    def __init__(self, label='', digests=None, root=None):
+        with Transaction._counter_lock:
+            Transaction._counter += 1
+            serial = Transaction._counter
+        self.id = f"{int(time.time() * 1000)}-{os.getpid()}-{serial}"
+        self.label = label
+        self.digests = digests
+        self.root = root or journal_dir()
+        self.path = os.path.join(self.root, f"{self.id}.jsonl")
+        self.ops = []
+        self.fd = None
+        self.state = 'open'
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, kind, value, traceback):
+        if kind is None:
+            try:
+                self.commit()
+            except BaseException:
+                # Commit kaydı yazılamadıysa işlem hiç olmamış sayılır
+                self.rollback()
+                raise
+        else:
+            self.rollback()
+        return False
+
+    def backup_path(self, path):
+        return os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.txn-{self.id}")
+
+    def _append(self, records):
+        # Kayıtlar tek yazma + tek fsync ile günlüğe eklenir
+        if self.fd is None:
+            os.makedirs(self.root, exist_ok=True)
+            self.fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+            # Aynı anda çalışan başka bir süreç bu işlemi yarım kalmış sanmasın
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+            records = [{'op': 'begin', 'pid': os.getpid(), 'label': self.label}] + list(records)
+            created = True
+        else:
+            created = False
+        data = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records).encode()
+        os.write(self.fd, data)
+        os.fsync(self.fd)
+        if created:
+            fsync_path(self.root)
+
+    def prepare(self, writes=(), deletes=(), keep=()):
+        # Yazılacak ve silinecek yolları bildirir; dosya sistemine dokunmadan önce çağrılmalı.
+        # keep: işlem sırasında okunacak kaynaklar; hardlink yoksa bunlar kenara taşınmaz, kopyalanır
+        keep = {os.path.abspath(path) for path in keep if path}
+        records = []
+        with self._lock:
+            for path in writes:
+                if not path:
+                    continue
+                path = os.path.abspath(path)
+                backup = self.backup_path(path) if os.path.lexists(path) else None
+                records.append({'op': 'write', 'path': path, 'backup': backup})
+            for path in deletes:
+                if path:
+                    records.append({'op': 'delete', 'path': os.path.abspath(path)})
+            if not records:
+                return
+            self._append(records)
+            self.ops.extend(records)
+        for record in records:
+            if record.get('backup'):
+                try:
+                    os.link(record['path'], record['backup'])
+                except OSError:
+                    # Klasörler ve hardlink olmayan dosya sistemleri (FAT vb.): eskisi kenara taşınır.
+                    # Kaynak olarak okunacak dosya yerinde kalmalı; yedeği .part üzerinden kopyalanır
+                    if record['path'] in keep and os.path.isfile(record['path']):
+                        copy_file(record['path'], record['backup'])
+                    else:
+                        os.replace(record['path'], record['backup'])
+
+    def move(self, src, dest):
+        # src, dest'e taşınmak üzere; geri almada yerine döner
+        record = {'op': 'move', 'src': os.path.abspath(src), 'dest': os.path.abspath(dest)}
+        with self._lock:
+            self._append([record])
+            self.ops.append(record)
+
+    def written(self):
+        return [record['path'] for record in self.ops if record['op'] == 'write']
+
+    def revert(self, paths):
+        # Toplu işlemde başarısız olan öğenin yazmalarını geri alır; diğerleri commit'e kalır
+        paths = {os.path.abspath(path) for path in paths if path}
+        with self._lock:
+            undo = [record for record in self.ops if (record.get('path') or record.get('dest')) in paths]
+            self.ops = [record for record in self.ops if record not in undo]
+        for record in reversed(undo):
+            undo_record(record)
+
+    def commit(self):
+        if self.state != 'open':
+            return
+        if self.fd is None:
+            self.state = 'committed'
+            return
+        # Veri ve klasörler bir kez, topluca diske yazdırılır
+        with trace.span('transaction.commit', label=self.label) as span:
+            folders = set()
+            written = self.written()
+            for path in written:
+                fsync_path(path)
+                folders.add(os.path.dirname(path))
+                folders.add(os.path.join(os.path.dirname(path), ".store"))
+            for record in self.ops:
+                if record['op'] == 'move':
+                    folders.add(os.path.dirname(record['src']))
+            for folder in folders:
+                fsync_path(folder)
+            self._append([{'op': 'commit'}])
+            span.set(files=len(written), folders=len(folders))
+        self.state = 'committed'
+        self.finish()
+
+    def finish(self):
+        # Commit sonrası temizlik; hata olursa günlük kalır ve açılışta tekrar denenir
+        digests = self.digests or DigestCache()
+        try:
+            finish_records(self.ops, digests)
+        except OSError:
+            self.close()
+            return
+        finally:
+            if self.digests is None:
+                digests.save()
+        self.close()
+        os.remove(self.path)
+
+    def rollback(self):
+        if self.state != 'open':
+            return
+        self.state = 'rolled_back'
+        if self.fd is None:
+            return
+        # Süreç içindeki geçici dosyaları copy_file kendisi temizler
+        for record in reversed(self.ops):
+            undo_record(record)
+        self.close()
+        os.remove(self.path)
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+def remove_path(path, digests=None):
+    # Kurulu dosya depodan bırakılır; klasörler (açılmış AppImage) tamamen silinir
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    else:
+        release_file(path, digests)
+
+
+def undo_record(record):
+    op = record['op']
+    if op == 'write':
+        path, backup = record['path'], record['backup']
+        if backup:
+            # Yedek yoksa eski dosya henüz yerinden oynamamış demektir
+            if os.path.lexists(backup):
+                if os.path.lexists(path) and os.path.samefile(backup, path):
+                    # Hedef hiç değişmemiş; aynı dosyaya iki bağlantıda rename bir şey yapmaz
+                    os.remove(backup)
+                    return
+                store = BlobStore(os.path.dirname(path))
+                sha = None
+                if os.path.isdir(path) and not os.path.islink(path):
+                    remove_path(path)
+                elif os.path.lexists(path):
+                    sha = store.sha_of(path)
+                os.replace(backup, path)
+                store.drop_unused(sha)
+        elif os.path.lexists(path):
+            remove_path(path)
+    elif op == 'move':
+        src, dest = record['src'], record['dest']
+        if not os.path.lexists(src) and os.path.lexists(dest):
+            try:
+                os.replace(dest, src)
+            except OSError as e:
+                # Kaynak başka dosya sistemindeydi (taşıma kopyala + sil olarak yapıldı)
+                if e.errno != errno.EXDEV:
+                    raise
+                copy_file(dest, src)
+                release_file(dest)
+                return
+            # Kaynak depodaki bloba bağlı kaldıysa bağımsız bir dosya olarak bırak
+            store = BlobStore(os.path.dirname(dest))
+            sha = store.sha_of(src)
+            if sha:
+                os.remove(store.blob_path(sha))
+
+
+def finish_records(records, digests=None):
+    for record in records:
+        if record['op'] == 'write' and record['backup'] and os.path.lexists(record['backup']):
+            remove_path(record['backup'])
+        elif record['op'] == 'delete' and os.path.lexists(record['path']):
+            remove_path(record['path'], digests)
+    # Menü ve ikon önbellekleri işlem başına değil, bir dizi işlemin sonunda bir kez yenilenir
+    cache_refresh.mark_paths(record['path'] for record in records if record.get('path'))
+    record_integrity([record['path'] for record in records if record['op'] == 'write'],
+                     [record['path'] for record in records if record['op'] == 'delete'], digests)
+
+
+def drop_partial_files(records, pid):
+    # Çöken süreçten kalan geçici dosyalar (.part/.tmp) onun süreç numarasını taşır
+    marker = f".{pid}."
+    folders = set()
+    for record in records:
+        for key in ('path', 'dest'):
+            if record.get(key):
+                folders.add(os.path.dirname(record[key]))
+                folders.add(os.path.join(os.path.dirname(record[key]), ".store"))
+    for folder in folders:
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if marker in entry.name and entry.name.endswith(('.part', '.tmp')):
+                        remove_path(entry.path)
+        except OSError:
+            continue
+
+
+def read_journal(path):
+    records = []
+    with open(path, 'r') as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # Çökme sırasında yarım yazılmış son satır
+                break
+    return records
+
+
+@traced('startup.recover_transactions')
+def recover_transactions(root=None):
+    # Yarım kalan işlemleri geri alır, commit edilmiş olanların temizliğini tamamlar.
+    # Kilidi başka bir süreçte tutulan (hâlâ çalışan) işlemlere dokunulmaz.
+    root = root or journal_dir()
+    recovered = []
+    try:
+        names = sorted(name for name in os.listdir(root) if name.endswith('.jsonl'))
+    except OSError:
+        return recovered
+    for name in names:
+        path = os.path.join(root, name)
+        try:
+            fd = os.open(path, os.O_RDWR)
+        except OSError:
+            continue
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                continue
+            records = read_journal(path)
+            ops = [record for record in records if record.get('op') in ('write', 'delete', 'move')]
+            pid = next((record.get('pid') for record in records if record.get('op') == 'begin'), None)
+            if any(record.get('op') == 'commit' for record in records):
+                digests = DigestCache()
+                finish_records(ops, digests)
+                digests.save()
+                recovered.append((name, 'completed'))
+            else:
+                for record in reversed(ops):
+                    undo_record(record)
+                if pid:
+                    drop_partial_files(ops, pid)
+                recovered.append((name, 'rolled_back'))
+            os.remove(path)
+        except OSError:
+            continue
+        finally:
+            os.close(fd)
+    return recovered
+
+
+class SquashFSError(Exception):
+    pass
+
+
+class SquashFS:
+    # Salt okunur, küçük bir SquashFS 4.0 okuyucusu. Dosya mmap ile eşlenir ve sadece
+    # gereken süper blok, inode, dizin ve veri blokları açılır; imajın tamamı okunmaz.
+    MAGIC = 0x73717368
+    METADATA_SIZE = 8192
+    NO_FRAGMENT = 0xFFFFFFFF
+    UNCOMPRESSED_BLOCK = 1 << 24
+    DIR, FILE, SYMLINK = 1, 2, 3
+    EXT_DIR, EXT_FILE, EXT_SYMLINK = 8, 9, 10
+
+    def __init__(self, path, offset=0):
+        self.path = path
+        self.offset = offset
+        self._file = open(path, 'rb')
+        try:
+            self.map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise SquashFSError("boş dosya")
+        if len(self.map) < offset + 96:
+            self.close()
+            raise SquashFSError("SquashFS süper bloğu bulunamadı")
+        (magic, self.inode_count, self.mod_time, self.block_size, self.frag_count,
+         self.compressor, _block_log, self.flags, _id_count, major, _minor,
+         self.root_inode, self.bytes_used, _id_table, _xattr_table, self.inode_table,
+         self.directory_table, self.fragment_table, _export_table) = struct.unpack_from('<IIIIIHHHHHHQQQQQQQQ', self.map, offset)
+        if magic != self.MAGIC or major != 4:
+            self.close()
+            raise SquashFSError("SquashFS 4.0 imajı değil")
+        self._metadata_cache = {}
+        self._fragments = None
+        # Küçük dosyalar aynı parçacık bloğunu paylaşır; açılmış son birkaç blok saklanır
+        self._fragment_blocks = {}
+        self._lock = threading.Lock()
+
+    def close(self):
+        if getattr(self, 'map', None) is not None:
+            self.map.close()
+            self.map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def decompress(self, data, expected=None):
+        if self.compressor == 1:
+            return zlib.decompress(data)
+        if self.compressor in (2, 4):
+            import lzma
+            return lzma.decompress(data, format=lzma.FORMAT_ALONE if self.compressor == 2 else lzma.FORMAT_XZ)
+        if self.compressor == 6:
+            try:
+                import zstandard
+            except ImportError:
+                raise SquashFSError("zstd sıkıştırması için 'zstandard' modülü gerekli")
+            return zstandard.ZstdDecompressor().decompress(data, max_output_size=expected or self.block_size)
+        if self.compressor == 5:
+            try:
+                import lz4.block
+            except ImportError:
+                raise SquashFSError("lz4 sıkıştırması için 'lz4' modülü gerekli")
+            return lz4.block.decompress(data, uncompressed_size=expected or self.block_size)
+        raise SquashFSError(f"desteklenmeyen sıkıştırma türü: {self.compressor}")
+
+    def _metadata_block(self, pos):
+        # pos: süper bloğa göre mutlak konum. (açılmış veri, sonraki bloğun konumu)
+        with self._lock:
+            cached = self._metadata_cache.get(pos)
+        if cached is not None:
+            return cached
+        start = self.offset + pos
+        header, = struct.unpack_from('<H', self.map, start)
+        size = header & 0x7FFF
+        data = bytes(self.map[start + 2:start + 2 + size])
+        if not header & 0x8000:
+            data = self.decompress(data, self.METADATA_SIZE)
+        block = (data, pos + 2 + size)
+        with self._lock:
+            self._metadata_cache[pos] = block
+        return block
+
+    def _read_metadata(self, pos, offset, length):
+        # Blok sınırlarını aşabilen okuma; (veri, yeni konum, yeni ofset) döndürür
+        chunks = []
+        while length > 0:
+            data, next_pos = self._metadata_block(pos)
+            chunk = data[offset:offset + length]
+            chunks.append(chunk)
+            length -= len(chunk)
+            offset += len(chunk)
+            if offset >= len(data):
+                pos, offset = next_pos, 0
+            if not chunk and length > 0:
+                raise SquashFSError("metadata okunamadı")
+        return b''.join(chunks), pos, offset
+
+    def inode(self, ref):
+        unpack = struct.unpack
+        pos = self.inode_table + (ref >> 16)
+        offset = ref & 0xFFFF
+        header, pos, offset = self._read_metadata(pos, offset, 16)
+        kind, mode, _uid, _gid, mtime, number = unpack('<HHHHII', header)
+        node = {'type': kind, 'mode': mode, 'mtime': mtime, 'number': number}
+        if kind == self.DIR:
+            raw, pos, offset = self._read_metadata(pos, offset, 16)
+            block, _links, size, block_offset, parent = unpack('<IIHHI', raw)
+            node.update(dir_block=block, dir_offset=block_offset, size=size, parent=parent)
+        elif kind == self.EXT_DIR:
+            raw, pos, offset = self._read_metadata(pos, offset, 24)
+            _links, size, block, parent, _index_count, block_offset, _xattr = unpack('<IIIIHHI', raw)
+            node.update(type=self.DIR, dir_block=block, dir_offset=block_offset, size=size, parent=parent)
+        elif kind in (self.FILE, self.EXT_FILE):
+            if kind == self.FILE:
+                raw, pos, offset = self._read_metadata(pos, offset, 16)
+                blocks_start, fragment, frag_offset, size = unpack('<IIII', raw)
+            else:
+                raw, pos, offset = self._read_metadata(pos, offset, 40)
+                blocks_start, size, _sparse, _links, fragment, frag_offset, _xattr = unpack('<QQQIIII', raw)
+            count = size // self.block_size
+            if fragment == self.NO_FRAGMENT and size % self.block_size:
+                count += 1
+            raw, pos, offset = self._read_metadata(pos, offset, 4 * count)
+            node.update(type=self.FILE, size=size, blocks_start=blocks_start, fragment=fragment,
+                        frag_offset=frag_offset, block_sizes=unpack(f'<{count}I', raw))
+        elif kind in (self.SYMLINK, self.EXT_SYMLINK):
+            raw, pos, offset = self._read_metadata(pos, offset, 8)
+            _links, target_size = unpack('<II', raw)
+            target, pos, offset = self._read_metadata(pos, offset, target_size)
+            node.update(type=self.SYMLINK, target=target.decode('utf-8', 'surrogateescape'))
+        return node
+
+    def root(self):
+        return self.inode(self.root_inode)
+
+    def listdir(self, node):
+        # (isim, inode referansı, tür) listesi
+        entries = []
+        remaining = node['size'] - 3
+        pos, offset = self.directory_table + node['dir_block'], node['dir_offset']
+        unpack = struct.unpack
+        while remaining > 0:
+            raw, pos, offset = self._read_metadata(pos, offset, 12)
+            remaining -= 12
+            count, start, _base = unpack('<III', raw)
+            for _ in range(count + 1):
+                raw, pos, offset = self._read_metadata(pos, offset, 8)
+                entry_offset, _delta, kind, name_size = unpack('<HhHH', raw)
+                name, pos, offset = self._read_metadata(pos, offset, name_size + 1)
+                remaining -= 8 + name_size + 1
+                entries.append((name.decode('utf-8', 'surrogateescape'), (start << 16) | entry_offset, kind))
+        return entries
+
+    def lookup(self, path, follow=True, _depth=0):
+        # İmaj içindeki yolu çözer; sembolik bağlar (göreli veya mutlak) takip edilir
+        if _depth > 16:
+            raise SquashFSError("çok fazla sembolik bağ")
+        node = self.root()
+        parents = []
+        parts = [part for part in path.strip('/').split('/') if part and part != '.']
+        for i, part in enumerate(parts):
+            if part == '..':
+                node = parents.pop() if parents else node
+                continue
+            if node['type'] != self.DIR:
+                return None
+            for name, ref, _kind in self.listdir(node):
+                if name == part:
+                    child = self.inode(ref)
+                    break
+            else:
+                return None
+            last = i == len(parts) - 1
+            if child['type'] == self.SYMLINK and (follow or not last):
+                base = '/'.join(parts[:i])
+                target = child['target']
+                resolved = target if target.startswith('/') else f"{base}/{target}"
+                rest = '/'.join(parts[i + 1:])
+                return self.lookup(f"{resolved}/{rest}" if rest else resolved, follow, _depth + 1)
+            parents.append(node)
+            node = child
+        return node
+
+    def _fragment(self, index):
+        if self._fragments is None:
+            count = self.frag_count
+            table_blocks = (count * 16 + self.METADATA_SIZE - 1) // self.METADATA_SIZE
+            pointers = struct.unpack_from(f'<{table_blocks}Q', self.map, self.offset + self.fragment_table)
+            raw = b''
+            for pointer in pointers:
+                raw += self._metadata_block(pointer)[0]
+            self._fragments = [struct.unpack_from('<QI', raw, 16 * i) for i in range(count)]
+        return self._fragments[index]
+
+    def _data_block(self, start, size_field, expected):
+        size = size_field & (self.UNCOMPRESSED_BLOCK - 1)
+        if size == 0:
+            return bytes(expected)
+        data = self.map[self.offset + start:self.offset + start + size]
+        if size_field & self.UNCOMPRESSED_BLOCK:
+            return bytes(data)
+        return self.decompress(data, expected)
+
+    def file_blocks(self, node):
+        # Dosyanın (ofset, veri) bloklarını sırayla üretir; her blok bağımsız açılabilir
+        for offset, start, size_field, expected in self.block_plan(node):
+            yield offset, self.read_block(start, size_field, expected, node)
+
+    def block_plan(self, node):
+        # Her blok için (dosya içi ofset, imaj içi konum, boyut alanı, beklenen uzunluk).
+        # start None ise blok, parçacık (fragment) bloğundan okunur.
+        plan = []
+        position = node['blocks_start']
+        offset = 0
+        for size_field in node['block_sizes']:
+            expected = min(self.block_size, node['size'] - offset)
+            plan.append((offset, position, size_field, expected))
+            position += size_field & (self.UNCOMPRESSED_BLOCK - 1)
+            offset += expected
+        if node['fragment'] != self.NO_FRAGMENT and offset < node['size']:
+            plan.append((offset, None, None, node['size'] - offset))
+        return plan
+
+    def read_block(self, start, size_field, expected, node):
+        if start is None:
+            frag_start, frag_size = self._fragment(node['fragment'])
+            with self._lock:
+                block = self._fragment_blocks.get(frag_start)
+            if block is None:
+                block = self._data_block(frag_start, frag_size, self.block_size)
+                with self._lock:
+                    if len(self._fragment_blocks) >= 8:
+                        self._fragment_blocks.pop(next(iter(self._fragment_blocks)))
+                    self._fragment_blocks[frag_start] = block
+            return block[node['frag_offset']:node['frag_offset'] + expected]
+        return self._data_block(start, size_field, expected)[:expected]
+
+    def read_file(self, node, limit=None):
+        chunks = []
+        total = 0
+        for _offset, data in self.file_blocks(node):
+            chunks.append(data)
+            total += len(data)
+            if limit is not None and total >= limit:
+                break
+        data = b''.join(chunks)
+        return data if limit is None else data[:limit]
+
+
+def elf_end_offset(path):
+    # Tip 2 AppImage: SquashFS, ELF çalışma zamanının bölüm başlıklarının hemen ardından başlar
+    with open(path, 'rb') as f:
+        header = f.read(64)
+    if len(header) < 52 or header[:4] != b'\x7fELF':
+        raise SquashFSError("ELF dosyası değil")
+    endian = '<' if header[5] == 1 else '>'
+    if header[4] == 2:
+        shoff, = struct.unpack_from(endian + 'Q', header, 0x28)
+        shentsize, shnum = struct.unpack_from(endian + 'HH', header, 0x3A)
+    else:
+        shoff, = struct.unpack_from(endian + 'I', header, 0x20)
+        shentsize, shnum = struct.unpack_from(endian + 'HH', header, 0x2E)
+    return shoff + shentsize * shnum
+
+
+def open_appimage(path):
+    return SquashFS(path, elf_end_offset(path))
+
+
+def parse_desktop_text(text):
+    values = {}
+    in_group = None
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith('['):
+            if in_group:
+                break
+            in_group = line == '[Desktop Entry]'
+            continue
+        if in_group and '=' in line and not line.startswith('#'):
+            key, value = line.split('=', 1)
+            values.setdefault(key.strip(), value.strip())
+    return values
+
+
+ICON_EXTENSIONS = ('.png', '.svg', '.xpm')
+
+
+def extract_appimage_metadata(path, cache_dir=None):
+    # Gömülü .desktop ve ikonu çıkarır (AppImage çalıştırılmaz, imaj açılmaz).
+    # Sonuç dosya yolu + boyut + mtime ile önbelleğe alınır.
+    import hashlib
+    st = os.stat(path)
+    key = hashlib.sha1(f"{os.path.realpath(path)}:{st.st_size}:{st.st_mtime_ns}".encode()).hexdigest()
+    cache_dir = cache_dir or os.path.join(data_dir(), "metadata")
+    entry_dir = os.path.join(cache_dir, key)
+    meta_path = os.path.join(entry_dir, "meta.json")
+    cached = load_json(meta_path, None)
+    if cached is not None and (not cached.get('icon') or os.path.exists(cached['icon'])):
+        return cached
+    meta = {'name': None, 'categories': None, 'comment': None, 'icon': None, 'desktop': None}
+    with open_appimage(path) as image:
+        root_entries = image.listdir(image.root())
+        desktop_names = sorted(name for name, _ref, _kind in root_entries if name.endswith('.desktop'))
+        icon_name = None
+        if desktop_names:
+            node = image.lookup(desktop_names[0])
+            if node is not None and node['type'] == image.FILE:
+                text = image.read_file(node, 256 * 1024).decode('utf-8', 'replace')
+                values = parse_desktop_text(text)
+                meta.update(name=values.get('Name'), categories=values.get('Categories'),
+                            comment=values.get('Comment'), desktop=text)
+                icon_name = values.get('Icon')
+        candidates = []
+        if icon_name:
+            candidates += [f"{icon_name}{ext}" for ext in ICON_EXTENSIONS]
+            candidates += [f"usr/share/icons/hicolor/{size}/apps/{icon_name}.png" for size in ('256x256', '512x512', '128x128')]
+            candidates.append(f"usr/share/icons/hicolor/scalable/apps/{icon_name}.svg")
+        candidates.append('.DirIcon')
+        for candidate in candidates:
+            node = image.lookup(candidate)
+            if node is None or node['type'] != image.FILE:
+                continue
+            data = image.read_file(node)
+            ext = os.path.splitext(candidate)[1] if candidate != '.DirIcon' else sniff_image_ext(data)
+            os.makedirs(entry_dir, exist_ok=True)
+            icon_file = os.path.join(entry_dir, f"icon{ext}")
+            with open(icon_file, 'wb') as f:
+                f.write(data)
+            meta['icon'] = icon_file
+            break
+    try:
+        write_json_atomic(meta_path, meta)
+    except OSError:
+        pass
+    return meta
+
+
+def sniff_image_ext(data):
+    if data.startswith(b'\x89PNG'):
+        return '.png'
+    if b'<svg' in data[:1024]:
+        return '.svg'
+    return '.png'
+
+
+def appimage_metadata(path):
+    # Çıkarma başarısız olursa (tip 1 AppImage, desteklenmeyen sıkıştırma...) boş sözlük
+    try:
+        return extract_appimage_metadata(path)
+    except Exception:
+        return {}
+
+
+EXTRACT_UNIT_BLOCKS = 16
+
+
+def appdir_path(appimage_path):
+    return os.path.splitext(appimage_path)[0] + ".AppDir"
+
+
+def squashfs_entries(fs):
+    # İmajdaki (göreli yol, inode) çiftleri; üst klasörler her zaman alt öğelerinden önce gelir
+    entries = []
+    stack = [('', fs.root())]
+    while stack:
+        rel, node = stack.pop()
+        for name, ref, _kind in fs.listdir(node):
+            if not name or name in ('.', '..') or '/' in name:
+                raise SquashFSError(f"geçersiz dosya adı: {name!r}")
+            child = fs.inode(ref)
+            child_rel = f"{rel}/{name}" if rel else name
+            entries.append((child_rel, child))
+            if child['type'] == fs.DIR:
+                stack.append((child_rel, child))
+    return entries
+
+
+@traced('extract')
+def extract_appimage(path, dest, workers=None, report=None, cancel=None):
+    # AppImage'ı dest klasörüne açar. Dosyalar blok gruplarına bölünür ve iş parçacıklarında
+    # açılıp os.pwrite ile yerine yazılır (zlib/lzma açarken GIL'i bırakır). Sonuç
+    # verify_extraction ile denetlenir. {'files', 'bytes'} döndürür.
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    report = report or (lambda fraction, label: None)
+    with open_appimage(path) as fs:
+        entries = squashfs_entries(fs)
+        os.makedirs(dest, exist_ok=True)
+        files = []
+        for rel, node in entries:
+            target = os.path.join(dest, rel)
+            if node['type'] == fs.DIR:
+                os.makedirs(target, exist_ok=True)
+            elif node['type'] == fs.FILE:
+                fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                try:
+                    os.ftruncate(fd, node['size'])
+                finally:
+                    os.close(fd)
+                files.append((target, node))
+        units = []
+        for target, node in files:
+            plan = fs.block_plan(node)
+            for i in range(0, len(plan), EXTRACT_UNIT_BLOCKS):
+                units.append((target, node, plan[i:i + EXTRACT_UNIT_BLOCKS]))
+        total = sum(node['size'] for _target, node in files) or 1
+
+        def write_unit(target, node, plan):
+            if cancel is not None and cancel.is_set():
+                raise CopyCancelled()
+            written = 0
+            fd = os.open(target, os.O_WRONLY)
+            try:
+                for offset, start, size_field, expected in plan:
+                    if size_field is not None and size_field & (fs.UNCOMPRESSED_BLOCK - 1) == 0:
+                        # Seyrek blok: ftruncate ile zaten sıfır
+                        written += expected
+                        continue
+                    data = fs.read_block(start, size_field, expected, node)
+                    if len(data) != expected:
+                        raise SquashFSError(f"{target}: blok boyutu uyuşmuyor")
+                    view = memoryview(data)
+                    while view:
+                        sent = os.pwrite(fd, view, offset)
+                        view = view[sent:]
+                        offset += sent
+                    written += expected
+            finally:
+                os.close(fd)
+            return written
+        done = 0
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 2) as pool:
+            futures = {pool.submit(write_unit, *unit): unit[0] for unit in units}
+            try:
+                for future in as_completed(futures):
+                    done += future.result()
+                    report(done / total, futures[future])
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+            # Veriler paralel olarak diske yazdırılır; kurulum işlemi sonra commit edilir
+            list(pool.map(fsync_path, [target for target, _node in files]))
+        for rel, node in entries:
+            target = os.path.join(dest, rel)
+            if node['type'] == fs.SYMLINK:
+                os.symlink(node['target'], target)
+            elif node['type'] == fs.FILE:
+                os.chmod(target, node['mode'] & 0o777)
+                os.utime(target, (node['mtime'], node['mtime']))
+        # Klasörler en derinden başlayarak; sahibi her zaman yazabilsin ki silinebilsin
+        for rel, node in reversed(entries):
+            if node['type'] == fs.DIR:
+                target = os.path.join(dest, rel)
+                os.chmod(target, (node['mode'] & 0o777) | 0o700)
+                os.utime(target, (node['mtime'], node['mtime']))
+                fsync_path(target)
+        fsync_path(dest)
+        verify_extraction(fs, dest, entries)
+    return {'files': len(files), 'bytes': total if files else 0}
+
+
+def verify_extraction(fs, dest, entries):
+    # Her öğe doğru türde, dosyalar doğru boyutta, bağlar doğru hedefte olmalı
+    for rel, node in entries:
+        target = os.path.join(dest, rel)
+        try:
+            st = os.lstat(target)
+        except OSError:
+            if node['type'] in (fs.DIR, fs.FILE, fs.SYMLINK):
+                raise SquashFSError(f"açılmamış: {rel}")
+            continue
+        if node['type'] == fs.DIR:
+            ok = stat.S_ISDIR(st.st_mode)
+        elif node['type'] == fs.FILE:
+            ok = stat.S_ISREG(st.st_mode) and st.st_size == node['size']
+        elif node['type'] == fs.SYMLINK:
+            ok = stat.S_ISLNK(st.st_mode) and os.readlink(target) == node['target']
+        else:
+            ok = True
+        if not ok:
+            raise SquashFSError(f"doğrulama başarısız: {rel}")
+    if not os.access(os.path.join(dest, "AppRun"), os.X_OK):
+        raise SquashFSError("AppRun bulunamadı veya çalıştırılabilir değil")
+
+
+def extract_into(appimage_path, appdir, report=None, cancel=None):
+    # Gizli bir klasöre açar, doğrular ve yerine koyar; eski klasör işlemde kenara alınmış olmalı
+    tmp_path = os.path.join(os.path.dirname(appdir), f".{os.path.basename(appdir)}.{os.getpid()}.{threading.get_ident()}.part")
+    try:
+        extract_appimage(appimage_path, tmp_path, report=report, cancel=cancel)
+        os.replace(tmp_path, appdir)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+    fsync_path(os.path.dirname(appdir))
+
+
+@traced('plan')
+def plan_app(appimage_path, icon_path, app_name, install_dir, categories=None, extract=False):
+    # Kurulumun yazacağı yolları belirler (dosyalara dokunmaz). İkon veya kategori
+    # verilmediyse AppImage içindeki .desktop/ikon kullanılır.
+    meta = appimage_metadata(appimage_path) if not icon_path or not categories else {}
+    icon_path = icon_path or meta.get('icon')
+    install_dir = os.path.abspath(install_dir)
+    theme_icons, theme_stale = theme_icon_plan(app_name, theme_icon_sources(icon_path) if icon_path else [])
+    return {
+        'name': app_name,
+        'appimage': appimage_path,
+        'icon': icon_path,
+        'categories': categories or meta.get('categories') or 'Development;',
+        'appimage_dest': os.path.join(install_dir, f"{app_name}.AppImage"),
+        'icon_dest': os.path.join(install_dir, f"{app_name}{os.path.splitext(icon_path)[1]}") if icon_path else None,
+        'desktop': os.path.join(desktop_dir(), f"{app_name}.desktop"),
+        'appdir': appdir_path(os.path.join(install_dir, f"{app_name}.AppImage")) if extract else None,
+        # Temaya kurulacak ikonlar ve aynı adla kalmış eski boyutlar (commit'ten sonra silinir)
+        'theme_icons': theme_icons,
+        'theme_stale': theme_stale,
+    }
+
+
+def plan_paths(plan):
+    # Yerinde kalan açılmış klasör (appdir_source == appdir) yazılmaz
+    appdir = plan.get('appdir') if plan.get('appdir_source') != plan.get('appdir') else None
+    return [plan['appimage_dest'], plan['icon_dest'], plan['desktop'], appdir] + \
+        [dest for _src, dest in plan.get('theme_icons', ())]
+
+
+def plan_sources(plan):
+    return [plan['appimage'], plan['icon']] + [src for src, _dest in plan.get('theme_icons', ())]
+
+
+def journal_moves(txn, plans):
+    # Taşınan kaynaklar geri almada kullanıcının klasörüne döner
+    for plan in plans:
+        txn.move(plan['appimage'], plan['appimage_dest'])
+        if plan['icon']:
+            txn.move(plan['icon'], plan['icon_dest'])
+
+
+def journal_appdir_moves(txn, plans):
+    # Yeniden açılmadan yeni yerine taşınan açılmış klasörler
+    for plan in plans:
+        if plan.get('appdir_source') and plan['appdir_source'] != plan['appdir']:
+            txn.move(plan['appdir_source'], plan['appdir'])
+
+
+@traced('stage')
+def stage_app(plan, tracker, cancel=None, digests=None, move=False, report=None):
+    # Dosyaları yerleştirir (gerekirse AppImage'ı açar), .desktop içeriğini döndürür (yazmaz)
+    os.makedirs(os.path.dirname(plan['appimage_dest']), exist_ok=True)
+    store_file(plan['appimage'], plan['appimage_dest'], tracker, cancel, digests, move)
+    os.chmod(plan['appimage_dest'], 0o755)
+    # Tema ikonları kopyalanır (taşıma kipinde kaynak ikon aşağıda taşınmadan önce)
+    theme_icons = plan.get('theme_icons', ())
+    for src, dest in theme_icons:
+        install_theme_icon(src, dest, cancel)
+    if plan['icon']:
+        store_file(plan['icon'], plan['icon_dest'], tracker, cancel, digests, move)
+    if plan.get('appdir_source'):
+        # Açılmış klasör yeniden açılmaz (taşıma journal_appdir_moves ile günlükte)
+        if plan['appdir_source'] != plan['appdir']:
+            os.replace(plan['appdir_source'], plan['appdir'])
+    elif plan.get('appdir'):
+        extract_into(plan['appimage_dest'], plan['appdir'], report, cancel)
+    return desktop_entry_for(plan['name'], plan['appimage_dest'], plan['icon_dest'], plan['categories'], plan.get('appdir'),
+                             theme_icon_name(plan['name']) if plan.get('theme_name', bool(theme_icons)) else None)
+
+
+def install_theme_icon(src, dest, cancel=None):
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    copy_file(src, dest, cancel=cancel)
+
+
+def desktop_entry_for(name, appimage_dest, icon_dest, categories, appdir=None, icon_name=None):
+    # appdir verilirse (açılmış AppImage) Exec AppRun'ı gösterir
+    if not appdir:
+        return build_desktop_entry(name, appimage_dest, icon_dest, categories, icon_name=icon_name)
+    return build_desktop_entry(name, os.path.join(appdir, "AppRun"), icon_dest, categories, appimage=appimage_dest, icon_name=icon_name)
+
+
+@traced('install')
+def install_app(appimage_path, icon_path, app_name=None, install_dir=None, report=None, cancel=None, move=False, categories=None, extract=False):
+    # extract=True: hızlı başlatma kipi, AppImage kurulum klasöründe açılır
+    if not app_name:
+        app_name = app_name_from_path(appimage_path)
+    if not install_dir:
+        install_dir = default_install_dir()
+    remember_install_dir(install_dir)
+    report = report or (lambda fraction, label: None)
+    plan = plan_app(appimage_path, icon_path, app_name, install_dir, categories, extract)
+    # Her dosya iki aşamada ilerler: özet ve (gerekirse) depoya kopyalama; açma ayrı bir aşamadır
+    copy_share = 0.5 if extract else 1.0
+    tracker = ProgressTracker(lambda fraction, label: report(copy_share * fraction, label),
+                              2 * (file_size(appimage_path) + file_size(plan['icon'])))
+    digests = DigestCache()
+    try:
+        with Transaction('install', digests) as txn:
+            txn.prepare(plan_paths(plan), plan['theme_stale'], plan_sources(plan))
+            if move:
+                journal_moves(txn, [plan])
+            content = stage_app(plan, tracker, cancel, digests, move,
+                                lambda fraction, label: report(copy_share + (1 - copy_share) * fraction, label))
+            write_desktop_file(plan['desktop'], content)
+    finally:
+        digests.save()
+    return plan['desktop']
+
+
+def app_name_from_path(appimage_path):
+    return os.path.splitext(os.path.basename(appimage_path))[0]
+
+
+def find_appimages(paths):
+    # Klasörler içindeki *.AppImage dosyalarına açılır, sıra korunur
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            with os.scandir(path) as entries:
+                found.extend(sorted(entry.path for entry in entries
+                                    if entry.name.lower().endswith('.appimage') and entry.is_file()))
+        else:
+            found.append(path)
+    return found
+
+
+def sibling_icon(appimage_path):
+    stem = os.path.splitext(appimage_path)[0]
+    for ext in ('.png', '.svg'):
+        if os.path.exists(stem + ext):
+            return stem + ext
+    return None
+
+
+def is_rotational(path):
+    # /sys/dev/block/<major>:<minor> bölüm ise kuyruk bilgisi üst aygıttadır
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    base = f"/sys/dev/block/{os.major(st.st_dev)}:{os.minor(st.st_dev)}"
+    for candidate in (os.path.join(base, "queue", "rotational"), os.path.join(base, "..", "queue", "rotational")):
+        try:
+            with open(candidate) as f:
+                return f.read().strip() == '1'
+        except OSError:
+            continue
+    return None
+
+
+def batch_workers(paths, install_dir):
+    # Dönen diskte paralel okuma/yazma arama süresini artırır; SSD'de çekirdek sayısı kadar
+    folders = {os.path.dirname(os.path.abspath(path)) for path in paths} | {install_dir}
+    kinds = {is_rotational(folder) for folder in folders}
+    if True in kinds:
+        return 2
+    if kinds == {False}:
+        return max(2, min(8, os.cpu_count() or 2))
+    return 4
+
+
+@traced('batch_install')
+def batch_install(paths, install_dir=None, report=None, cancel=None, workers=None, move=False, extract=False):
+    # Sonuçlar giriş sırasıyla döner: {'path', 'name', 'desktop', 'error'}
+    from concurrent.futures import ThreadPoolExecutor
+    # Bir öğenin hatası (okunamayan klasör, eksik dosya, işlem hatası) diğerlerini durdurmaz;
+    # hata öğenin 'error' alanına yazılır
+    install_dir = install_dir or default_install_dir()
+    remember_install_dir(install_dir)
+    appimages = []
+    items = []
+    names = set()
+    for source in paths:
+        try:
+            found = find_appimages([source])
+        except (OSError, ValueError) as e:
+            items.append({'path': source, 'name': app_name_from_path(source), 'icon': None, 'desktop': None, 'error': str(e)})
+            continue
+        for path in found:
+            name = app_name_from_path(path)
+            item = {'path': path, 'name': name, 'icon': sibling_icon(path), 'desktop': None, 'error': None}
+            if name in names:
+                item['error'] = 'duplicate name'
+            names.add(name)
+            items.append(item)
+            appimages.append(path)
+    plans = {}
+
+    def plan(item):
+        if item['error']:
+            return
+        try:
+            os.stat(item['path'])
+            plans[item['name']] = plan_app(item['path'], item['icon'], item['name'], install_dir, extract=extract)
+        except Exception as e:
+            item['error'] = str(e)
+    workers = workers or batch_workers(appimages, install_dir)
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        list(pool.map(plan, items))
+        try:
+            install_plans(items, plans, pool, report, cancel, move)
+        except (OSError, ValueError) as e:
+            # İşlem geri alındı: planı olan öğelerin hiçbiri kurulmadı
+            for item in items:
+                if item['name'] in plans and not item['error']:
+                    item['desktop'] = None
+                    item['error'] = str(e)
+    finally:
+        pool.shutdown()
+    return items
+
+
+def install_plans(items, plans, pool, report=None, cancel=None, move=False, label='batch', deletes=None):
+    # plans: {ad: plan_app sonucu}. Planı olan öğeler havuzda paralel yerleştirilir; hepsi
+    # tek işlemde: günlük bir kez, veriler commit'te bir kez diske yazdırılır. Başarısız
+    # öğenin yazmaları (ve deletes: {ad: [yol]} ile verilen silmeleri) geri alınır, hata
+    # öğenin 'error' alanına yazılır.
+    # Temada aynı adla kalmış eski ikon boyutları da öğeyle birlikte silinir
+    deletes = deletes or {}
+    deletes = {name: list(deletes.get(name, ())) + plan['theme_stale'] for name, plan in plans.items()}
+    total = sum(2 * (file_size(p['appimage']) + file_size(p['icon'])) for p in plans.values())
+    tracker = ProgressTracker(report or (lambda fraction, label: None), total)
+    digests = DigestCache()
+    staged = {}
+    txn = Transaction(label, digests)
+
+    def run(item):
+        if item['name'] not in plans or item['error']:
+            return
+        if cancel is not None and cancel.is_set():
+            item['error'] = 'cancelled'
+        else:
+            try:
+                staged[item['name']] = stage_app(plans[item['name']], tracker, cancel, digests, move)
+                return
+            except CopyCancelled:
+                item['error'] = 'cancelled'
+            except Exception as e:
+                item['error'] = str(e)
+        txn.revert(plan_paths(plans[item['name']]) + deletes.get(item['name'], []))
+    try:
+        txn.prepare([path for p in plans.values() for path in plan_paths(p)],
+                    [path for name in plans for path in deletes.get(name, ())],
+                    [path for p in plans.values() for path in plan_sources(p)])
+        if move:
+            journal_moves(txn, plans.values())
+        journal_appdir_moves(txn, plans.values())
+        list(pool.map(run, items))
+        # .desktop dosyaları en sonda topluca yazılır
+        for item in items:
+            if item['name'] in staged:
+                desktop_file = plans[item['name']]['desktop']
+                try:
+                    write_desktop_file(desktop_file, staged[item['name']])
+                    item['desktop'] = desktop_file
+                except OSError as e:
+                    item['error'] = str(e)
+                    txn.revert(plan_paths(plans[item['name']]) + deletes.get(item['name'], []))
+        txn.commit()
+    except BaseException:
+        txn.rollback()
+        raise
+    finally:
+        digests.save()
+    return items
+
+
+@traced('edit')
+def edit_app(desktop_file, new_name, new_appimage, new_icon, new_folder, report=None, cancel=None, extract=None, categories=None):
+    # extract: hızlı başlatma kipini aç/kapat; None ise mevcut kip korunur (categories de öyle)
+    old = read_desktop_entry(desktop_file)
+    old_appimage, old_icon, old_appdir = old.get('appimage'), old.get('icon'), old.get('appdir')
+    if extract is None:
+        extract = old.get('mode') == 'extracted'
+    report = report or (lambda fraction, label: None)
+    copy_share = 0.5 if extract else 1.0
+    tracker = ProgressTracker(lambda fraction, label: report(copy_share * fraction, label),
+                              2 * (file_size(new_appimage) + file_size(new_icon)))
+    digests = DigestCache()
+    new_folder = os.path.abspath(new_folder)
+    os.makedirs(new_folder, exist_ok=True)
+    remember_install_dir(new_folder)
+    appimage_dest = os.path.join(new_folder, f"{new_name}.AppImage")
+    icon_dest = os.path.join(new_folder, f"{new_name}{os.path.splitext(new_icon)[1]}") if new_icon else None
+    new_desktop = os.path.join(desktop_dir(), f"{new_name}.desktop")
+    appdir = appdir_path(appimage_dest) if extract else None
+    # AppImage değişmediyse açılmış klasör yeniden açılmaz, gerekirse sadece taşınır. Başka
+    # bir dosya sistemine rename yapılamaz (EXDEV); orada yeni yerinde yeniden açılır.
+    keep_appdir = bool(appdir and old_appdir and os.path.isdir(old_appdir)
+                       and old_appimage and os.path.abspath(new_appimage) == os.path.abspath(old_appimage)
+                       and same_filesystem(old_appdir, new_folder))
+    # Eski .desktop ve artık kullanılmayan dosyalar commit'ten sonra silinir
+    deletes = [path for path, dest in ((desktop_file, new_desktop), (old_appimage, appimage_dest), (old_icon, icon_dest), (old_appdir, appdir))
+               if path and os.path.lexists(path) and (dest is None or os.path.abspath(path) != os.path.abspath(dest))]
+    # İkon değişmediyse temadaki mevcut boyutlar korunur (yeniden adlandırmada yeni ada kopyalanır)
+    old_theme = theme_icon_files(old['theme_icon']) if old.get('theme_icon') else []
+    if old_theme and new_icon and old_icon and os.path.abspath(new_icon) == os.path.abspath(old_icon):
+        sources = old_theme
+    else:
+        sources = theme_icon_sources(new_icon) if new_icon else []
+    theme_writes, theme_stale = theme_icon_plan(new_name, sources)
+    targets = {dest for _src, dest in theme_writes}
+    theme_icons = [(src, dest) for src, dest in theme_writes if src != dest]
+    deletes += theme_stale + [path for _size, path in old_theme if path not in targets and path not in theme_stale]
+
+    def place(txn, src, dest, old_path):
+        # Kaynak, silinecek eski kurulu dosyanın kendisiyse kopyalanmaz: depoya hardlink'lenir,
+        # hardlink yoksa aynı dosya sisteminde taşınır (geri almada yerine döner)
+        reuse_old = bool(old_path) and os.path.abspath(src) == os.path.abspath(old_path) and os.path.abspath(dest) != os.path.abspath(old_path)
+        if reuse_old and not BlobStore(new_folder).supports_links() and same_filesystem(src, new_folder):
+            txn.move(src, dest)
+            store_file(src, dest, tracker, cancel, digests, move=True)
+        else:
+            store_file(src, dest, tracker, cancel, digests, link=reuse_old)
+    try:
+        with Transaction('edit', digests) as txn:
+            same_appdir = keep_appdir and os.path.abspath(old_appdir) == os.path.abspath(appdir)
+            txn.prepare([appimage_dest, icon_dest, new_desktop, None if same_appdir else appdir] +
+                        [dest for _src, dest in theme_icons], deletes,
+                        [new_appimage, new_icon] + [src for src, _dest in theme_icons])
+            for src, dest in theme_icons:
+                install_theme_icon(src, dest, cancel)
+            place(txn, new_appimage, appimage_dest, old_appimage)
+            os.chmod(appimage_dest, 0o755)
+            if new_icon:
+                place(txn, new_icon, icon_dest, old_icon)
+            if keep_appdir and not same_appdir:
+                txn.move(old_appdir, appdir)
+                os.replace(old_appdir, appdir)
+            elif appdir and not keep_appdir:
+                extract_into(appimage_dest, appdir, lambda fraction, label: report(copy_share + (1 - copy_share) * fraction, label), cancel)
+            write_desktop_file(new_desktop, desktop_entry_for(new_name, appimage_dest, icon_dest,
+                                                              categories or old.get('categories') or 'Development;', appdir,
+                                                              theme_icon_name(new_name) if sources else None))
+    finally:
+        digests.save()
+    return new_desktop
+
+
+@traced('set_launch_mode')
+def set_launch_mode(desktop_file, extract, report=None, cancel=None):
+    # Kurulu uygulamayı hızlı başlatma kipine al veya AppImage'ı doğrudan çalıştırmaya döndür
+    entry = read_desktop_entry(desktop_file)
+    appimage = entry.get('appimage')
+    if not appimage or not os.path.isfile(appimage):
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), appimage or desktop_file)
+    return edit_app(desktop_file, entry.get('name'), appimage, entry.get('icon'), os.path.dirname(appimage), report, cancel, extract)
+
+
+@traced('remove')
+def remove_app(desktop_file):
+    # .desktop dosyasını oku, ilgili AppImage ve ikon dosyasını depodan bırak
+    if not os.path.exists(desktop_file):
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), desktop_file)
+    entry = read_desktop_entry(desktop_file)
+    digests = DigestCache()
+    files = [entry.get('appimage'), entry.get('icon'), entry.get('appdir')]
+    if entry.get('theme_icon'):
+        files += [path for _size, path in theme_icon_files(entry['theme_icon'])]
+    try:
+        with Transaction('remove', digests) as txn:
+            txn.prepare(deletes=[desktop_file] + [path for path in files if path and os.path.exists(path)])
+    finally:
+        digests.save()
+
+
+def install_dirs_path():
+    return os.path.join(data_dir(), "install_dirs.json")
+
+
+_install_dirs_lock = threading.Lock()
+
+
+def remember_install_dir(folder):
+    # Kurulum için kullanılan her klasör kaydedilir; bakım taraması bunların hepsine bakar
+    folder = os.path.abspath(folder)
+    with _install_dirs_lock:
+        folders = load_json(install_dirs_path(), [])
+        if folder in folders:
+            return
+        folders.append(folder)
+        try:
+            write_json_atomic(install_dirs_path(), sorted(folders))
+        except OSError:
+            pass
+
+
+def known_install_dirs(catalog=None):
+    folders = set(load_json(install_dirs_path(), [])) | {default_install_dir()}
+    for record in (catalog.entries.values() if catalog else ()):
+        if record.get('managed') and record.get('appimage'):
+            folders.add(os.path.dirname(record['appimage']))
+    return sorted(folder for folder in folders if os.path.isdir(folder))
+
+
+# Bakım taramasının kategorileri (rapor ve silme sırası)
+ORPHAN_CATEGORIES = ('broken_entries', 'orphan_appimages', 'orphan_appdirs', 'orphan_icons', 'unused_blobs', 'partial_files')
+
+
+def walk_sizes(roots, workers=None):
+    # Klasör ağaçlarını iş parçacıklarında os.scandir ile gezer: her klasör ayrı bir iş,
+    # alt klasörler bulundukça kuyruğa eklenir. {kök: (dosya sayısı, bayt)} döndürür.
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+    totals = {root: [0, 0] for root in roots}
+    if not roots:
+        return {}
+
+    def scan(root, folder):
+        files = size = 0
+        subdirs = []
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        else:
+                            files += 1
+                            size += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return root, files, size, subdirs
+    with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 2) * 4)) as pool:
+        pending = {pool.submit(scan, root, root) for root in roots}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                root, files, size, subdirs = future.result()
+                totals[root][0] += files
+                totals[root][1] += size
+                pending.update(pool.submit(scan, root, folder) for folder in subdirs)
+    return {root: tuple(value) for root, value in totals.items()}
+
+
+def reclaimable(st, blob_inodes):
+    # Depodaki bloba bağlı bir dosya silindiğinde yer, sadece blobu başka kullanan yoksa açılır
+    linked = (st.st_dev, st.st_ino) in blob_inodes
+    return st.st_size if st.st_nlink <= (2 if linked else 1) else 0
+
+
+def is_leftover(name):
+    # Yarım kalmış kopyalar (.part), geçici yazmalar (.tmp) ve işlem yedekleri (.txn-)
+    if name.startswith('.'):
+        return name.endswith(('.part', '.tmp')) or '.txn-' in name
+    return name.endswith('.tmp') and '.desktop.' in name
+
+
+@traced('maintenance.scan')
+def scan_orphans(catalog=None, folders=None, workers=None, report=None):
+    # Kurulum klasörlerini ve uygulama dizinini tarar; kategorilere göre
+    # {'categories': {kategori: {'items': [...], 'bytes': n}}, 'bytes': n, 'files': n} döndürür.
+    # Her öğe: {'path', 'bytes', 'related': [birlikte silinecek yollar]}. Sadece bu aracın
+    # kurduğu dosyalar sahipsiz sayılabilir: depoya bağlı olanlar ya da bütünlük kaydında veya
+    # işlem günlüğünde adı geçenler. Kullanıcının elle koyduğu dosyalara dokunulmaz.
+    report = report or (lambda fraction, label: None)
+    catalog = catalog or AppCatalog().load()
+    catalog.refresh()
+    folders = [os.path.abspath(folder) for folder in (folders or known_install_dirs(catalog))]
+    recorded = recorded_paths()
+    categories = {name: [] for name in ORPHAN_CATEGORIES}
+    # Canlı bir işlem varken yarım dosyalar ve henüz bağlanmamış bloblar dokunulmaz
+    busy = bool(os.path.isdir(journal_dir()) and os.listdir(journal_dir()))
+    # .desktop girdilerinin başvurduğu yollar tek bir kümede (karma dizin) eşlenir
+    referenced = set()
+    broken_related = set()
+    for path, record in catalog.entries.items():
+        target = (record.get('appimage') or '').split(' %', 1)[0]
+        values = [os.path.normpath(value) for value in (target, record.get('icon'), record.get('appdir'))
+                  if value and os.path.isabs(value)]
+        if record.get('managed') and target and os.path.isabs(target) and not os.path.exists(target):
+            related = [value for value in values[1:] if os.path.lexists(value)]
+            broken_related.update(related)
+            categories['broken_entries'].append({'path': path, 'bytes': 0, 'related': related, 'name': record.get('name')})
+        else:
+            referenced.update(values)
+    if not busy:
+        try:
+            with os.scandir(catalog.apps_dir) as entries:
+                for entry in entries:
+                    if is_leftover(entry.name):
+                        categories['partial_files'].append({'path': entry.path, 'bytes': entry.stat(follow_symlinks=False).st_size, 'related': []})
+        except OSError:
+            pass
+    report(0.1, catalog.apps_dir)
+    blob_inodes = set()
+    sized = []
+    files = 0
+    for index, folder in enumerate(folders):
+        store_entries = []
+        try:
+            with os.scandir(os.path.join(folder, ".store")) as entries:
+                for entry in entries:
+                    st = entry.stat(follow_symlinks=False)
+                    blob_inodes.add((st.st_dev, st.st_ino))
+                    store_entries.append((entry, st))
+        except OSError:
+            pass
+        files += len(store_entries)
+        if not busy:
+            for entry, st in store_entries:
+                if entry.name.startswith('.'):
+                    categories['partial_files'].append({'path': entry.path, 'bytes': st.st_size, 'related': []})
+                elif st.st_nlink <= 1:
+                    categories['unused_blobs'].append({'path': entry.path, 'bytes': st.st_size, 'related': []})
+        try:
+            with os.scandir(folder) as entries:
+                listing = list(entries)
+        except OSError:
+            continue
+        files += len(listing)
+        by_name = {entry.name: entry for entry in listing}
+
+        def icon_of_ours(name):
+            # Hardlink olmayan dosya sistemlerinde ikon depoda değildir: yanındaki AppImage kayıtlıysa bizimdir
+            return os.path.normpath(os.path.join(folder, os.path.splitext(name)[0] + ".AppImage")) in recorded
+
+        def ours(entry, st):
+            return (st.st_dev, st.st_ino) in blob_inodes or os.path.normpath(entry.path) in recorded
+        for entry in listing:
+            name, lower = entry.name, entry.name.lower()
+            path = os.path.normpath(entry.path)
+            if name == ".store" or path in referenced or path in broken_related:
+                continue
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_leftover(name):
+                if not busy:
+                    categories['partial_files'].append({'path': path, 'bytes': None if is_dir else st.st_size, 'related': []})
+                    if is_dir:
+                        sized.append(path)
+            elif is_dir and lower.endswith('.appdir'):
+                # Açılmış klasör: yanındaki AppImage bu araçla kurulduysa bizimdir
+                sibling = by_name.get(name[:-len('.AppDir')] + ".AppImage")
+                sibling_st = sibling.stat(follow_symlinks=False) if sibling is not None else None
+                if path in recorded or (sibling_st is not None and ours(sibling, sibling_st)):
+                    categories['orphan_appdirs'].append({'path': path, 'bytes': None, 'related': []})
+                    sized.append(path)
+            elif not is_dir and lower.endswith('.appimage') and ours(entry, st):
+                categories['orphan_appimages'].append({'path': path, 'bytes': reclaimable(st, blob_inodes), 'related': []})
+            elif not is_dir and lower.endswith(ICON_EXTENSIONS) and (ours(entry, st) or icon_of_ours(name)):
+                categories['orphan_icons'].append({'path': path, 'bytes': reclaimable(st, blob_inodes), 'related': []})
+        report(0.1 + 0.4 * (index + 1) / max(len(folders), 1), folder)
+    # Klasörlerin boyutu paralel gezinmeyle; bozuk girdilerin açılmış klasörleri de dahil
+    sized.extend(value for value in broken_related if os.path.isdir(value) and not os.path.islink(value))
+    sizes = walk_sizes(sized, workers)
+    files += sum(count for count, _size in sizes.values())
+    for category in ('orphan_appdirs', 'partial_files'):
+        for item in categories[category]:
+            if item['bytes'] is None:
+                item['bytes'] = sizes.get(item['path'], (0, 0))[1]
+    for item in categories['broken_entries']:
+        total = file_size(item['path'])
+        for value in item['related']:
+            if value in sizes:
+                total += sizes[value][1]
+            else:
+                try:
+                    total += reclaimable(os.stat(value), blob_inodes)
+                except OSError:
+                    pass
+        item['bytes'] = total
+    report(1.0, None)
+    result = {'categories': {}, 'bytes': 0, 'files': files, 'folders': folders}
+    for name in ORPHAN_CATEGORIES:
+        items = sorted(categories[name], key=lambda item: item['path'])
+        size = sum(item['bytes'] for item in items)
+        result['categories'][name] = {'items': items, 'bytes': size}
+        result['bytes'] += size
+    return result
+
+
+def recorded_paths():
+    # Bu aracın yazdığı bilinen yollar: bütünlük kaydındaki AppImage'lar ve günlükte kalan işlemler
+    paths = {os.path.normpath(path) for path in IntegrityStore().entries}
+    try:
+        names = [name for name in os.listdir(journal_dir()) if name.endswith('.jsonl')]
+    except OSError:
+        names = []
+    for name in names:
+        try:
+            records = read_journal(os.path.join(journal_dir(), name))
+        except OSError:
+            continue
+        for record in records:
+            paths.update(os.path.normpath(record[key]) for key in ('path', 'src', 'dest') if record.get(key))
+    return paths
+
+
+@traced('maintenance.remove')
+def remove_orphans(items, report=None):
+    # Seçilen öğeleri (ve ilişkili dosyalarını) tek bir işlemde siler; açılan baytı döndürür
+    paths = []
+    for item in items:
+        for path in [item['path']] + list(item.get('related', ())):
+            if path not in paths and os.path.lexists(path):
+                paths.append(path)
+    digests = DigestCache()
+    try:
+        with Transaction('cleanup', digests) as txn:
+            txn.prepare(deletes=paths)
+    finally:
+        digests.save()
+    if report:
+        report(1.0, None)
+    return sum(item['bytes'] for item in items)
+
+
+def read_elf_section(path, section):
+    # ELF bölüm başlıklarından adı verilen bölümün içeriğini okur (yoksa None)
+    with open(path, 'rb') as f:
+        header = f.read(64)
+        if len(header) < 52 or header[:4] != b'\x7fELF':
+            return None
+        endian = '<' if header[5] == 1 else '>'
+        is64 = header[4] == 2
+        if is64:
+            shoff, = struct.unpack_from(endian + 'Q', header, 0x28)
+            shentsize, shnum, shstrndx = struct.unpack_from(endian + 'HHH', header, 0x3A)
+            layout = endian + 'IIQQQQ'
+        else:
+            shoff, = struct.unpack_from(endian + 'I', header, 0x20)
+            shentsize, shnum, shstrndx = struct.unpack_from(endian + 'HHH', header, 0x2E)
+            layout = endian + 'IIIIII'
+        f.seek(shoff)
+        table = f.read(shentsize * shnum)
+        sections = []
+        for i in range(shnum):
+            name, _kind, _flags, _addr, offset, size = struct.unpack_from(layout, table, i * shentsize)
+            sections.append((name, offset, size))
+        if shstrndx >= len(sections):
+            return None
+        _name, names_offset, names_size = sections[shstrndx]
+        f.seek(names_offset)
+        names = f.read(names_size)
+        for name, offset, size in sections:
+            end = names.find(b'\0', name)
+            if names[name:end].decode('ascii', 'replace') == section:
+                f.seek(offset)
+                return f.read(size)
+    return None
+
+
+def appimage_update_info(path):
+    data = read_elf_section(path, '.upd_info')
+    if not data:
+        return None
+    info = data.split(b'\0', 1)[0].decode('utf-8', 'replace').strip()
+    return info or None
+
+
+def zsync_url_from_update_info(info, session=None):
+    # Desteklenen biçimler: "zsync|URL" ve "gh-releases-zsync|kullanıcı|depo|etiket|dosya"
+    import urllib.parse
+    parts = info.split('|')
+    if parts[0] == 'zsync' and len(parts) >= 2:
+        return parts[1]
+    if parts[0] == 'gh-releases-zsync' and len(parts) >= 5:
+        owner, repo, tag, pattern = parts[1:5]
+        if '*' not in pattern and '?' not in pattern:
+            if tag == 'latest':
+                return f"https://github.com/{owner}/{repo}/releases/latest/download/{pattern}"
+            return f"https://github.com/{owner}/{repo}/releases/download/{urllib.parse.quote(tag)}/{pattern}"
+        # Joker karakterli dosya adı: sürüm varlıkları GitHub API'sinden eşlenir
+        api = f"https://api.github.com/repos/{owner}/{repo}/releases/" + ('latest' if tag == 'latest' else f"tags/{urllib.parse.quote(tag)}")
+        session = session or HttpSession()
+        response, _url = session.get(api, {'Accept': 'application/vnd.github+json'})
+        body = response.read()
+        if response.status != 200:
+            raise UpdateError(f"GitHub API: HTTP {response.status}")
+        for asset in json.loads(body).get('assets', []):
+            if fnmatch.fnmatch(asset.get('name', ''), pattern):
+                return asset['browser_download_url']
+        raise UpdateError(f"sürümde {pattern} bulunamadı")
+    raise UpdateError(f"desteklenmeyen güncelleme bilgisi: {info}")
+
+
+class UpdateError(Exception):
+    pass
+
+
+def _md4_pure(data):
+    mask = 0xFFFFFFFF
+
+    def rotl(x, n):
+        x &= mask
+        return ((x << n) | (x >> (32 - n))) & mask
+    length = len(data)
+    data = bytes(data) + b'\x80' + bytes((55 - length) % 64) + struct.pack('<Q', length * 8)
+    a, b, c, d = 0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476
+    for chunk in range(0, len(data), 64):
+        x = struct.unpack('<16I', data[chunk:chunk + 64])
+        aa, bb, cc, dd = a, b, c, d
+        for i in (0, 4, 8, 12):
+            a = rotl(a + ((b & c) | (~b & d)) + x[i], 3)
+            d = rotl(d + ((a & b) | (~a & c)) + x[i + 1], 7)
+            c = rotl(c + ((d & a) | (~d & b)) + x[i + 2], 11)
+            b = rotl(b + ((c & d) | (~c & a)) + x[i + 3], 19)
+        for i in (0, 1, 2, 3):
+            a = rotl(a + ((b & c) | (b & d) | (c & d)) + x[i] + 0x5A827999, 3)
+            d = rotl(d + ((a & b) | (a & c) | (b & c)) + x[i + 4] + 0x5A827999, 5)
+            c = rotl(c + ((d & a) | (d & b) | (a & b)) + x[i + 8] + 0x5A827999, 9)
+            b = rotl(b + ((c & d) | (c & a) | (d & a)) + x[i + 12] + 0x5A827999, 13)
+        for i in (0, 2, 1, 3):
+            a = rotl(a + (b ^ c ^ d) + x[i] + 0x6ED9EBA1, 3)
+            d = rotl(d + (a ^ b ^ c) + x[i + 8] + 0x6ED9EBA1, 9)
+            c = rotl(c + (d ^ a ^ b) + x[i + 4] + 0x6ED9EBA1, 11)
+            b = rotl(b + (c ^ d ^ a) + x[i + 12] + 0x6ED9EBA1, 15)
+        a, b, c, d = (a + aa) & mask, (b + bb) & mask, (c + cc) & mask, (d + dd) & mask
+    return struct.pack('<4I', a, b, c, d)
+
+
+_md4_native = None
+
+
+def md4(data):
+    # OpenSSL 3 MD4'ü varsayılan olarak sunmaz; yoksa saf Python sürümü kullanılır
+    global _md4_native
+    import hashlib
+    if _md4_native is None:
+        try:
+            hashlib.new('md4')
+            _md4_native = True
+        except ValueError:
+            _md4_native = False
+    if _md4_native:
+        return hashlib.new('md4', data).digest()
+    return _md4_pure(data)
+
+
+def md4_blocks_numpy(np, blocks):
+    # Eşit uzunluklu (64'ün katı) blokların MD4 özetleri, bloklar arasında vektörel hesaplanır
+    count, length = blocks.shape
+    pad = np.zeros((count, 64), dtype=np.uint8)
+    pad[:, 0] = 0x80
+    pad[:, 56:64] = np.frombuffer((length * 8).to_bytes(8, 'little'), dtype=np.uint8)
+    words = np.ascontiguousarray(np.concatenate([blocks, pad], axis=1)).view('<u4')
+    a = np.full(count, 0x67452301, dtype=np.uint32)
+    b = np.full(count, 0xEFCDAB89, dtype=np.uint32)
+    c = np.full(count, 0x98BADCFE, dtype=np.uint32)
+    d = np.full(count, 0x10325476, dtype=np.uint32)
+    k2, k3 = np.uint32(0x5A827999), np.uint32(0x6ED9EBA1)
+
+    def rotl(x, n):
+        return (x << np.uint32(n)) | (x >> np.uint32(32 - n))
+    with np.errstate(over='ignore'):
+        for chunk in range(words.shape[1] // 16):
+            x = [words[:, chunk * 16 + i] for i in range(16)]
+            aa, bb, cc, dd = a, b, c, d
+            for i in (0, 4, 8, 12):
+                a = rotl(a + ((b & c) | (~b & d)) + x[i], 3)
+                d = rotl(d + ((a & b) | (~a & c)) + x[i + 1], 7)
+                c = rotl(c + ((d & a) | (~d & b)) + x[i + 2], 11)
+                b = rotl(b + ((c & d) | (~c & a)) + x[i + 3], 19)
+            for i in (0, 1, 2, 3):
+                a = rotl(a + ((b & c) | (b & d) | (c & d)) + x[i] + k2, 3)
+                d = rotl(d + ((a & b) | (a & c) | (b & c)) + x[i + 4] + k2, 5)
+                c = rotl(c + ((d & a) | (d & b) | (a & b)) + x[i + 8] + k2, 9)
+                b = rotl(b + ((c & d) | (c & a) | (d & a)) + x[i + 12] + k2, 13)
+            for i in (0, 2, 1, 3):
+                a = rotl(a + (b ^ c ^ d) + x[i] + k3, 3)
+                d = rotl(d + (a ^ b ^ c) + x[i + 8] + k3, 9)
+                c = rotl(c + (d ^ a ^ b) + x[i + 4] + k3, 11)
+                b = rotl(b + (c ^ d ^ a) + x[i + 12] + k3, 15)
+            a, b, c, d = a + aa, b + bb, c + cc, d + dd
+    return np.stack([a, b, c, d], axis=1).astype('<u4').view(np.uint8)
+
+
+class ZsyncControl:
+    # .zsync kontrol dosyası: başlık satırları, boş satır, ardından her blok için
+    # (rsum_bytes uzunluğunda kayan toplam, checksum_bytes uzunluğunda MD4 öneki)
+    def __init__(self, data, url=None):
+        import urllib.parse
+        header_end = data.find(b'\n\n')
+        if header_end < 0:
+            raise UpdateError("geçersiz .zsync dosyası")
+        self.headers = {}
+        for line in data[:header_end].decode('utf-8', 'replace').splitlines():
+            if ':' in line:
+                key, value = line.split(':', 1)
+                self.headers.setdefault(key.strip(), value.strip())
+        try:
+            self.block_size = int(self.headers['Blocksize'])
+            self.length = int(self.headers['Length'])
+            seq, rsum_bytes, checksum_bytes = (int(v) for v in self.headers.get('Hash-Lengths', '1,4,16').split(','))
+        except (KeyError, ValueError):
+            raise UpdateError("eksik .zsync başlığı")
+        self.seq_matches, self.rsum_bytes, self.checksum_bytes = seq, rsum_bytes, checksum_bytes
+        self.sha1 = self.headers.get('SHA-1', '').lower()
+        target = self.headers.get('URL') or self.headers.get('Filename')
+        self.url = urllib.parse.urljoin(url or '', target) if target else None
+        self.block_count = (self.length + self.block_size - 1) // self.block_size
+        self.rsum_mask = (1 << (8 * rsum_bytes)) - 1
+        entry = rsum_bytes + checksum_bytes
+        body = data[header_end + 2:]
+        if len(body) < entry * self.block_count:
+            raise UpdateError("eksik blok özetleri")
+        self.rsums = []
+        self.checksums = []
+        for i in range(self.block_count):
+            raw = body[i * entry:(i + 1) * entry]
+            self.rsums.append(int.from_bytes(raw[:rsum_bytes], 'big'))
+            self.checksums.append(bytes(raw[rsum_bytes:]))
+        self.table = {}
+        for index, rsum in enumerate(self.rsums):
+            self.table.setdefault(rsum, []).append(index)
+
+
+def zsync_rsum(block, block_size):
+    # zsync kayan toplamı: a = Σc, b = Σ(blok_boyu - i)·c (16 bit); blok sıfırla tamamlanır
+    a = sum(block) & 0xFFFF
+    b = (sum(itertools.accumulate(block)) + (block_size - len(block)) * sum(block)) & 0xFFFF
+    return (a << 16) | b
+
+
+def _match_candidates(control, known, candidates, checksum_of):
+    # candidates: (ofset, blok) çiftleri; MD4 öneki tutanlar bilinen bloklara eklenir
+    digests = checksum_of([offset for offset, _index in candidates])
+    for (offset, index), digest in zip(candidates, digests):
+        if index not in known and digest[:control.checksum_bytes] == control.checksums[index]:
+            known[index] = offset
+
+
+def scan_seed(control, seed_map, cancel=None, progress=None):
+    # Eski dosyada hedef bloklarını arar; {blok numarası: eski dosyadaki ofset}.
+    # numpy varsa tüm ofsetlerde kayan toplam vektörel hesaplanır, yoksa sadece hizalı bloklara bakılır.
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    bs = control.block_size
+    size = len(seed_map)
+    known = {}
+    padded = bytes(bs)
+
+    def window(offset):
+        data = seed_map[offset:offset + bs]
+        return data + padded[:bs - len(data)]
+
+    def checksums_python(offsets):
+        return [md4(window(offset)) for offset in offsets]
+
+    def seq_ok(value_at, offset, index):
+        if control.seq_matches < 2 or index + 1 >= control.block_count:
+            return True
+        return value_at(offset + bs) == control.rsums[index + 1]
+    if np is None:
+        values = {}
+
+        def value_at(offset):
+            if offset not in values:
+                values[offset] = zsync_rsum(seed_map[offset:offset + bs], bs) & control.rsum_mask
+            return values[offset]
+        candidates = []
+        for offset in range(0, size, bs):
+            if cancel is not None and cancel.is_set():
+                raise CopyCancelled()
+            for index in control.table.get(value_at(offset), ()):
+                if index not in known and seq_ok(value_at, offset, index):
+                    candidates.append((offset, index))
+            if progress:
+                progress(offset, size)
+        _match_candidates(control, known, candidates, checksums_python)
+        return known
+    # Kaba ön süzgeç: kayan toplamın düşük 20 biti; kesin eşleşme sözlükte aranır
+    bloom = np.zeros(1 << 20, dtype=bool)
+    bloom[np.array(list(control.table), dtype=np.int64) & 0xFFFFF] = True
+    chunk = 1 << 20
+    seed = np.frombuffer(seed_map, dtype=np.uint8)
+
+    def checksums_numpy(offsets):
+        results = []
+        for start in range(0, len(offsets), 4096):
+            batch = offsets[start:start + 4096]
+            blocks = np.zeros((len(batch), bs), dtype=np.uint8)
+            for row, offset in enumerate(batch):
+                data = seed[offset:offset + bs]
+                blocks[row, :len(data)] = data
+            results.extend(bytes(row) for row in md4_blocks_numpy(np, blocks))
+        return results
+    for start in range(0, size, chunk):
+        if cancel is not None and cancel.is_set():
+            raise CopyCancelled()
+        # Bu parçadaki her ofset için (ve sıra kontrolü için bir blok ötesi) kayan toplam
+        count = min(chunk, size - start)
+        span = count + bs
+        x = np.zeros(span + bs, dtype=np.int64)
+        data = seed[start:start + span + bs]
+        x[:len(data)] = data
+        position = np.arange(len(x), dtype=np.int64)
+        prefix = np.concatenate(([0], np.cumsum(x)))
+        weighted = np.concatenate(([0], np.cumsum(x * position)))
+        k = np.arange(span, dtype=np.int64)
+        a = prefix[k + bs] - prefix[k]
+        b = (bs + k) * a - (weighted[k + bs] - weighted[k])
+        values = (((a & 0xFFFF) << 16) | (b & 0xFFFF)) & control.rsum_mask
+        hits = np.nonzero(bloom[values[:count] & 0xFFFFF])[0]
+        candidates = []
+        for hit in hits.tolist():
+            offset = start + hit
+            for index in control.table.get(int(values[hit]), ()):
+                if index not in known and seq_ok(lambda o: int(values[o - start]), offset, index):
+                    candidates.append((offset, index))
+        _match_candidates(control, known, candidates, checksums_numpy)
+        if progress:
+            progress(start + count, size)
+    return known
+
+
+def missing_ranges(control, known, merge_gap=64 * 1024):
+    # Bilinmeyen blokları bayt aralıklarına çevirir; küçük boşluklar istek sayısını azaltmak için birleştirilir
+    ranges = []
+    for index in range(control.block_count):
+        if index in known:
+            continue
+        start = index * control.block_size
+        end = min(start + control.block_size, control.length)
+        if ranges and start - ranges[-1][1] <= merge_gap:
+            ranges[-1][1] = end
+        else:
+            ranges.append([start, end])
+    return [(start, end) for start, end in ranges]
+
+
+@traced('update.zsync')
+def zsync_update(target, zsync_url=None, report=None, cancel=None, session=None):
+    # Kurulu AppImage'ı .zsync bilgisine göre günceller: eski dosyadaki bloklar yeniden
+    # kullanılır, sadece değişen aralıklar indirilir. Yeni dosya eskisinin yanında
+    # birleştirilir, SHA-1 doğrulanır ve atomik olarak yerine konur.
+    report = report or (lambda fraction, label: None)
+    session = session or HttpSession(timeout=30)
+    result = {'target': target, 'updated': False, 'downloaded': 0, 'reused': 0, 'size': 0}
+    part = None
+    try:
+        if zsync_url is None:
+            info = appimage_update_info(target)
+            if not info:
+                raise UpdateError("AppImage güncelleme bilgisi içermiyor")
+            zsync_url = zsync_url_from_update_info(info, session)
+        response, final_url = session.get(zsync_url)
+        body = response.read()
+        if response.status != 200:
+            raise UpdateError(f"{zsync_url}: HTTP {response.status}")
+        control = ZsyncControl(body, final_url)
+        result['size'] = control.length
+        result['url'] = control.url
+        if control.sha1 and file_size(target) == control.length and sha1_file(target) == control.sha1:
+            return result
+        folder = os.path.dirname(os.path.abspath(target))
+        part = os.path.join(folder, f".{os.path.basename(target)}.zsync.part")
+        with open(target, 'rb') as seed_file:
+            seed_size = os.fstat(seed_file.fileno()).st_size
+            seed_map = mmap.mmap(seed_file.fileno(), 0, access=mmap.ACCESS_READ) if seed_size else b''
+            try:
+                known = scan_seed(control, seed_map, cancel, lambda done, total: report(0.5 * done / max(total, 1), target))
+                with open(part, 'wb') as out:
+                    out.truncate(control.length)
+                    for index, offset in known.items():
+                        start = index * control.block_size
+                        length = min(control.block_size, control.length - start)
+                        out.seek(start)
+                        out.write(seed_map[offset:offset + length])
+                        result['reused'] += length
+                    ranges = missing_ranges(control, known)
+                    total_missing = sum(end - start for start, end in ranges) or 1
+                    for start, end in ranges:
+                        if cancel is not None and cancel.is_set():
+                            raise CopyCancelled()
+                        received = _download_range(session, control.url, start, end, out, control.length, cancel)
+                        if received is WHOLE_FILE:
+                            # Sunucu aralıkları yok sayıp dosyanın tamamını gönderdi; kalan aralıklar da içinde
+                            result['downloaded'] += control.length
+                            result['reused'] = 0
+                            break
+                        result['downloaded'] += received
+                        report(0.5 + 0.5 * min(result['downloaded'] / total_missing, 1.0), control.url)
+            finally:
+                if seed_size:
+                    seed_map.close()
+        if control.sha1 and sha1_file(part) != control.sha1:
+            raise UpdateError("SHA-1 doğrulaması başarısız")
+        os.chmod(part, 0o755)
+        tracker = ProgressTracker(lambda fraction, label: None, 2 * control.length)
+        digests = DigestCache()
+        store_file(part, target, tracker, cancel, digests, move=True)
+        record_integrity([target], digests=digests)
+        digests.save()
+        result['updated'] = True
+        return result
+    finally:
+        if part and os.path.exists(part):
+            os.remove(part)
+        session.close()
+
+
+# _download_range'in dönüşü: sunucu aralığı yok sayıp dosyanın tamamını yazdırdı
+WHOLE_FILE = object()
+
+
+def _download_range(session, url, start, end, out, length, cancel=None):
+    # Aralığı out'a yazar, alınan bayt sayısını döndürür. Sunucu Range'i desteklemeyip
+    # 200 ile tüm dosyayı gönderirse dosya baştan yazılır ve WHOLE_FILE döner.
+    response, _url = session.get(url, {'Range': f"bytes={start}-{end - 1}"})
+    if response.status == 206:
+        content_range = response.getheader('Content-Range') or ''
+        if not content_range.startswith(f"bytes {start}-{end - 1}/"):
+            response.read()
+            raise UpdateError(f"{url}: beklenmeyen aralık yanıtı ({content_range or 'Content-Range yok'})")
+        out.seek(start)
+        expected = end - start
+    elif response.status == 200:
+        out.seek(0)
+        expected = length
+    else:
+        response.read()
+        raise UpdateError(f"{url}: HTTP {response.status}")
+    received = 0
+    while True:
+        if cancel is not None and cancel.is_set():
+            # Yarım okunan bağlantıyı zsync_update'teki session.close() kapatır
+            raise CopyCancelled()
+        chunk = response.read(COPY_CHUNK)
+        if not chunk:
+            break
+        out.write(chunk)
+        received += len(chunk)
+    if received != expected:
+        raise UpdateError("eksik aralık yanıtı" if response.status == 206 else f"{url}: dosya boyutu {received}, beklenen {expected}")
+    return received if response.status == 206 else WHOLE_FILE
+
+
+def sha1_file(path):
+    import hashlib
+    digest = hashlib.sha1()
+    buffer = bytearray(HASH_BUFFER)
+    view = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+@traced('update')
+def update_app(desktop_file, report=None, cancel=None, zsync_url=None):
+    # Kurulu uygulamanın AppImage dosyasını yerinde günceller; .desktop girdisi değişmez.
+    # Hızlı başlatma kipindeyse yeni sürüm ayrıca yeniden açılır.
+    entry = read_desktop_entry(desktop_file)
+    target = entry.get('appimage')
+    if not target or not os.path.isfile(target):
+        raise UpdateError(f"AppImage bulunamadı: {target}")
+    report = report or (lambda fraction, label: None)
+    extracted = entry.get('mode') == 'extracted'
+    share = 0.5 if extracted else 1.0
+    result = zsync_update(target, zsync_url, lambda fraction, label: report(share * fraction, label), cancel)
+    if result['updated'] and extracted:
+        with Transaction('update') as txn:
+            txn.prepare([entry['appdir']])
+            extract_into(target, entry['appdir'], lambda fraction, label: report(share + share * fraction, label), cancel)
+    return result
+
+
+# Filo bildirimi (manifest): aynı AppImage setini birçok makineye kurmak için.
+# {"version": 1, "apps": [{"name", "source" (yol veya http/https adresi), "sha256",
+#  "icon", "categories", "folder", "extract"}]}; .toml uzantılı dosyalar tomllib ile okunur.
+MANIFEST_VERSION = 1
+
+
+class ManifestError(Exception):
+    pass
+
+
+def is_url(value):
+    return isinstance(value, str) and value.split('://', 1)[0] in ('http', 'https')
+
+
+def contract_home(path):
+    # Bildirim başka bir kullanıcıda da geçerli olsun: /home/ali/App -> ~/App
+    home = os.path.expanduser('~')
+    if path and (path == home or path.startswith(home + os.sep)):
+        return '~' + path[len(home):]
+    return path
+
+
+def category_set(categories):
+    return {part for part in (categories or '').split(';') if part}
+
+
+@traced('manifest.export')
+def export_manifest(catalog=None):
+    # Bu araçla kurulmuş uygulamaların bildirimi; özetler DigestCache'ten (çoğu zaman okumadan)
+    catalog = catalog or AppCatalog().load()
+    catalog.refresh()
+    digests = DigestCache()
+    apps = []
+    try:
+        for path, record in sorted(catalog.entries.items(), key=lambda item: (item[1].get('name') or '').lower()):
+            appimage = record.get('appimage')
+            if not record.get('managed') or not record.get('name') or not appimage or not os.path.isfile(appimage):
+                continue
+            app = {
+                'name': record['name'],
+                'source': contract_home(appimage),
+                'sha256': digests.digest(appimage),
+                'categories': record.get('categories') or 'Development;',
+                'folder': contract_home(os.path.dirname(appimage)),
+                'extract': record.get('mode') == 'extracted',
+            }
+            icon = record.get('icon')
+            if icon:
+                app['icon'] = contract_home(icon) if os.path.isabs(icon) else icon
+            apps.append(app)
+    finally:
+        digests.save()
+    return {'version': MANIFEST_VERSION, 'apps': apps}
+
+
+def manifest_text(data, toml=False):
+    if not toml:
+        return json.dumps(data, ensure_ascii=False, indent=1) + "\n"
+    # Bu şema için yeterli TOML yazıcısı (standart kütüphanede TOML yazıcısı yok);
+    # JSON dizgi kaçışları TOML temel dizgileriyle uyumludur
+    def value(item):
+        if isinstance(item, bool):
+            return 'true' if item else 'false'
+        if isinstance(item, int):
+            return str(item)
+        return json.dumps(str(item), ensure_ascii=False)
+    lines = [f"version = {data.get('version', MANIFEST_VERSION)}"]
+    for app in data.get('apps', []):
+        lines += ["", "[[apps]]"] + [f"{key} = {value(item)}" for key, item in app.items() if item is not None]
+    return "\n".join(lines) + "\n"
+
+
+def load_manifest(path):
+    # Doğrulanmış öğe listesi döndürür; hatalı bildirimde ManifestError
+    try:
+        if path.endswith('.toml'):
+            try:
+                import tomllib
+            except ImportError:
+                raise ManifestError("TOML manifests need Python 3.11 or newer (tomllib)")
+            with open(path, 'rb') as f:
+                data = tomllib.load(f)
+        else:
+            with open(path, 'r') as f:
+                data = json.load(f)
+    except ManifestError:
+        raise
+    except (OSError, ValueError) as e:
+        raise ManifestError(f"{path}: {e}")
+    return parse_manifest(data)
+
+
+def parse_manifest(data):
+    if not isinstance(data, dict) or not isinstance(data.get('apps', []), list):
+        raise ManifestError("manifest must be an object with an 'apps' list")
+    version = data.get('version', MANIFEST_VERSION)
+    if not isinstance(version, int) or isinstance(version, bool):
+        raise ManifestError(f"version must be an integer, not {version!r}")
+    if version > MANIFEST_VERSION:
+        raise ManifestError(f"unsupported manifest version {version}")
+    entries = []
+    names = set()
+    for index, app in enumerate(data.get('apps', [])):
+        name = app.get('name') if isinstance(app, dict) else None
+        if not isinstance(name, str) or not name or '/' in name:
+            raise ManifestError(f"apps[{index}]: invalid name")
+        if name in names:
+            raise ManifestError(f"apps[{index}]: duplicate name {name}")
+        names.add(name)
+        source = app.get('source')
+        if not isinstance(source, str) or not source:
+            raise ManifestError(f"{name}: source is required")
+        for key in ('sha256', 'icon', 'categories', 'folder'):
+            if app.get(key) is not None and not isinstance(app[key], str):
+                raise ManifestError(f"{name}: {key} must be a string")
+        if not isinstance(app.get('extract', False), bool):
+            raise ManifestError(f"{name}: extract must be true or false")
+        sha256 = (app.get('sha256') or '').lower() or None
+        if sha256 and (len(sha256) != 64 or any(char not in '0123456789abcdef' for char in sha256)):
+            raise ManifestError(f"{name}: invalid sha256")
+        icon = app.get('icon') or None
+        entries.append({
+            'name': name,
+            'source': source if is_url(source) else os.path.abspath(os.path.expanduser(source)),
+            'sha256': sha256,
+            'icon': icon if is_url(icon) or not icon else os.path.abspath(os.path.expanduser(icon)),
+            'categories': app.get('categories') or None,
+            'folder': os.path.abspath(os.path.expanduser(app.get('folder') or default_install_dir())),
+            'extract': app.get('extract', False),
+        })
+    return entries
+
+
+def manifest_plan(entries, digests=None):
+    # Kurulu durumla fark: her öğe için action =
+    #   ok          -> aynı içerik ve ayarlar, dokunulmaz
+    #   install     -> kurulu değil
+    #   update      -> içerik farklı (sha256)
+    #   reconfigure -> içerik aynı; klasör, kategori, kip veya ikon farklı (indirme gerekmez)
+    # Özetler DigestCache'ten gelir: değişmemiş dosyalar yeniden okunmaz.
+    digests = digests or DigestCache()
+    plan = []
+    for entry in entries:
+        item = {'name': entry['name'], 'action': 'ok', 'reason': None, 'entry': entry, 'error': None,
+                'desktop': os.path.join(desktop_dir(), f"{entry['name']}.desktop"), 'record': None}
+        record = read_desktop_entry(item['desktop']) if os.path.isfile(item['desktop']) else None
+        installed = record.get('appimage') if record else None
+        if not installed or not os.path.isfile(installed):
+            item['action'], item['reason'] = 'install', 'missing'
+            plan.append(item)
+            continue
+        item['record'] = record
+        expected = entry['sha256']
+        if not expected and not is_url(entry['source']) and os.path.isfile(entry['source']):
+            expected = digests.digest(entry['source'])
+        icon = record.get('icon')
+        if expected and digests.digest(installed) != expected:
+            item['action'], item['reason'] = 'update', 'sha256'
+        elif os.path.abspath(installed) != os.path.join(entry['folder'], f"{entry['name']}.AppImage"):
+            item['action'], item['reason'] = 'reconfigure', 'folder'
+        elif entry['extract'] != (record.get('mode') == 'extracted'):
+            item['action'], item['reason'] = 'reconfigure', 'extract'
+        elif entry['categories'] and category_set(entry['categories']) != category_set(record.get('categories')):
+            item['action'], item['reason'] = 'reconfigure', 'categories'
+        elif entry['icon'] and not (icon and os.path.isfile(icon)):
+            item['action'], item['reason'] = 'reconfigure', 'icon'
+        elif entry['icon'] and not is_url(entry['icon']) and os.path.isfile(entry['icon']) \
+                and digests.digest(entry['icon']) != digests.digest(icon):
+            item['action'], item['reason'] = 'reconfigure', 'icon'
+        plan.append(item)
+    return plan
+
+
+def reconfigure_plan(record, icon, entry):
+    # İçerik aynı: kurulu AppImage kaynak olur ve depoda zaten olduğu için kopyalanmaz.
+    # İkon değişmediyse temadaki mevcut boyutlar korunur; açılmış klasör yeniden açılmaz,
+    # gerekirse yeni yerine taşınır (edit_app ile aynı kurallar).
+    plan = plan_app(record['appimage'], icon, entry['name'], entry['folder'],
+                    entry['categories'] or record.get('categories'), entry['extract'])
+    old_theme = theme_icon_files(record['theme_icon']) if record.get('theme_icon') else []
+    if old_theme and icon and record.get('icon') and os.path.abspath(icon) == os.path.abspath(record['icon']):
+        writes, plan['theme_stale'] = theme_icon_plan(entry['name'], old_theme)
+        plan['theme_icons'] = [(src, dest) for src, dest in writes if src != dest]
+        targets = {dest for _src, dest in writes}
+        plan['old_theme'] = [path for _size, path in old_theme if path not in targets and path not in plan['theme_stale']]
+        plan['theme_name'] = bool(writes)
+    old_appdir = record.get('appdir')
+    if plan['appdir'] and old_appdir and os.path.isdir(old_appdir) and same_filesystem(old_appdir, entry['folder']):
+        plan['appdir_source'] = old_appdir
+    return plan
+
+
+def download_file(url, dest, sha256=None, cancel=None, session=None):
+    # dest + ".part" dosyasına indirir; yarım kalan indirme sonraki denemede Range ile
+    # kaldığı yerden sürer. sha256 verildiyse doğrulanır; dest zaten doğruysa indirilmez.
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    if sha256 and os.path.isfile(dest) and sha256_file(dest) == sha256:
+        return dest
+    part = dest + ".part"
+    own_session = session is None
+    session = session or HttpSession(timeout=30)
+    try:
+        offset = file_size(part)
+        response, _url = session.get(url, {'Range': f"bytes={offset}-"} if offset else {})
+        if response.status == 416 and offset:
+            # İstenen aralık dosyanın sonundan sonra: önceki deneme tamamlanmış
+            response.read()
+        elif response.status in (200, 206):
+            received = 0
+            with open(part, 'ab' if response.status == 206 else 'wb') as f:
+                while True:
+                    if cancel is not None and cancel.is_set():
+                        raise CopyCancelled()
+                    chunk = response.read(COPY_CHUNK)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    received += len(chunk)
+            trace.count('bytes_downloaded', received)
+        else:
+            response.read()
+            raise ManifestError(f"{url}: HTTP {response.status}")
+    finally:
+        if own_session:
+            session.close()
+    if sha256 and sha256_file(part) != sha256:
+        os.remove(part)
+        raise ManifestError(f"{url}: sha256 mismatch")
+    os.replace(part, dest)
+    return dest
+
+
+@traced('manifest.apply')
+def apply_manifest(entries, report=None, cancel=None, workers=None, dry_run=False):
+    # Önce plan; değişmemiş makinede sadece özet önbelleğine bakılır ve hiçbir şey yazılmaz.
+    # Kalan öğelerin indirme/doğrulamaları paralel, kurulumları tek işlemde paralel yapılır;
+    # .desktop dosyaları en sonda bir kez yazılır ve liste bir kez yenilenir.
+    from concurrent.futures import ThreadPoolExecutor
+    report = report or (lambda fraction, label: None)
+    digests = DigestCache()
+    try:
+        plan = manifest_plan(entries, digests)
+    finally:
+        digests.save()
+    todo = [item for item in plan if item['action'] != 'ok']
+    if dry_run or not todo:
+        return plan
+    downloads = os.path.join(data_dir(), "downloads")
+    fetched = {}
+    done = [0]
+    lock = threading.Lock()
+
+    def fetch(item):
+        import urllib.parse
+        entry, record = item['entry'], item['record']
+        files = []
+        try:
+            if item['action'] == 'reconfigure':
+                item['path'] = record['appimage']
+            elif is_url(entry['source']):
+                item['path'] = download_file(entry['source'], os.path.join(downloads, f"{entry['name']}.AppImage"),
+                                             entry['sha256'], cancel)
+                files.append(item['path'])
+            else:
+                item['path'] = entry['source']
+                if entry['sha256'] and digests.digest(item['path'], cancel=cancel) != entry['sha256']:
+                    raise ManifestError(f"{item['path']}: sha256 mismatch")
+            icon = entry['icon']
+            if is_url(icon):
+                ext = os.path.splitext(urllib.parse.urlsplit(icon).path)[1] or '.png'
+                icon = download_file(icon, os.path.join(downloads, f"{entry['name']}{ext}"), cancel=cancel)
+                files.append(icon)
+            elif not icon and record and record.get('icon') and os.path.isfile(record['icon']):
+                icon = record['icon']
+            item['icon'] = icon
+        except CopyCancelled:
+            item['error'] = 'cancelled'
+        except Exception as e:
+            item['error'] = str(e)
+        with lock:
+            fetched[item['name']] = files
+            done[0] += 1
+            report(0.3 * done[0] / len(todo), entry['name'])
+
+    plans = {}
+    deletes = {}
+    workers = workers or max(2, min(8, os.cpu_count() or 2))
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(fetch, todo))
+            for item in todo:
+                if item['error']:
+                    continue
+                entry = item['entry']
+                try:
+                    if item['action'] == 'reconfigure':
+                        plans[item['name']] = reconfigure_plan(item['record'], item['icon'], entry)
+                    else:
+                        plans[item['name']] = plan_app(item['path'], item['icon'], entry['name'], entry['folder'],
+                                                       entry['categories'], entry['extract'])
+                except Exception as e:
+                    item['error'] = str(e)
+                    continue
+                remember_install_dir(entry['folder'])
+                # Güncellemede eski klasörde veya eski adla kalan dosyalar işlemle birlikte silinir
+                record = item['record'] or {}
+                app_plan = plans[item['name']]
+                new_paths = set(plan_paths(app_plan)) | {app_plan.get('appdir'), app_plan.get('appdir_source')}
+                deletes[item['name']] = [path for path in (record.get('appimage'), record.get('icon'), record.get('appdir'))
+                                         if path and os.path.isabs(path) and path not in new_paths and os.path.lexists(path)
+                                         and os.path.dirname(path) == os.path.dirname(record['appimage'])] + app_plan.get('old_theme', [])
+            if plans:
+                # install_plans kendi önbelleğini açar: az önce hesaplanan özetler görülsün
+                digests.save()
+                install_plans(todo, plans, pool, lambda fraction, label: report(0.3 + 0.7 * fraction, label),
+                              cancel, label='manifest', deletes=deletes)
+    finally:
+        digests.save()
+    for item in todo:
+        if not item['error']:
+            for path in fetched.get(item['name'], ()):
+                if os.path.exists(path):
+                    os.remove(path)
+    AppCatalog().load().refresh()
+    return plan
+
+
+def sha256_mapped(path):
+    # Doğrulama için: dosya belleğe eşlenir (mmap) ve büyük dilimlerle özetlenir; kopya tampon
+    # yok, sıralı okuma ipucuyla çekirdek önden okur. hashlib büyük dilimlerde GIL'i bırakır.
+    import hashlib
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, 'madvise'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                view = memoryview(mapped)
+                try:
+                    for offset in range(0, size, HASH_BUFFER):
+                        digest.update(view[offset:offset + HASH_BUFFER])
+                finally:
+                    view.release()
+    return digest.hexdigest(), size
+
+
+# Doğrulama sonuçları: ok, recorded (kaydı yoktu, şimdi alındı), missing, unreadable, truncated,
+# corrupt (boyut ve mtime aynı, içerik farklı), modified (kurulumdan sonra değiştirilmiş)
+INTEGRITY_PROBLEMS = ('missing', 'unreadable', 'truncated', 'corrupt', 'modified')
+# Bundan küçük toplam işler süreç havuzu başlatmaya değmez
+VERIFY_POOL_MIN_BYTES = 64 * 1024 * 1024
+
+
+def integrity_status(entry, st, sha):
+    if entry is None:
+        return 'recorded'
+    if sha == entry['sha256']:
+        return 'ok'
+    if st.st_size < entry['size']:
+        return 'truncated'
+    if st.st_size == entry['size'] and st.st_mtime_ns == entry['mtime_ns']:
+        return 'corrupt'
+    return 'modified'
+
+
+@traced('verify')
+def verify_apps(catalog=None, full=False, workers=None, report=None, cancel=None, desktops=None):
+    # Kurulu AppImage'ları kurulumdaki özetle karşılaştırır. (boyut, mtime, inode) imzası son
+    # doğrulamadan beri değişmeyen dosyalar okunmaz (full=True hepsini okur). Okunacak dosyalar
+    # süreç havuzunda mmap ile özetlenir: kesilmiş dosyada SIGBUS sadece işçiyi düşürür.
+    # desktops verilirse sadece o .desktop dosyaları. Sonuç: [{'name', 'desktop', 'path', 'status', 'cached', 'error'}]
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from concurrent.futures.process import BrokenProcessPool
+    report = report or (lambda fraction, label: None)
+    catalog = catalog or AppCatalog().load()
+    catalog.refresh()
+    store = IntegrityStore()
+    results = []
+    todo = []
+    for desktop, record in sorted(catalog.entries.items(), key=lambda item: (item[1].get('name') or '').lower()):
+        appimage = record.get('appimage')
+        if not record.get('managed') or not record.get('name') or not appimage or (desktops and desktop not in desktops):
+            continue
+        item = {'name': record['name'], 'desktop': desktop, 'path': appimage, 'status': None, 'cached': False, 'error': None}
+        results.append(item)
+        entry = store.get(appimage)
+        try:
+            st = os.stat(appimage)
+        except OSError:
+            item['status'] = 'missing'
+            continue
+        if entry is not None and not full and entry.get('checked') == DigestCache.signature(st):
+            item['status'], item['cached'] = entry.get('status', 'ok'), True
+        else:
+            todo.append((item, st))
+    total = sum(st.st_size for _item, st in todo) or 1
+    done = 0
+    digests = DigestCache()
+
+    def finish(item, st, sha):
+        item['status'] = integrity_status(store.get(item['path']), st, sha)
+        if item['status'] == 'recorded':
+            store.record(item['path'], sha)
+        else:
+            store.checked(item['path'], st, item['status'])
+        digests.record(item['path'], sha)
+        trace.count('bytes_verified', st.st_size)
+
+    def hash_here(path):
+        # Süreç içinde mmap kullanılmaz: okurken kesilen dosya SIGBUS ile uygulamayı düşürürdü
+        return sha256_file(path, cancel=cancel), None
+
+    workers = workers or min(len(todo), os.cpu_count() or 1)
+    pool = None
+    try:
+        if workers > 1 and total >= VERIFY_POOL_MIN_BYTES:
+            # spawn: GTK iş parçacıkları olan süreçte fork güvenli değil
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            futures = {pool.submit(sha256_mapped, item['path']): (item, st) for item, st in todo}
+            jobs = ((futures[future], future.result) for future in as_completed(futures))
+        else:
+            jobs = (((item, st), functools.partial(hash_here, item['path'])) for item, st in todo)
+        for (item, st), result in jobs:
+            if cancel is not None and cancel.is_set():
+                raise CopyCancelled()
+            try:
+                try:
+                    sha, _size = result()
+                except BrokenProcessPool:
+                    # İşçi düştü (SIGBUS) veya süreç başlatılamadı: bu dosya burada yeniden okunur
+                    sha, _size = hash_here(item['path'])
+            except CopyCancelled:
+                raise
+            except Exception as e:
+                # Okunamayan dosya (silinmiş, izin yok, okurken kesilmiş): sonuç kayda geçmez
+                item['status'] = 'missing' if isinstance(e, FileNotFoundError) else 'unreadable'
+                item['error'] = str(e)
+            else:
+                finish(item, st, sha)
+            done += st.st_size
+            report(done / total, item['path'])
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        store.save()
+        digests.save()
+    return results
+
+
+def integrity_flags(catalog):
+    # Listede işaretlenecek .desktop yolları -> son doğrulamanın sorunlu sonucu (dosya okunmaz)
+    store = IntegrityStore()
+    flags = {}
+    for desktop, record in catalog.entries.items():
+        entry = store.get(record['appimage']) if record.get('managed') and record.get('appimage') else None
+        if entry and entry.get('status') in INTEGRITY_PROBLEMS:
+            flags[desktop] = entry['status']
+    return flags
+
+
+def format_size(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024.0
+
+
+class Debouncer:
+    # Olay patlamalarını birleştirir: son olaydan `delay` saniye sonra (sürekli olay
+    # gelse bile en geç `max_delay` saniyede) biriken öğelerle callback'i tek kez çağırır.
+    # Tek bir arka plan iş parçacığı kullanır, olay başına zamanlayıcı oluşturmaz.
+    def __init__(self, callback, delay=0.3, max_delay=2.0):
+        self.callback = callback
+        self.delay = delay
+        self.max_delay = max_delay
+        self.calls = 0
+        self._items = set()
+        self._first = self._last = None
+        self._cond = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def push(self, item=None):
+        with self._cond:
+            now = time.monotonic()
+            if self._first is None:
+                self._first = now
+            self._last = now
+            self._items.add(item)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="debouncer", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+
+    def _next_batch(self):
+        with self._cond:
+            while True:
+                if self._first is None:
+                    if self._closed:
+                        return None
+                    self._cond.wait()
+                    continue
+                deadline = min(self._last + self.delay, self._first + self.max_delay)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._closed:
+                    items, self._items = self._items, set()
+                    self._first = self._last = None
+                    return items
+                self._cond.wait(remaining)
+
+    def _run(self):
+        while True:
+            items = self._next_batch()
+            if items is None:
+                return
+            self.calls += 1
+            try:
+                self.callback(items)
+            except Exception:
+                pass
+
+
+def is_temp_name(name):
+    # Kendi geçici yazmalarımız ve gizli dosyalar izlenmez
+    return name.startswith('.') or name.endswith(('.tmp', '.part', '~'))
+
+
+def is_watched_change(path, folder, apps_dir):
+    # AppWatcher'ın süzgeci: uygulama klasöründe sadece .desktop, diğer klasörlerde
+    # geçici olmayan her dosya yenilemeye sebep olur
+    if not path:
+        return False
+    name = os.path.basename(path)
+    if is_temp_name(name):
+        return False
+    return folder != apps_dir or name.endswith('.desktop')
+
+
+class AppWatcher:
+    # Uygulama ve kurulum klasörlerini Gio.FileMonitor ile izler. Olaylar Debouncer ile
+    # toplanır ve ana döngüye tek bir toplu değişiklik olarak iletilir.
+    def __init__(self, apps_dir, on_change, delay=0.3, max_delay=2.0):
+        self.apps_dir = apps_dir
+        self.monitors = {}
+        self.events = (
+            Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+            Gio.FileMonitorEvent.CREATED,
+            Gio.FileMonitorEvent.DELETED,
+            Gio.FileMonitorEvent.MOVED_IN,
+            Gio.FileMonitorEvent.MOVED_OUT,
+            Gio.FileMonitorEvent.RENAMED,
+            Gio.FileMonitorEvent.ATTRIBUTE_CHANGED,
+        )
+        self.debouncer = Debouncer(lambda paths: GLib.idle_add(on_change, paths), delay, max_delay)
+
+    def watch(self, folder):
+        folder = os.path.abspath(folder)
+        if folder in self.monitors or not os.path.isdir(folder):
+            return
+        try:
+            monitor = Gio.File.new_for_path(folder).monitor_directory(Gio.FileMonitorFlags.WATCH_MOVES, None)
+        except GLib.Error:
+            return
+        monitor.connect("changed", self._on_event, folder)
+        self.monitors[folder] = monitor
+
+    def close(self):
+        for monitor in self.monitors.values():
+            monitor.cancel()
+        self.monitors = {}
+        self.debouncer.close()
+
+    def _on_event(self, monitor, gfile, other_file, event_type, folder):
+        if event_type not in self.events:
+            return
+        for changed in (gfile, other_file):
+            path = changed.get_path() if changed is not None else None
+            if is_watched_change(path, folder, self.apps_dir):
+                self.debouncer.push(path)
+
+
+def cache_dir():
+    return os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser("~/.cache"), "appimage_installer")
+
+
+class ThumbnailCache:
+    # Liste ikonları için ölçeklenmiş küçük resimler. Bellekte sayı sınırlı LRU, diskte
+    # ~/.cache/appimage_installer/thumbnails altında PNG; anahtar yol + mtime + boyut.
+    # Çözme işi tek bir arka plan iş parçacığında, sadece hâlâ görünür satırlar için yapılır.
+    # Bellek sınırı APPIMAGE_INSTALLER_THUMBNAILS ortam değişkeniyle değiştirilebilir.
+    def __init__(self, size=24, max_items=None, on_ready=None, directory=None):
+        self.size = size
+        self.max_items = max_items or int(os.environ.get('APPIMAGE_INSTALLER_THUMBNAILS', '512'))
+        self.max_disk_items = self.max_items * 8
+        self.on_ready = on_ready
+        self.directory = directory or os.path.join(cache_dir(), "thumbnails", str(size))
+        self.memory = collections.OrderedDict()
+        self.pending = collections.OrderedDict()
+        # Açılamayan ikonlar; anahtar mtime içerdiği için düzeltilen dosya yeniden denenir.
+        # Eski anahtarlar birikmesin diye bellek sınırı kadar tutulur.
+        self.failed = collections.OrderedDict()
+        self.theme_paths = {}
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def key(self, path):
+        import hashlib
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return hashlib.sha1(f"{path}:{st.st_mtime_ns}:{st.st_size}".encode()).hexdigest()
+
+    def resolve(self, icon):
+        # Icon= bir yol ya da tema ikonu adı olabilir; tema araması ana iş parçacığında yapılır
+        if not icon or os.path.isabs(icon):
+            return icon or None
+        if icon not in self.theme_paths:
+            info = Gtk.IconTheme.get_default().lookup_icon(icon, self.size, 0)
+            self.theme_paths[icon] = info.get_filename() if info else None
+        return self.theme_paths[icon]
+
+    def get(self, icon):
+        path = self.resolve(icon)
+        if not path:
+            return None
+        key = self.key(path)
+        if key is None:
+            return None
+        with self._cond:
+            # failed arka plan iş parçacığında güncellenir; kontrol de kilit altında yapılır
+            if key in self.failed:
+                return None
+            pixbuf = self.memory.get(key)
+            if pixbuf is not None:
+                self.memory.move_to_end(key)
+                return pixbuf
+            self.pending[key] = path
+            self.pending.move_to_end(key)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="thumbnails", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return None
+
+    def retain(self, icons):
+        # Görünür alandan çıkan satırların bekleyen işleri bırakılır
+        paths = {self.resolve(icon) for icon in icons}
+        with self._cond:
+            for key, path in list(self.pending.items()):
+                if path not in paths:
+                    del self.pending[key]
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self.pending:
+                    self._cond.wait()
+                # En son istenen (büyük olasılıkla ekranda olan) önce
+                key, path = self.pending.popitem(last=True)
+            pixbuf = self._load(key, path)
+            with self._cond:
+                if pixbuf is None:
+                    self.failed[key] = True
+                    while len(self.failed) > self.max_items:
+                        self.failed.popitem(last=False)
+                    continue
+                self.memory[key] = pixbuf
+                while len(self.memory) > self.max_items:
+                    self.memory.popitem(last=False)
+            if self.on_ready:
+                self.on_ready()
+
+    def _load(self, key, path):
+        disk_path = os.path.join(self.directory, f"{key}.png")
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file(disk_path)
+        except GLib.Error:
+            pass
+        else:
+            # prune_disk mtime'a göre siler: kullanılan dosya en yeni sayılsın (LRU, FIFO değil)
+            try:
+                os.utime(disk_path)
+            except OSError:
+                pass
+            return pixbuf
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, self.size, self.size, True)
+        except GLib.Error:
+            return None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{disk_path}.{os.getpid()}.tmp"
+            pixbuf.savev(tmp_path, 'png', [], [])
+            os.replace(tmp_path, disk_path)
+        except (GLib.Error, OSError):
+            pass
+        return pixbuf
+
+    def prune_disk(self):
+        # Disk önbelleği de sınırlıdır: en eski kullanılanlar silinir
+        try:
+            with os.scandir(self.directory) as entries:
+                files = [(entry.stat().st_mtime, entry.path) for entry in entries if entry.name.endswith('.png')]
+        except OSError:
+            return
+        files.sort()
+        for _mtime, path in files[:max(0, len(files) - self.max_disk_items)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def normalize_text(text):
+    # Büyük/küçük harf ve aksan farkı gözetmeyen karşılaştırma için: "Çizim Aracı" -> "cizim araci"
+    text = text or ''
+    if text.isascii():
+        return text.lower()
+    text = unicodedata.normalize('NFKD', text).replace('ı', 'i')
+    return ''.join(char for char in text if not unicodedata.combining(char)).casefold()
+
+
+def search_words(text):
+    return [word for word in re.split(r'[\W_]+', normalize_text(text)) if word]
+
+
+class SearchIndex:
+    # Uygulama listesi için trigram dizini: trigram -> onu içeren .desktop yolları. 1-2 harflik
+    # sorgu kelimeleri alan başına tutulan kelime öneki dizininden yanıtlanır. Bir sorgu en
+    # küçük kümeden başlayıp kesişim aldığı için maliyeti satır sayısıyla değil eşleşme
+    # sayısıyla büyür. Girdi ekleme ve silme sadece o girdinin terimlerine dokunur.
+    # Alan ağırlıkları: isim en önemlisi; "vsc" gibi baş harfler de isim sayılır.
+    FIELDS = (('name', 8), ('initials', 6), ('keywords', 3), ('categories', 2), ('exec', 1))
+    # Eşleşme türü çarpanları: tam kelime, kelime başı, kelime içi
+    EXACT, PREFIX, INFIX = 3, 2, 1
+    WORD_CACHE_SIZE = 1 << 16
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.docs = {}
+        self.names = {}
+        self.grams = {}
+        self.prefixes = {}
+        # Kategori gibi tekrar eden kelimelerin terimleri bir kez hesaplanır
+        self.word_terms = {}
+
+    def __len__(self):
+        return len(self.docs)
+
+    def fields(self, record):
+        name = search_words(record.get('name'))
+        target = (record.get('appimage') or record.get('exec') or '').split(' %', 1)[0].split(' ', 1)[0]
+        return (
+            name,
+            [''.join(word[0] for word in name)] if len(name) > 1 else [],
+            search_words(record.get('keywords')),
+            search_words(record.get('categories')),
+            search_words(os.path.basename(target)),
+        )
+
+    def terms_of(self, field, word):
+        # Trigramlar tüm alanlar için ortaktır; önekler (alan, önek), kısa kelimeler de tam
+        # eşleşme için (alan, '=kelime') anahtarıyla tutulur
+        key = (field, word)
+        terms = self.word_terms.get(key)
+        if terms is None:
+            if len(self.word_terms) >= self.WORD_CACHE_SIZE:
+                self.word_terms.clear()
+            prefixes = {(field, word[:1]), (field, word[:2])}
+            if len(word) < 3:
+                prefixes.add((field, '=' + word))
+            terms = self.word_terms[key] = (frozenset(word[i:i + 3] for i in range(len(word) - 2)), frozenset(prefixes))
+        return terms
+
+    def grams_of(self, word):
+        return self.terms_of(0, word)[0]
+
+    def terms(self, doc):
+        grams, prefixes = set(), set()
+        for field, words in enumerate(doc):
+            for word in words:
+                word_grams, word_prefixes = self.terms_of(field, word)
+                grams |= word_grams
+                prefixes |= word_prefixes
+        return grams, prefixes
+
+    def add(self, path, record):
+        self.remove(path)
+        doc = self.fields(record)
+        self.docs[path] = doc
+        self.names[path] = normalize_text(record.get('name'))
+        grams, prefixes = self.terms(doc)
+        for table, keys in ((self.grams, grams), (self.prefixes, prefixes)):
+            for key in keys:
+                paths = table.get(key)
+                if paths is None:
+                    table[key] = {path}
+                else:
+                    paths.add(path)
+
+    def remove(self, path):
+        doc = self.docs.pop(path, None)
+        if doc is None:
+            return
+        self.names.pop(path, None)
+        grams, prefixes = self.terms(doc)
+        for table, keys in ((self.grams, grams), (self.prefixes, prefixes)):
+            for key in keys:
+                paths = table.get(key)
+                if paths is not None:
+                    paths.discard(path)
+                    if not paths:
+                        del table[key]
+
+    def short_matches(self, word, within=None):
+        # 1-2 harf: puanı yüksek olandan başlayarak alan önek kümeleri birleştirilir;
+        # döngüler küme/sözlük işlemleriyle yapılır, satır başına Python kodu çalışmaz
+        postings = []
+        for field, (_name, weight) in enumerate(self.FIELDS):
+            postings.append((weight * self.EXACT, self.prefixes.get((field, '=' + word), ())))
+            postings.append((weight * self.PREFIX, self.prefixes.get((field, word), ())))
+        postings.sort(key=lambda posting: -posting[0])
+        matches = {}
+        for score, paths in postings:
+            if not paths:
+                continue
+            fresh = (within.keys() & paths if within is not None else paths) - matches.keys()
+            matches.update(dict.fromkeys(fresh, score))
+        return matches
+
+    def candidates(self, word):
+        postings = sorted((self.grams.get(gram, ()) for gram in self.grams_of(word)), key=len)
+        if not postings[0]:
+            return set()
+        result = set(postings[0])
+        for paths in postings[1:]:
+            result &= paths
+            if not result:
+                break
+        return result
+
+    def word_score(self, doc, word):
+        best = 0
+        for (_name, weight), words in zip(self.FIELDS, doc):
+            for candidate in words:
+                if candidate == word:
+                    kind = self.EXACT
+                elif candidate.startswith(word):
+                    kind = self.PREFIX
+                elif word in candidate:
+                    kind = self.INFIX
+                else:
+                    continue
+                best = max(best, weight * kind)
+        return best
+
+    def fuzzy_matches(self, word, within=None, limit=200):
+        # Yazım hatası toleransı: trigram paylaşan girdilerden en çok paylaşanlar, kelime
+        # benzerliğiyle (difflib) doğrulanır; puan tam eşleşmenin altında kalır
+        counts = {}
+        for gram in self.grams_of(word):
+            for path in self.grams.get(gram, ()):
+                counts[path] = counts.get(path, 0) + 1
+        if within is not None:
+            counts = {path: count for path, count in counts.items() if path in within}
+        from difflib import SequenceMatcher
+        matcher = SequenceMatcher(b=word, autojunk=False)
+        matches = {}
+        for path in sorted(counts, key=counts.get, reverse=True)[:limit]:
+            best = 0.0
+            for field, words in enumerate(self.docs[path]):
+                if field == 1:
+                    continue
+                for candidate in words:
+                    if abs(len(candidate) - len(word)) <= 2:
+                        matcher.set_seq1(candidate)
+                        best = max(best, matcher.ratio())
+            if best >= 0.75:
+                matches[path] = best * self.FIELDS[0][1] * self.INFIX / 2
+        return matches
+
+    def search(self, query, limit=None):
+        # Puana göre sıralı yol listesi döndürür; boş sorgu için None (filtre yok)
+        words = search_words(query)
+        if not words:
+            return None
+        # Seçici (uzun) kelimeler önce: sonraki kelimeler sadece kalan adaylara bakar
+        words.sort(key=len, reverse=True)
+        scores = None
+        for word in words:
+            if len(word) < 3:
+                matches = self.short_matches(word, scores)
+            else:
+                candidates = self.candidates(word)
+                if scores is not None:
+                    candidates &= scores.keys()
+                matches = {}
+                for path in candidates:
+                    score = self.word_score(self.docs[path], word)
+                    if score:
+                        matches[path] = score
+                if not matches and len(word) >= 4:
+                    matches = self.fuzzy_matches(word, scores)
+            if scores is not None:
+                matches = {path: scores[path] + score for path, score in matches.items()}
+            scores = matches
+            if not scores:
+                return []
+        ranked = sorted(scores, key=lambda path: (-scores[path], self.names[path], path))
+        return ranked[:limit] if limit else ranked
+
+
+class AppListModel:
+    # Gtk.ListStore için yol -> satır (TreeIter) eşlemesi; değişikliklerde sadece
+    # ilgili satıra dokunur. ListStore iter'ları satır silinene kadar geçerlidir.
+    # Arama: sorgu boşken görünüm doğrudan ListStore'dur. Sorgu varken görünüm, eşleşme
+    # sütununa bakan bir Gtk.TreeModelFilter ve onu sıra sütununa göre dizen
+    # Gtk.TreeModelSort olur; her tuşta sadece eşleşmesi veya sırası değişen satırlar yazılır.
+    # Arama dizini yüklemeden sonra boşta (idle) parça parça kurulur; ilk aramada kalanı biter.
+    NAME, PATH, ICON, MATCH, RANK, STATUS = range(6)
+    INDEX_CHUNK = 500
+
+    def __init__(self, store, treeview=None):
+        self.store = store
+        self.treeview = treeview
+        self.rows = {}
+        self.index = SearchIndex()
+        self.pending = {}
+        self.indexing = None
+        self.query = ''
+        self.matches = {}
+        # Bütünlük doğrulamasında sorun çıkan satırlar: yol -> durum
+        self.flags = {}
+        self.filter = store.filter_new()
+        self.filter.set_visible_column(self.MATCH)
+        self.sorted = Gtk.TreeModelSort(model=self.filter)
+        self.sorted.set_sort_column_id(self.RANK, Gtk.SortType.ASCENDING)
+
+    def view(self):
+        return self.sorted if self.query else self.store
+
+    def row_values(self, path, record):
+        rank = self.matches.get(path)
+        return [record['name'], path, record.get('icon') or '', rank is not None, rank or 0, self.flags.get(path, '')]
+
+    def load(self, items):
+        # Toplu yükleme: model görünümden ayrılır, böylece her satır için yeniden çizim olmaz
+        selected = self.selected_path()
+        if self.treeview is not None:
+            self.treeview.set_model(None)
+        self.store.clear()
+        self.rows = {}
+        self.index.clear()
+        self.matches = {}
+        self.pending = {path: record for path, record in items if record.get('name')}
+        if self.query:
+            self.flush_index()
+            self.matches = {path: rank for rank, path in enumerate(self.index.search(self.query))}
+        elif self.pending and self.indexing is None:
+            self.indexing = GLib.idle_add(self.index_step)
+        for path, record in items:
+            if record.get('name'):
+                self.rows[path] = self.store.append(self.row_values(path, record))
+        if self.treeview is not None:
+            self.treeview.set_model(self.view())
+            self.select(selected)
+
+    def index_step(self):
+        for _ in range(min(self.INDEX_CHUNK, len(self.pending))):
+            self.index.add(*self.pending.popitem())
+        if self.pending:
+            return True
+        self.indexing = None
+        return False
+
+    def flush_index(self):
+        while self.pending:
+            self.index.add(*self.pending.popitem())
+
+    def _upsert(self, path, record):
+        if not record.get('name'):
+            self._remove(path)
+            return
+        self.pending.pop(path, None)
+        self.index.add(path, record)
+        treeiter = self.rows.get(path)
+        values = self.row_values(path, record)
+        if treeiter is None:
+            self.rows[path] = self.store.append(values)
+        else:
+            self.store.set(treeiter, [self.NAME, self.PATH, self.ICON], values[:3])
+
+    def _remove(self, path):
+        self.pending.pop(path, None)
+        self.index.remove(path)
+        self.matches.pop(path, None)
+        treeiter = self.rows.pop(path, None)
+        if treeiter is not None:
+            self.store.remove(treeiter)
+
+    def upsert(self, path, record):
+        self._upsert(path, record)
+        self.refilter()
+
+    def remove(self, path):
+        self._remove(path)
+
+    def apply(self, entries, added, changed, removed):
+        for path in removed:
+            self._remove(path)
+        for path in added | changed:
+            self._upsert(path, entries[path])
+        if added or changed:
+            self.refilter()
+
+    def set_flags(self, flags):
+        # Sadece durumu değişen satırlar yazılır
+        for path in self.flags.keys() | flags.keys():
+            treeiter = self.rows.get(path)
+            if treeiter is not None and self.flags.get(path) != flags.get(path):
+                self.store.set_value(treeiter, self.STATUS, flags.get(path, ''))
+        self.flags = dict(flags)
+
+    def set_query(self, query):
+        query = query.strip()
+        if query == self.query:
+            return
+        selected = self.selected_path()
+        was_filtering = bool(self.query)
+        self.query = query
+        with trace.span('search.keystroke') as span:
+            self.refilter()
+            span.set(matches=len(self.matches))
+        if self.treeview is not None and was_filtering != bool(query):
+            self.treeview.set_model(self.view())
+        self.select(selected)
+
+    def refilter(self):
+        # Eski ve yeni eşleşmelerin farkı yazılır: maliyet O(eski + yeni eşleşme)
+        if self.query:
+            self.flush_index()
+        ranked = self.index.search(self.query) if self.query else []
+        matches = {path: rank for rank, path in enumerate(ranked)}
+        for path in self.matches.keys() - matches.keys():
+            treeiter = self.rows.get(path)
+            if treeiter is not None:
+                self.store.set_value(treeiter, self.MATCH, False)
+        for path, rank in matches.items():
+            if self.matches.get(path) != rank:
+                treeiter = self.rows.get(path)
+                if treeiter is not None:
+                    self.store.set(treeiter, [self.RANK, self.MATCH], [rank, True])
+        self.matches = matches
+
+    def view_iter(self, path):
+        # ListStore satırının görünümdeki karşılığı (filtrede gizliyse None)
+        treeiter = self.rows.get(path) if path else None
+        if treeiter is None or not self.query:
+            return treeiter
+        valid, filter_iter = self.filter.convert_child_iter_to_iter(treeiter)
+        if not valid:
+            return None
+        valid, sorted_iter = self.sorted.convert_child_iter_to_iter(filter_iter)
+        return sorted_iter if valid else None
+
+    def selected_path(self):
+        if self.treeview is None:
+            return None
+        model, treeiter = self.treeview.get_selection().get_selected()
+        return model[treeiter][self.PATH] if treeiter else None
+
+    def select(self, path):
+        if self.treeview is None:
+            return
+        treeiter = self.view_iter(path)
+        if treeiter is not None:
+            self.treeview.get_selection().select_iter(treeiter)
+
+
+def detect_lang():
+    try:
+        sys_lang = locale.getlocale()[0]
+    except Exception:
+        sys_lang = None
+    return 'tr' if sys_lang and sys_lang.startswith('tr') else 'en'
+
 
 class AppImageInstaller:
     LOBEHUB_ICONS = [
@@ -49,6 +4191,48 @@ class AppImageInstaller:
             'install_error': 'Kurulum sırasında hata oluştu:',
             'edit_title': 'Uygulama Düzenle',
             'new_title': 'Yeni AppImage Ekle',
+            'installing': 'Kuruluyor...',
+            'saving': 'Kaydediliyor...',
+            'move_source': 'Kopyalamak yerine taşı',
+            'fast_launch': 'Hızlı başlatma (bir kez aç, FUSE kullanma)',
+            'batch': 'Toplu Kur',
+            'batch_title': 'Toplu Kurulum',
+            'batch_summary': '{ok} uygulama kuruldu, {failed} başarısız.',
+            'batch_status': 'Durum',
+            'batch_ok': 'Kuruldu',
+            'not_found': 'Uygulama bulunamadı:',
+            'update': 'Güncelle',
+            'updating': 'Güncelleniyor...',
+            'update_done': 'Güncellendi: {downloaded} indirildi ({size} içinden).',
+            'up_to_date': 'Uygulama zaten güncel.',
+            'update_error': 'Güncelleme sırasında hata oluştu:',
+            'maintenance': 'Bakım',
+            'search': 'Ara (isim, komut, kategori, anahtar kelime)',
+            'scanning': 'Taranıyor...',
+            'maintenance_summary': '{files} dosya tarandı, {size} boşaltılabilir.',
+            'remove_selected': 'Seçilenleri Sil',
+            'removing': 'Siliniyor...',
+            'cleaned': '{size} boşaltıldı.',
+            'manifest_error': 'Bildirim hatası:',
+            'manifest_summary': '{changed} uygulama değişti, {ok} zaten güncel, {failed} başarısız.',
+            'verify': 'Doğrula',
+            'verifying': 'Doğrulanıyor...',
+            'verify_summary': '{checked} uygulama denetlendi ({hashed} dosya okundu), {problems} sorunlu.',
+            'ok': 'Sağlam',
+            'recorded': 'Özet kaydedildi',
+            'missing': 'Dosya yok',
+            'unreadable': 'Okunamıyor',
+            'truncated': 'Eksik kopya',
+            'corrupt': 'Bozuk',
+            'modified': 'Kurulumdan sonra değişmiş',
+            'path': 'Yol',
+            'size': 'Boyut',
+            'broken_entries': 'Bozuk kısayollar',
+            'orphan_appimages': 'Sahipsiz AppImage dosyaları',
+            'orphan_appdirs': 'Sahipsiz açılmış klasörler',
+            'orphan_icons': 'Sahipsiz ikonlar',
+            'unused_blobs': 'Kullanılmayan depo dosyaları',
+            'partial_files': 'Yarım kalmış dosyalar',
         },
         'en': {
             'title': 'AppImage Manager',
@@ -70,21 +4254,57 @@ class AppImageInstaller:
             'install_error': 'Error during installation:',
             'edit_title': 'Edit Application',
             'new_title': 'Add New AppImage',
+            'installing': 'Installing...',
+            'saving': 'Saving...',
+            'move_source': 'Move instead of copy',
+            'fast_launch': 'Fast launch (extract once, no FUSE)',
+            'batch': 'Batch Install',
+            'batch_title': 'Batch Installation',
+            'batch_summary': '{ok} applications installed, {failed} failed.',
+            'batch_status': 'Status',
+            'batch_ok': 'Installed',
+            'not_found': 'Application not found:',
+            'update': 'Update',
+            'updating': 'Updating...',
+            'update_done': 'Updated: downloaded {downloaded} of {size}.',
+            'up_to_date': 'Application is already up to date.',
+            'update_error': 'Error during update:',
+            'maintenance': 'Maintenance',
+            'search': 'Search (name, command, category, keyword)',
+            'scanning': 'Scanning...',
+            'maintenance_summary': '{files} files scanned, {size} can be freed.',
+            'remove_selected': 'Remove Selected',
+            'removing': 'Removing...',
+            'cleaned': '{size} freed.',
+            'manifest_error': 'Manifest error:',
+            'manifest_summary': '{changed} applications changed, {ok} already up to date, {failed} failed.',
+            'verify': 'Verify',
+            'verifying': 'Verifying...',
+            'verify_summary': '{checked} applications checked ({hashed} files read), {problems} with problems.',
+            'ok': 'Intact',
+            'recorded': 'Digest recorded',
+            'missing': 'File missing',
+            'unreadable': 'Unreadable',
+            'truncated': 'Truncated copy',
+            'corrupt': 'Corrupted',
+            'modified': 'Modified since install',
+            'path': 'Path',
+            'size': 'Size',
+            'broken_entries': 'Broken shortcuts',
+            'orphan_appimages': 'Orphaned AppImage files',
+            'orphan_appdirs': 'Orphaned extracted folders',
+            'orphan_icons': 'Orphaned icons',
+            'unused_blobs': 'Unused store files',
+            'partial_files': 'Leftover partial files',
         }
     }
 
     def __init__(self):
-        import locale
-        try:
-            sys_lang = locale.getlocale()[0]
-        except Exception:
-            sys_lang = None
-        self.lang = 'tr' if sys_lang and sys_lang.startswith('tr') else 'en'
+        self.lang = detect_lang()
         self.t = self.LANGS[self.lang]
-        self.ensure_lobehub_icons()
         self.window = Gtk.Window(title=self.t['title'])
         self.window.set_default_size(600, 400)
-        self.window.connect("destroy", Gtk.main_quit)
+        self.window.connect("destroy", self.on_destroy)
         
         vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
         vbox.set_margin_top(20)
@@ -94,17 +4314,42 @@ class AppImageInstaller:
         self.window.add(vbox)
 
         # Uygulama listesi (tek seçimli)
-        self.app_liststore = Gtk.ListStore(str, str)  # (Uygulama Adı, Desktop Dosyası Yolu)
-        self.load_applications()
+        self.app_liststore = Gtk.ListStore(str, str, str, bool, int, str)  # (Uygulama Adı, Desktop Dosyası Yolu, İkon, Eşleşme, Sıra, Bütünlük)
+        self.catalog = AppCatalog().load()
+        self.app_model = AppListModel(self.app_liststore)
         self.treeview = Gtk.TreeView(model=self.app_liststore)
+        self.app_model.treeview = self.treeview
+        self.load_applications()
+        self.watcher = AppWatcher(self.catalog.apps_dir, self.on_watched_files_changed)
+        self.watch_install_folders()
         self.treeview.get_selection().set_mode(Gtk.SelectionMode.SINGLE)
+        # Satır satır tarayan yerleşik arama yerine dizinli arama kutusu kullanılır
+        self.treeview.set_enable_search(False)
+        self.search_entry = Gtk.SearchEntry()
+        self.search_entry.set_placeholder_text(self.t['search'])
+        self.search_entry.connect("search-changed", lambda entry: self.app_model.set_query(entry.get_text()))
+        vbox.pack_start(self.search_entry, False, True, 0)
+        # İkonlar sadece çizilen (görünür) satırlar için, arka planda yüklenir
+        self.thumbnails = ThumbnailCache(on_ready=self.on_thumbnail_ready)
+        self.thumbnail_redraw = False
+        self.placeholder_icon = None
+        icon_renderer = Gtk.CellRendererPixbuf()
+        icon_renderer.set_fixed_size(self.thumbnails.size + 4, self.thumbnails.size + 4)
         renderer = Gtk.CellRendererText()
-        self.column = Gtk.TreeViewColumn(self.t['installed_apps'], renderer, text=0)
+        self.column = Gtk.TreeViewColumn(self.t['installed_apps'])
+        self.column.pack_start(icon_renderer, False)
+        self.column.pack_start(renderer, True)
+        self.column.set_cell_data_func(icon_renderer, self.render_icon)
+        self.column.set_cell_data_func(renderer, self.render_name)
+        self.column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
         self.treeview.append_column(self.column)
+        # Sabit satır yüksekliği: uzun listelerde kaydırma sırasında satır ölçümü yapılmaz
+        self.treeview.set_fixed_height_mode(True)
         self.treeview.get_selection().connect("changed", self.on_app_selected)
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_min_content_height(200)
         scrolled.add(self.treeview)
+        scrolled.get_vadjustment().connect("value-changed", self.on_list_scrolled)
         vbox.pack_start(scrolled, True, True, 0)
 
         # Butonlar
@@ -117,9 +4362,22 @@ class AppImageInstaller:
         self.delete_button.set_sensitive(False)
         self.delete_button.connect("clicked", self.delete_selected_app)
         button_box.pack_start(self.delete_button, False, True, 0)
+        self.update_button = Gtk.Button(label=self.t['update'])
+        self.update_button.set_sensitive(False)
+        self.update_button.connect("clicked", self.update_selected_app)
+        button_box.pack_start(self.update_button, False, True, 0)
         self.new_button = Gtk.Button(label=self.t['new'])
         self.new_button.connect("clicked", self.new_appimage_dialog)
         button_box.pack_start(self.new_button, False, True, 0)
+        self.batch_button = Gtk.Button(label=self.t['batch'])
+        self.batch_button.connect("clicked", self.batch_install_dialog)
+        button_box.pack_start(self.batch_button, False, True, 0)
+        self.maintenance_button = Gtk.Button(label=self.t['maintenance'])
+        self.maintenance_button.connect("clicked", self.maintenance_dialog)
+        button_box.pack_start(self.maintenance_button, False, True, 0)
+        self.verify_button = Gtk.Button(label=self.t['verify'])
+        self.verify_button.connect("clicked", self.verify_dialog)
+        button_box.pack_start(self.verify_button, False, True, 0)
         vbox.pack_start(button_box, False, True, 0)
 
         # Dil seçici sağ alt
@@ -138,15 +4396,95 @@ class AppImageInstaller:
 
         self.selected_app = None
         self.window.show_all()
+        self.ensure_lobehub_icons()
     
+    def on_destroy(self, window):
+        self.watcher.close()
+        self.thumbnails.prune_disk()
+        Gtk.main_quit()
+
+    def watch_install_folders(self, paths=None):
+        # paths verilirse sadece bu .desktop kayıtlarının klasörlerine bakılır (katalog taranmaz)
+        if paths is None:
+            folders = {self.catalog.apps_dir, default_install_dir()}
+            records = self.catalog.entries.values()
+        else:
+            folders = set()
+            records = [self.catalog.entries[path] for path in paths if path in self.catalog.entries]
+        for record in records:
+            if record.get('managed') and record.get('appimage'):
+                folders.add(os.path.dirname(record['appimage']))
+        for folder in folders:
+            self.watcher.watch(folder)
+
+    def on_watched_files_changed(self, paths):
+        # Dışarıdan yapılan değişiklikler: önce .desktop dizini, sonra kurulum klasörlerindeki
+        # AppImage/ikon dosyalarına başvuran satırlar güncellenir
+        added, changed, removed = self.refresh_applications()
+        targets = {path for path in paths if os.path.dirname(path) != self.catalog.apps_dir}
+        if targets:
+            for path, record in self.catalog.entries.items():
+                if path not in added | changed and (record.get('appimage') in targets or record.get('icon') in targets):
+                    self.app_model.upsert(path, record)
+        # Kurulum klasörü sadece yeni/değişen kayıtlarla değişebilir
+        if added or changed:
+            self.watch_install_folders(added | changed)
+        return False
+
+    def render_icon(self, column, cell, model, treeiter, data=None):
+        pixbuf = self.thumbnails.get(model.get_value(treeiter, 2))
+        if pixbuf is None:
+            if self.placeholder_icon is None:
+                try:
+                    self.placeholder_icon = Gtk.IconTheme.get_default().load_icon('application-x-executable', self.thumbnails.size, 0)
+                except GLib.Error:
+                    self.placeholder_icon = False
+            pixbuf = self.placeholder_icon or None
+        cell.set_property('pixbuf', pixbuf)
+
+    def render_name(self, column, cell, model, treeiter, data=None):
+        # Bütünlük sorunu olan uygulama adının yanında durum kırmızıyla gösterilir
+        status = model.get_value(treeiter, AppListModel.STATUS)
+        name = model.get_value(treeiter, AppListModel.NAME)
+        cell.set_property('text', f"{name}  ⚠ {self.t.get(status, status)}" if status else name)
+        cell.set_property('foreground-set', bool(status))
+        if status:
+            cell.set_property('foreground', 'red')
+
+    def on_thumbnail_ready(self):
+        # Art arda biten ikonlar için tek yeniden çizim
+        if not self.thumbnail_redraw:
+            self.thumbnail_redraw = True
+            GLib.timeout_add(30, self.redraw_thumbnails)
+
+    def redraw_thumbnails(self):
+        self.thumbnail_redraw = False
+        self.treeview.queue_draw()
+        return False
+
+    def on_list_scrolled(self, adjustment):
+        visible = self.treeview.get_visible_range()
+        if not visible or visible[-1] is None:
+            return
+        start, end = visible[-2:]
+        model = self.treeview.get_model()
+        icons = [model[path][2] for path in range(start.get_indices()[0], end.get_indices()[0] + 1)]
+        self.thumbnails.retain(icons)
+
     def on_lang_changed(self, combo):
         self.lang = combo.get_active_id()
         self.t = self.LANGS[self.lang]
         self.window.set_title(self.t['title'])
         self.column.set_title(self.t['installed_apps'])
+        self.search_entry.set_placeholder_text(self.t['search'])
         self.edit_button.set_label(self.t['edit'])
         self.delete_button.set_label(self.t['delete'])
+        self.update_button.set_label(self.t['update'])
         self.new_button.set_label(self.t['new'])
+        self.batch_button.set_label(self.t['batch'])
+        self.maintenance_button.set_label(self.t['maintenance'])
+        self.verify_button.set_label(self.t['verify'])
+        self.treeview.queue_draw()
         # Arayüzdeki diğer metinler dialog açıldığında güncellenecek
 
     def on_app_selected(self, selection):
@@ -154,10 +4492,12 @@ class AppImageInstaller:
         if treeiter:
             self.edit_button.set_sensitive(True)
             self.delete_button.set_sensitive(True)
+            self.update_button.set_sensitive(True)
             self.selected_app = model[treeiter][1]
         else:
             self.edit_button.set_sensitive(False)
             self.delete_button.set_sensitive(False)
+            self.update_button.set_sensitive(False)
             self.selected_app = None
 
     def new_appimage_dialog(self, widget):
@@ -203,7 +4543,7 @@ class AppImageInstaller:
         folder_box.pack_start(folder_label, False, True, 0)
         folder_entry = Gtk.Entry()
         folder_entry.set_editable(False)
-        default_folder = os.path.expanduser("~/App")
+        default_folder = default_install_dir()
         folder_entry.set_text(default_folder)
         folder_box.pack_start(folder_entry, True, True, 0)
         folder_button = Gtk.Button(label="Klasör Seç")
@@ -217,7 +4557,26 @@ class AppImageInstaller:
                 folder_entry.set_text(file_dialog.get_filename())
             file_dialog.destroy()
         folder_button.connect("clicked", select_folder)
+        # Kaynağı taşıma seçeneği (aynı dosya sisteminde kopyalama yapılmaz)
+        move_check = Gtk.CheckButton(label=self.t['move_source'])
+        vbox.pack_start(move_check, False, True, 0)
+        extract_check = Gtk.CheckButton(label=self.t['fast_launch'])
+        vbox.pack_start(extract_check, False, True, 0)
         # Seçim fonksiyonları
+        # AppImage içinden okunan bilgiler (isim, ikon, kategoriler) boş alanları doldurur
+        metadata = {}
+
+        def fill_metadata(path, meta):
+            if appimage_entry.get_text() != path:
+                return False
+            metadata.clear()
+            metadata.update(meta)
+            if meta.get('name') and not name_entry.get_text().strip():
+                name_entry.set_text(meta['name'])
+            if meta.get('icon') and not icon_entry.get_text():
+                icon_entry.set_text(meta['icon'])
+            return False
+
         def select_appimage(btn):
             file_dialog = Gtk.FileChooserDialog(title="AppImage Dosyası Seç", parent=dialog, action=Gtk.FileChooserAction.OPEN)
             file_dialog.add_buttons(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL, Gtk.STOCK_OPEN, Gtk.ResponseType.OK)
@@ -227,7 +4586,9 @@ class AppImageInstaller:
             file_dialog.add_filter(filter_appimage)
             response = file_dialog.run()
             if response == Gtk.ResponseType.OK:
-                appimage_entry.set_text(file_dialog.get_filename())
+                path = file_dialog.get_filename()
+                appimage_entry.set_text(path)
+                threading.Thread(target=lambda: GLib.idle_add(fill_metadata, path, appimage_metadata(path)), daemon=True).start()
             file_dialog.destroy()
         def select_icon(btn):
             file_dialog = Gtk.FileChooserDialog(title="İkon Dosyası Seç", parent=dialog, action=Gtk.FileChooserAction.OPEN)
@@ -253,122 +4614,302 @@ class AppImageInstaller:
             appimage_path = appimage_entry.get_text()
             icon_path = icon_entry.get_text()
             target_folder = folder_entry.get_text().strip()
-            if not app_name or not appimage_path or not icon_path or not target_folder:
+            # İkon boş bırakılırsa AppImage içindeki ikon kullanılır
+            if not app_name or not appimage_path or not target_folder:
                 error = Gtk.MessageDialog(parent=self.window, flags=0, message_type=Gtk.MessageType.ERROR, buttons=Gtk.ButtonsType.OK, text=self.t['fill_all'])
                 error.run()
                 error.destroy()
             else:
-                self.install_appimage_paths(appimage_path, icon_path, app_name, target_folder)
+                self.install_appimage_paths(appimage_path, icon_path, app_name, target_folder, move_check.get_active(),
+                                            metadata.get('categories'), extract_check.get_active())
         dialog.destroy()
 
-    def install_appimage_paths(self, appimage_path, icon_path, app_name=None, install_dir=None):
-        if not app_name:
-            app_name = os.path.splitext(os.path.basename(appimage_path))[0]
-        if not install_dir:
-            home_dir = os.path.expanduser("~")
-            install_dir = os.path.join(home_dir, "App")
-        desktop_dir = os.path.expanduser("~/.local/share/applications")
-        try:
-            os.makedirs(install_dir, exist_ok=True)
-            appimage_dest = os.path.join(install_dir, f"{app_name}.AppImage")
-            shutil.copy2(appimage_path, appimage_dest)
-            os.chmod(appimage_dest, 0o755)
-            icon_ext = os.path.splitext(icon_path)[1]
-            icon_dest = os.path.join(install_dir, f"{app_name}{icon_ext}")
-            shutil.copy2(icon_path, icon_dest)
-            desktop_content = f"""[Desktop Entry]\nName={app_name}\nExec={appimage_dest}\nIcon={icon_dest}\nType=Application\nCategories=Development;\n"""
-            desktop_file = os.path.join(desktop_dir, f"{app_name}.desktop")
-            os.makedirs(desktop_dir, exist_ok=True)
-            with open(desktop_file, 'w') as f:
-                f.write(desktop_content)
-            os.chmod(desktop_file, 0o755)
-            self.load_applications()
-            dialog = Gtk.MessageDialog(parent=self.window, flags=0, message_type=Gtk.MessageType.INFO, buttons=Gtk.ButtonsType.OK, text=self.t['install_success'])
-            dialog.run()
-            dialog.destroy()
-        except Exception as e:
-            dialog = Gtk.MessageDialog(parent=self.window, flags=0, message_type=Gtk.MessageType.ERROR, buttons=Gtk.ButtonsType.OK, text=f"{self.t['install_error']} {str(e)}")
-            dialog.run()
+    def batch_install_dialog(self, widget):
+        file_dialog = Gtk.FileChooserDialog(title=self.t['batch_title'], parent=self.window, action=Gtk.FileChooserAction.OPEN)
+        file_dialog.add_buttons(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL, Gtk.STOCK_OPEN, Gtk.ResponseType.OK)
+        file_dialog.set_select_multiple(True)
+        filter_appimage = Gtk.FileFilter()
+        filter_appimage.set_name("AppImage dosyaları")
+        filter_appimage.add_pattern("*.AppImage")
+        file_dialog.add_filter(filter_appimage)
+        response = file_dialog.run()
+        paths = file_dialog.get_filenames() if response == Gtk.ResponseType.OK else []
+        file_dialog.destroy()
+        if paths:
+            self.batch_install_paths(paths)
+
+    def batch_install_paths(self, paths, install_dir=None):
+        def job(report, cancel):
+            return batch_install(paths, install_dir, report, cancel)
+
+        def done(results, error):
+            # Liste tek seferde yenilenir
+            self.refresh_applications()
+            self.watch_install_folders()
+            if error is not None:
+                if not isinstance(error, CopyCancelled):
+                    self.show_message(Gtk.MessageType.ERROR, f"{self.t['install_error']} {str(error)}")
+                return
+            self.show_batch_summary(results)
+        self.run_with_progress(self.t['installing'], job, done)
+
+    def show_batch_summary(self, results):
+        failed = [item for item in results if item['error']]
+        dialog = Gtk.Dialog(title=self.t['batch_title'], parent=self.window, flags=0)
+        dialog.set_default_size(500, 350)
+        dialog.add_button("OK", Gtk.ResponseType.OK)
+        box = dialog.get_content_area()
+        box.set_spacing(10)
+        box.set_margin_top(10)
+        box.set_margin_bottom(10)
+        box.set_margin_start(10)
+        box.set_margin_end(10)
+        summary = self.t['batch_summary'].format(ok=len(results) - len(failed), failed=len(failed))
+        box.pack_start(Gtk.Label(label=summary), False, True, 0)
+        store = Gtk.ListStore(str, str)
+        for item in results:
+            store.append([item['name'], item['error'] or self.t['batch_ok']])
+        treeview = Gtk.TreeView(model=store)
+        treeview.append_column(Gtk.TreeViewColumn(self.t['app_name'], Gtk.CellRendererText(), text=0))
+        treeview.append_column(Gtk.TreeViewColumn(self.t['batch_status'], Gtk.CellRendererText(), text=1))
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.add(treeview)
+        box.pack_start(scrolled, True, True, 0)
+        dialog.show_all()
+        dialog.run()
+        dialog.destroy()
+
+    def maintenance_dialog(self, widget):
+        # Tarama arka planda; ana döngü sadece sonucu gösterir
+        def job(report, cancel):
+            return scan_orphans(report=report)
+
+        def done(result, error):
+            if error is not None:
+                self.show_message(Gtk.MessageType.ERROR, str(error))
+                return
+            self.show_maintenance_results(result)
+        self.run_with_progress(self.t['scanning'], job, done)
+
+    def show_maintenance_results(self, result):
+        dialog = Gtk.Dialog(title=self.t['maintenance'], parent=self.window, flags=0)
+        dialog.set_default_size(650, 400)
+        dialog.add_button(self.t['cancel'], Gtk.ResponseType.CANCEL)
+        dialog.add_button(self.t['remove_selected'], Gtk.ResponseType.OK)
+        box = dialog.get_content_area()
+        box.set_spacing(10)
+        box.set_margin_top(10)
+        box.set_margin_bottom(10)
+        box.set_margin_start(10)
+        box.set_margin_end(10)
+        summary = self.t['maintenance_summary'].format(files=result['files'], size=format_size(result['bytes']))
+        box.pack_start(Gtk.Label(label=summary), False, True, 0)
+        # Kategori satırları altında öğeler: (seçili, metin, boyut, öğe sırası)
+        store = Gtk.TreeStore(bool, str, str, int)
+        items = []
+        for name in ORPHAN_CATEGORIES:
+            category = result['categories'][name]
+            if not category['items']:
+                continue
+            # Hiçbir şey önceden seçili gelmez; kullanıcı silinecekleri kendisi işaretler
+            parent = store.append(None, [False, f"{self.t[name]} ({len(category['items'])})", format_size(category['bytes']), -1])
+            for item in category['items']:
+                store.append(parent, [False, item['path'], format_size(item['bytes']), len(items)])
+                items.append(item)
+        treeview = Gtk.TreeView(model=store)
+        toggle = Gtk.CellRendererToggle()
+
+        def toggled(renderer, path):
+            treeiter = store.get_iter(path)
+            value = not store[treeiter][0]
+            store[treeiter][0] = value
+            child = store.iter_children(treeiter)
+            while child is not None:
+                store[child][0] = value
+                child = store.iter_next(child)
+        toggle.connect("toggled", toggled)
+        treeview.append_column(Gtk.TreeViewColumn("", toggle, active=0))
+        treeview.append_column(Gtk.TreeViewColumn(self.t['path'], Gtk.CellRendererText(), text=1))
+        treeview.append_column(Gtk.TreeViewColumn(self.t['size'], Gtk.CellRendererText(), text=2))
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.add(treeview)
+        box.pack_start(scrolled, True, True, 0)
+        dialog.set_response_sensitive(Gtk.ResponseType.OK, bool(items))
+        dialog.show_all()
+        response = dialog.run()
+        selected = []
+        store.foreach(lambda model, path, treeiter: selected.append(items[model[treeiter][3]])
+                      if model[treeiter][3] >= 0 and model[treeiter][0] else None)
+        dialog.destroy()
+        if response != Gtk.ResponseType.OK or not selected:
+            return
+
+        def job(report, cancel):
+            return remove_orphans(selected, report)
+
+        def done(freed, error):
+            self.refresh_applications()
+            if error is not None:
+                self.show_message(Gtk.MessageType.ERROR, f"{self.t['delete_error']} {str(error)}")
+            else:
+                self.show_message(Gtk.MessageType.INFO, self.t['cleaned'].format(size=format_size(freed)))
+        self.run_with_progress(self.t['removing'], job, done)
+
+    def verify_dialog(self, widget):
+        # Arka planda doğrular; sorunlu uygulamalar listede işaretlenir ve özet gösterilir
+        def job(report, cancel):
+            return verify_apps(AppCatalog().load(), report=report, cancel=cancel)
+
+        def done(results, error):
+            if error is not None:
+                if not isinstance(error, CopyCancelled):
+                    self.show_message(Gtk.MessageType.ERROR, str(error))
+                return
+            problems = [item for item in results if item['status'] in INTEGRITY_PROBLEMS]
+            self.app_model.set_flags({item['desktop']: item['status'] for item in problems})
+            lines = [self.t['verify_summary'].format(checked=len(results), hashed=len([item for item in results if not item['cached']]),
+                                                     problems=len(problems))]
+            lines += [f"{item['name']}: {self.t[item['status']]}" for item in problems]
+            self.show_message(Gtk.MessageType.WARNING if problems else Gtk.MessageType.INFO, "\n".join(lines))
+        self.run_with_progress(self.t['verifying'], job, done)
+
+    def install_appimage_paths(self, appimage_path, icon_path, app_name=None, install_dir=None, move=False, categories=None, extract=False):
+        def job(report, cancel):
+            return install_app(appimage_path, icon_path, app_name, install_dir, report, cancel, move, categories, extract)
+
+        def done(result, error):
+            self.refresh_applications()
+            if error is None:
+                self.watcher.watch(os.path.dirname(read_desktop_entry(result).get('appimage') or ''))
+                self.show_message(Gtk.MessageType.INFO, self.t['install_success'])
+            elif not isinstance(error, CopyCancelled):
+                self.show_message(Gtk.MessageType.ERROR, f"{self.t['install_error']} {str(error)}")
+        self.run_with_progress(self.t['installing'], job, done)
+
+    def show_message(self, message_type, text):
+        dialog = Gtk.MessageDialog(parent=self.window, flags=0, message_type=message_type, buttons=Gtk.ButtonsType.OK, text=text)
+        dialog.run()
+        dialog.destroy()
+
+    def run_with_progress(self, title, job, on_done):
+        # job(report, cancel) arka planda çalışır; ilerleme ana döngüye en fazla ~20 kez/sn
+        # iletilir. İptal düğmesi cancel olayını kurar, kopyalama CopyCancelled ile durur.
+        cancel = threading.Event()
+        dialog = Gtk.Dialog(title=title, parent=self.window, flags=Gtk.DialogFlags.MODAL)
+        dialog.set_default_size(400, -1)
+        dialog.add_button(self.t['cancel'], Gtk.ResponseType.CANCEL)
+        dialog.connect("response", lambda d, response: cancel.set())
+        dialog.connect("delete-event", lambda d, event: cancel.set() or True)
+        progress_bar = Gtk.ProgressBar()
+        progress_bar.set_show_text(True)
+        box = dialog.get_content_area()
+        box.set_spacing(10)
+        box.set_margin_top(10)
+        box.set_margin_bottom(10)
+        box.set_margin_start(10)
+        box.set_margin_end(10)
+        box.pack_start(progress_bar, False, True, 0)
+        dialog.show_all()
+        state = {'last': 0.0, 'pending': False}
+        lock = threading.Lock()
+
+        def update(fraction, label):
+            with lock:
+                state['pending'] = False
+            progress_bar.set_fraction(min(max(fraction, 0.0), 1.0))
+            progress_bar.set_text(os.path.basename(label) if label else "")
+            return False
+
+        def report(fraction, label=None):
+            now = time.monotonic()
+            with lock:
+                if state['pending'] or (now - state['last'] < 0.05 and fraction < 1.0):
+                    return
+                state['last'] = now
+                state['pending'] = True
+            GLib.idle_add(update, fraction, label)
+
+        def finish(result, error):
             dialog.destroy()
+            on_done(result, error)
+            return False
+
+        def worker():
+            try:
+                result = job(report, cancel)
+            except BaseException as e:
+                GLib.idle_add(finish, None, e)
+            else:
+                GLib.idle_add(finish, result, None)
+        threading.Thread(target=worker, name="worker", daemon=True).start()
 
     def load_applications(self):
-        self.app_liststore.clear()
-        desktop_dir = os.path.expanduser("~/.local/share/applications")
-        if not os.path.exists(desktop_dir):
-            return
-        for fname in os.listdir(desktop_dir):
-            if fname.endswith(".desktop"):
-                path = os.path.join(desktop_dir, fname)
-                try:
-                    with open(path, 'r') as f:
-                        for line in f:
-                            if line.startswith("Name="):
-                                app_name = line.strip().split('=', 1)[1]
-                                self.app_liststore.append([app_name, path])
-                                break
-                except Exception:
-                    continue
+        with trace.span('list.load') as span:
+            self.catalog.refresh()
+            self.app_model.flags = integrity_flags(self.catalog)
+            self.app_model.load(self.catalog.entries.items())
+            span.set(parsed=self.catalog.parsed, rows=len(self.app_model.rows))
+
+    def refresh_applications(self):
+        # Sadece değişen .desktop dosyalarına karşılık gelen satırları güncelle
+        with trace.span('list.refresh') as span:
+            added, changed, removed = self.catalog.refresh()
+            self.app_model.apply(self.catalog.entries, added, changed, removed)
+            # Kurulum/düzenleme/güncelleme kaydı yeniler; işaretler buna göre düşer
+            self.app_model.set_flags(integrity_flags(self.catalog))
+            span.set(parsed=self.catalog.parsed, added=len(added), changed=len(changed), removed=len(removed))
+        return added, changed, removed
 
     def delete_selected_app(self, widget):
         if not hasattr(self, 'selected_app') or not self.selected_app:
             return
-        # .desktop dosyasını oku, ilgili AppImage ve ikon dosyasını bul
-        appimage_path = None
-        icon_path = None
-        try:
-            with open(self.selected_app, 'r') as f:
-                for line in f:
-                    if line.startswith('Exec='):
-                        appimage_path = line.strip().split('=', 1)[1]
-                    if line.startswith('Icon='):
-                        icon_path = line.strip().split('=', 1)[1]
-            # Dosyaları sil
-            if appimage_path and os.path.exists(appimage_path):
-                os.remove(appimage_path)
-            if icon_path and os.path.exists(icon_path):
-                os.remove(icon_path)
-            os.remove(self.selected_app)
-            self.load_applications()
-            dialog = Gtk.MessageDialog(
-                parent=self.window,
-                flags=0,
-                message_type=Gtk.MessageType.INFO,
-                buttons=Gtk.ButtonsType.OK,
-                text=self.t['delete_success']
-            )
-            dialog.run()
-            dialog.destroy()
-        except Exception as e:
-            dialog = Gtk.MessageDialog(
-                parent=self.window,
-                flags=0,
-                message_type=Gtk.MessageType.ERROR,
-                buttons=Gtk.ButtonsType.OK,
-                text=f"{self.t['delete_error']} {str(e)}"
-            )
-            dialog.run()
-            dialog.destroy()
+        desktop_file = self.selected_app
+
+        # Silme ve menü/ikon önbelleklerinin yenilenmesi arka planda yapılır; liste done'da,
+        # ana döngüde (GLib.idle_add) güncellenir
+        def job(report, cancel):
+            return remove_app(desktop_file)
+
+        def done(result, error):
+            self.refresh_applications()
+            if error is None:
+                self.show_message(Gtk.MessageType.INFO, self.t['delete_success'])
+            else:
+                self.show_message(Gtk.MessageType.ERROR, f"{self.t['delete_error']} {str(error)}")
+        self.run_with_progress(self.t['removing'], job, done)
+
+    def update_selected_app(self, widget):
+        if not self.selected_app:
+            return
+        desktop_file = self.selected_app
+
+        def job(report, cancel):
+            return update_app(desktop_file, report, cancel)
+
+        def done(result, error):
+            if error is None:
+                if result['updated']:
+                    self.show_message(Gtk.MessageType.INFO, self.t['update_done'].format(
+                        downloaded=format_size(result['downloaded']), size=format_size(result['size'])))
+                else:
+                    self.show_message(Gtk.MessageType.INFO, self.t['up_to_date'])
+            elif not isinstance(error, CopyCancelled):
+                self.show_message(Gtk.MessageType.ERROR, f"{self.t['update_error']} {str(error)}")
+        self.run_with_progress(self.t['updating'], job, done)
 
     def edit_selected_app(self, widget):
         if not hasattr(self, 'selected_app') or not self.selected_app:
             return
         # .desktop dosyasını oku, mevcut AppImage, ikon ve isim bilgisini bul
-        appimage_path = None
-        icon_path = None
-        app_name = None
-        app_folder = None
-        try:
-            with open(self.selected_app, 'r') as f:
-                for line in f:
-                    if line.startswith('Exec='):
-                        appimage_path = line.strip().split('=', 1)[1]
-                        app_folder = os.path.dirname(appimage_path)
-                    if line.startswith('Icon='):
-                        icon_path = line.strip().split('=', 1)[1]
-                    if line.startswith('Name='):
-                        app_name = line.strip().split('=', 1)[1]
-        except Exception:
+        if not os.path.exists(self.selected_app):
+            self.show_message(Gtk.MessageType.ERROR, f"{self.t['not_found']} {self.selected_app}")
+            self.refresh_applications()
             return
+        entry = read_desktop_entry(self.selected_app)
+        appimage_path = entry.get('appimage')
+        icon_path = entry.get('icon')
+        app_name = entry.get('name')
+        app_folder = os.path.dirname(appimage_path) if appimage_path else None
         # Düzenleme penceresi
         dialog = Gtk.Dialog(title=self.t['edit_title'], parent=self.window, flags=0)
         dialog.set_default_size(400, 300)
@@ -415,7 +4956,7 @@ class AppImageInstaller:
         folder_box.pack_start(folder_label, False, True, 0)
         folder_entry = Gtk.Entry()
         folder_entry.set_editable(False)
-        folder_entry.set_text(app_folder or os.path.expanduser("~/App"))
+        folder_entry.set_text(app_folder or default_install_dir())
         folder_box.pack_start(folder_entry, True, True, 0)
         folder_button = Gtk.Button(label="Klasör Seç")
         folder_box.pack_start(folder_button, False, True, 0)
@@ -428,6 +4969,10 @@ class AppImageInstaller:
                 folder_entry.set_text(file_dialog.get_filename())
             file_dialog.destroy()
         folder_button.connect("clicked", select_folder)
+        # Hızlı başlatma kipi: kaydederken AppImage açılır veya açılmış klasör silinir
+        extract_check = Gtk.CheckButton(label=self.t['fast_launch'])
+        extract_check.set_active(entry.get('mode') == 'extracted')
+        vbox.pack_start(extract_check, False, True, 0)
         # Seçim fonksiyonları
         def select_appimage(btn):
             file_dialog = Gtk.FileChooserDialog(title="AppImage Dosyası Seç", parent=dialog, action=Gtk.FileChooserAction.OPEN)
@@ -464,59 +5009,325 @@ class AppImageInstaller:
             new_appimage = appimage_entry.get_text().strip()
             new_icon = icon_entry.get_text().strip()
             new_folder = folder_entry.get_text().strip()
-            if not new_name or not new_appimage or not new_icon or not new_folder:
+            # İkon isteğe bağlı: toplu kurulan uygulamaların ikonu olmayabilir
+            if not new_name or not new_appimage or not new_folder:
                 error = Gtk.MessageDialog(parent=self.window, flags=0, message_type=Gtk.MessageType.ERROR, buttons=Gtk.ButtonsType.OK, text=self.t['fill_all'])
                 error.run()
                 error.destroy()
             else:
-                # Dosyaları kopyala ve .desktop dosyasını güncelle
-                install_dir = new_folder
-                os.makedirs(install_dir, exist_ok=True)
-                appimage_dest = os.path.join(install_dir, f"{new_name}.AppImage")
-                shutil.copy2(new_appimage, appimage_dest)
-                os.chmod(appimage_dest, 0o755)
-                icon_ext = os.path.splitext(new_icon)[1]
-                icon_dest = os.path.join(install_dir, f"{new_name}{icon_ext}")
-                shutil.copy2(new_icon, icon_dest)
-                # .desktop dosyasını güncelle
-                desktop_content = f"""[Desktop Entry]\nName={new_name}\nExec={appimage_dest}\nIcon={icon_dest}\nType=Application\nCategories=Development;\n"""
-                desktop_file = os.path.join(os.path.expanduser("~/.local/share/applications"), f"{new_name}.desktop")
-                with open(desktop_file, 'w') as f:
-                    f.write(desktop_content)
-                os.chmod(desktop_file, 0o755)
-                # Eski .desktop ve dosyaları sil (isim değiştiyse)
-                if os.path.abspath(desktop_file) != os.path.abspath(self.selected_app):
-                    try:
-                        os.remove(self.selected_app)
-                    except Exception:
-                        pass
-                    # Eski AppImage ve ikon dosyalarını sil
-                    old_appimage = appimage_path
-                    old_icon = icon_path
-                    if old_appimage and os.path.exists(old_appimage):
-                        try:
-                            os.remove(old_appimage)
-                        except Exception:
-                            pass
-                    if old_icon and os.path.exists(old_icon):
-                        try:
-                            os.remove(old_icon)
-                        except Exception:
-                            pass
-                self.load_applications()
+                # Dosyaları arka planda kopyala ve .desktop dosyasını güncelle
+                desktop_file = self.selected_app
+                extract = extract_check.get_active()
+
+                def job(report, cancel):
+                    return edit_app(desktop_file, new_name, new_appimage, new_icon, new_folder, report, cancel, extract)
+
+                def done(result, error):
+                    self.refresh_applications()
+                    if error is None:
+                        self.watcher.watch(new_folder)
+                    elif not isinstance(error, CopyCancelled):
+                        self.show_message(Gtk.MessageType.ERROR, f"{self.t['install_error']} {str(error)}")
+                self.run_with_progress(self.t['saving'], job, done)
         dialog.destroy()
 
     def ensure_lobehub_icons(self):
-        self.icons_dir = os.path.expanduser("~/.local/share/appimage_installer/icons")
-        os.makedirs(self.icons_dir, exist_ok=True)
-        for name, url in self.LOBEHUB_ICONS:
-            icon_path = os.path.join(self.icons_dir, f"{name}.png")
-            if not os.path.exists(icon_path):
-                try:
-                    urllib.request.urlretrieve(url, icon_path)
-                except Exception:
-                    pass
+        # İkonlar ~/.local/share/appimage_installer/icons altına arka planda indirilir,
+        # pencere beklemeden açılır
+        self.icons_dir = os.path.join(data_dir(), "icons")
+        self.icon_fetcher = IconFetcher(self.LOBEHUB_ICONS, self.icons_dir)
+        self.icon_fetcher.start()
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_USAGE = 2
+EXIT_NOT_FOUND = 3
+
+
+def find_app(catalog, ident):
+    # .desktop yolu, dosya adı veya uygulama adıyla (önce tam, sonra büyük/küçük harf duyarsız) arar
+    if ident in catalog.entries:
+        return ident
+    matches = [path for path, record in catalog.entries.items()
+               if os.path.basename(path) in (ident, f"{ident}.desktop") or record.get('name') == ident]
+    if not matches:
+        lowered = ident.lower()
+        matches = [path for path, record in catalog.entries.items() if (record.get('name') or '').lower() == lowered]
+    managed = [path for path in matches if catalog.entries[path].get('managed')]
+    return (managed or matches or [None])[0]
+
+
+def app_record(path, record):
+    return {
+        'name': record.get('name'),
+        'desktop': path,
+        'exec': record.get('exec'),
+        'appimage': record.get('appimage'),
+        'mode': record.get('mode'),
+        'icon': record.get('icon'),
+        'managed': bool(record.get('managed')),
+    }
+
+
+class Cli:
+    # GTK yüklemeden çalışan komut satırı: install / list / remove / edit / update / clean / export / apply / verify
+    def __init__(self, json_output=False):
+        self.json_output = json_output
+        self.t = AppImageInstaller.LANGS[detect_lang()]
+
+    def emit(self, data, text):
+        if self.json_output:
+            print(json.dumps(data, ensure_ascii=False, indent=1))
+        elif text:
+            print(text)
+
+    def fail(self, message, code=EXIT_ERROR):
+        if self.json_output:
+            print(json.dumps({'ok': False, 'error': message}, ensure_ascii=False))
+        else:
+            print(message, file=sys.stderr)
+        return code
+
+    def catalog(self):
+        catalog = AppCatalog().load()
+        catalog.refresh()
+        return catalog
+
+    def cmd_list(self, args):
+        catalog = self.catalog()
+        apps = sorted((app_record(path, record) for path, record in catalog.entries.items()
+                       if record.get('name') and (args.all or record.get('managed'))),
+                      key=lambda app: app['name'].lower())
+        self.emit(apps, "\n".join(f"{app['name']}\t{app['exec'] or ''}" for app in apps))
+        return EXIT_OK
+
+    def cmd_install(self, args):
+        paths = args.appimage
+        if len(paths) > 1 or os.path.isdir(paths[0]):
+            if args.icon or args.name:
+                return self.fail("--icon/--name can only be used with a single AppImage", EXIT_USAGE)
+            results = batch_install(paths, args.dir, workers=args.jobs, move=args.move, extract=args.extract)
+            failed = [item for item in results if item['error']]
+            lines = [f"{item['name']}\t{item['error'] or self.t['batch_ok']}" for item in results]
+            lines.append(self.t['batch_summary'].format(ok=len(results) - len(failed), failed=len(failed)))
+            self.emit({'ok': not failed, 'results': [{k: item[k] for k in ('path', 'name', 'desktop', 'error')} for item in results]},
+                      "\n".join(lines))
+            return EXIT_ERROR if failed else EXIT_OK
+        try:
+            desktop_file = install_app(paths[0], args.icon, args.name, args.dir, move=args.move, extract=args.extract)
+        except Exception as e:
+            return self.fail(f"{self.t['install_error']} {str(e)}")
+        self.emit({'ok': True, 'desktop': desktop_file}, self.t['install_success'])
+        return EXIT_OK
+
+    def cmd_remove(self, args):
+        catalog = self.catalog()
+        path = find_app(catalog, args.app)
+        if path is None:
+            return self.fail(f"{self.t['not_found']} {args.app}", EXIT_NOT_FOUND)
+        try:
+            remove_app(path)
+        except Exception as e:
+            return self.fail(f"{self.t['delete_error']} {str(e)}")
+        catalog.refresh()
+        self.emit({'ok': True, 'desktop': path}, self.t['delete_success'])
+        return EXIT_OK
+
+    def cmd_edit(self, args):
+        catalog = self.catalog()
+        path = find_app(catalog, args.app)
+        if path is None:
+            return self.fail(f"{self.t['not_found']} {args.app}", EXIT_NOT_FOUND)
+        record = catalog.entries[path]
+        current_exec = record.get('appimage')
+        new_name = args.name or record.get('name')
+        new_appimage = args.appimage or current_exec
+        new_icon = args.icon or record.get('icon')
+        new_folder = args.dir or (os.path.dirname(current_exec) if current_exec else default_install_dir())
+        try:
+            desktop_file = edit_app(path, new_name, new_appimage, new_icon, new_folder, extract=args.extract)
+        except Exception as e:
+            return self.fail(f"{self.t['install_error']} {str(e)}")
+        catalog.refresh()
+        self.emit({'ok': True, 'desktop': desktop_file}, desktop_file)
+        return EXIT_OK
+
+    def cmd_update(self, args):
+        catalog = self.catalog()
+        path = find_app(catalog, args.app)
+        if path is None:
+            return self.fail(f"{self.t['not_found']} {args.app}", EXIT_NOT_FOUND)
+        try:
+            result = update_app(path, zsync_url=args.zsync)
+        except Exception as e:
+            return self.fail(f"{self.t['update_error']} {str(e)}")
+        if result['updated']:
+            text = self.t['update_done'].format(downloaded=format_size(result['downloaded']), size=format_size(result['size']))
+        else:
+            text = self.t['up_to_date']
+        self.emit(dict(result, ok=True, desktop=path), text)
+        return EXIT_OK
+
+    def cmd_clean(self, args):
+        # Varsayılan olarak sadece rapor verir; --yes ile bulunanları siler
+        result = scan_orphans(folders=args.dir or None, workers=args.jobs)
+        categories = args.category or list(ORPHAN_CATEGORIES)
+        items = [item for name in categories for item in result['categories'][name]['items']]
+        freed = 0
+        if args.yes and items:
+            try:
+                freed = remove_orphans(items)
+            except Exception as e:
+                return self.fail(f"{self.t['delete_error']} {str(e)}")
+        lines = []
+        for name in categories:
+            category = result['categories'][name]
+            if category['items']:
+                lines.append(f"{self.t[name]}\t{format_size(category['bytes'])}")
+                lines.extend(f"  {item['path']}\t{format_size(item['bytes'])}" for item in category['items'])
+        lines.append(self.t['maintenance_summary'].format(files=result['files'], size=format_size(sum(item['bytes'] for item in items))))
+        if args.yes:
+            lines.append(self.t['cleaned'].format(size=format_size(freed)))
+        self.emit({'ok': True, 'removed': bool(args.yes), 'freed': freed, 'files': result['files'], 'folders': result['folders'],
+                   'categories': {name: result['categories'][name] for name in categories}}, "\n".join(lines))
+        return EXIT_OK
+
+    def cmd_export(self, args):
+        data = export_manifest(self.catalog())
+        text = manifest_text(data, toml=bool(args.file and args.file.endswith('.toml')))
+        if not args.file:
+            print(text, end='')
+            return EXIT_OK
+        try:
+            tmp_path = f"{args.file}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(text)
+            os.replace(tmp_path, args.file)
+        except OSError as e:
+            return self.fail(f"{self.t['manifest_error']} {str(e)}")
+        self.emit({'ok': True, 'file': args.file, 'apps': len(data['apps'])}, args.file)
+        return EXIT_OK
+
+    def cmd_apply(self, args):
+        try:
+            plan = apply_manifest(load_manifest(args.file), workers=args.jobs, dry_run=args.dry_run)
+        except ManifestError as e:
+            return self.fail(f"{self.t['manifest_error']} {str(e)}")
+        failed = [item for item in plan if item['error']]
+        changed = [item for item in plan if item['action'] != 'ok' and not item['error']]
+        results = [{'name': item['name'], 'action': item['action'], 'reason': item['reason'], 'error': item['error']} for item in plan]
+        lines = [f"{item['action']}\t{item['name']}\t{item['error'] or item['reason'] or ''}" for item in plan if item['action'] != 'ok']
+        lines.append(self.t['manifest_summary'].format(changed=len(changed), ok=len(plan) - len(changed) - len(failed), failed=len(failed)))
+        self.emit({'ok': not failed, 'dry_run': args.dry_run, 'results': results}, "\n".join(lines))
+        return EXIT_ERROR if failed else EXIT_OK
+
+    def cmd_verify(self, args):
+        catalog = self.catalog()
+        paths = [find_app(catalog, app) for app in args.app]
+        missing = [app for app, path in zip(args.app, paths) if path is None]
+        if missing:
+            return self.fail(f"{self.t['not_found']} {', '.join(missing)}", EXIT_NOT_FOUND)
+        results = verify_apps(catalog, full=args.full, workers=args.jobs, desktops=set(paths))
+        problems = [item for item in results if item['status'] in INTEGRITY_PROBLEMS]
+        lines = [f"{item['name']}\t{self.t[item['status']]}\t{item['path']}" for item in results
+                 if args.all or item['status'] != 'ok']
+        lines.append(self.t['verify_summary'].format(checked=len(results), hashed=len([item for item in results if not item['cached']]),
+                                                     problems=len(problems)))
+        self.emit({'ok': not problems, 'results': results}, "\n".join(lines))
+        return EXIT_ERROR if problems else EXIT_OK
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="appimage_installer", description="AppImage Manager / AppImage Yönetim")
+    parser.add_argument('--json', action='store_true', help="machine-readable output")
+    trace_help = f"write a performance trace (JSON lines, or Chrome trace format for *.json); also ${Tracer.ENV}"
+    parser.add_argument('--trace', metavar='FILE', help=trace_help)
+    # --json ve --trace alt komuttan sonra da yazılabilsin; verilmezse üst düzeydeki değer kalır
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--json', action='store_true', default=argparse.SUPPRESS, help="machine-readable output")
+    common.add_argument('--trace', metavar='FILE', default=argparse.SUPPRESS, help=trace_help)
+    commands = parser.add_subparsers(dest='command')
+    commands.add_parser('gui', parents=[common], help="start the graphical interface (default)")
+    list_parser = commands.add_parser('list', parents=[common], help="list installed applications")
+    list_parser.add_argument('--all', action='store_true', help="include entries not managed by this tool")
+    install_parser = commands.add_parser('install', parents=[common], help="install one or more AppImages")
+    install_parser.add_argument('appimage', nargs='+', help="AppImage files or folders")
+    install_parser.add_argument('--icon')
+    install_parser.add_argument('--name')
+    install_parser.add_argument('--dir', help="install folder (default: ~/App)")
+    install_parser.add_argument('--move', action='store_true', help="move instead of copy")
+    install_parser.add_argument('--jobs', type=int, help="parallel copies for batch installs")
+    install_parser.add_argument('--extract', action='store_true', help="fast launch: extract once and run AppRun without FUSE")
+    remove_parser = commands.add_parser('remove', parents=[common], help="remove an installed application")
+    remove_parser.add_argument('app', help="name or .desktop file")
+    edit_parser = commands.add_parser('edit', parents=[common], help="rename or change files of an installed application")
+    edit_parser.add_argument('app', help="name or .desktop file")
+    edit_parser.add_argument('--name')
+    edit_parser.add_argument('--appimage')
+    edit_parser.add_argument('--icon')
+    edit_parser.add_argument('--dir')
+    edit_parser.add_argument('--extract', action=argparse.BooleanOptionalAction, default=None,
+                             help="switch fast launch (pre-extracted) mode on or off")
+    update_parser = commands.add_parser('update', parents=[common], help="update an installed AppImage using its embedded zsync information")
+    update_parser.add_argument('app', help="name or .desktop file")
+    update_parser.add_argument('--zsync', help="URL of the .zsync file (default: read from the AppImage)")
+    clean_parser = commands.add_parser('clean', parents=[common], help="find orphaned files and leftovers in install folders")
+    clean_parser.add_argument('--yes', action='store_true', help="remove what was found (default: report only)")
+    clean_parser.add_argument('--category', action='append', choices=ORPHAN_CATEGORIES, help="limit to a category (repeatable)")
+    clean_parser.add_argument('--dir', action='append', help="scan this folder instead of the known install folders (repeatable)")
+    clean_parser.add_argument('--jobs', type=int, help="parallel directory walkers")
+    export_parser = commands.add_parser('export', parents=[common], help="write a manifest of installed applications (JSON, or TOML for *.toml)")
+    export_parser.add_argument('file', nargs='?', help="output file (default: print JSON)")
+    apply_parser = commands.add_parser('apply', parents=[common], help="install or update applications to match a manifest")
+    apply_parser.add_argument('file', help="manifest file (JSON or *.toml)")
+    apply_parser.add_argument('--dry-run', action='store_true', help="only show what would change")
+    apply_parser.add_argument('--jobs', type=int, help="parallel downloads and copies")
+    verify_parser = commands.add_parser('verify', parents=[common], help="check installed AppImages against the digests recorded at install time")
+    verify_parser.add_argument('app', nargs='*', help="names or .desktop files (default: all)")
+    verify_parser.add_argument('--full', action='store_true', help="re-read files even if size and mtime are unchanged")
+    verify_parser.add_argument('--all', action='store_true', help="also list intact applications")
+    verify_parser.add_argument('--jobs', type=int, help="parallel hashing processes")
+    return parser
+
+
+def run_gui(started=None):
+    with trace.span('startup.import_gtk'):
+        import_gtk()
+    with trace.span('startup.window'):
+        AppImageInstaller()
+    if trace.enabled:
+        # Açılıştan ana döngünün ilk boş anına kadar (pencere çizilmiş olur)
+        started = started or time.perf_counter_ns()
+        GLib.idle_add(lambda: trace.complete('startup.first_idle', started, time.perf_counter_ns()))
+        trace.watch_main_loop()
+    Gtk.main()
+    # Pencere kapanırken bekleyen menü/ikon önbelleği yenilemesi yarıda kalmasın
+    cache_refresh.flush()
+    return EXIT_OK
+
+
+def main(argv=None):
+    started = time.perf_counter_ns()
+    argv = sys.argv[1:] if argv is None else argv
+    args = build_parser().parse_args(argv)
+    trace.start(args.trace or os.environ.get(Tracer.ENV))
+    # Önceki çalışmada yarım kalan kurulum/düzenleme/silme işlemleri; günlük klasörü
+    # yoksa ya da boşsa (olağan durum) kurtarma hiç başlatılmaz
+    try:
+        journals = os.listdir(journal_dir())
+    except OSError:
+        journals = []
+    if journals:
+        recover_transactions()
+    if args.command in (None, 'gui'):
+        return run_gui(started)
+    cli = Cli(args.json)
+    try:
+        with trace.span(f"cli.{args.command}"):
+            return getattr(cli, f"cmd_{args.command}")(args)
+    finally:
+        cache_refresh.flush()
+
 
 if __name__ == "__main__":
-    installer = AppImageInstaller()
-    Gtk.main() 
\ No newline at end of file
+    sys.exit(main()) 
\ No newline at end of file
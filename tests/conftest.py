@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import appimage_installer  # noqa: E402
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    # Her test kendi HOME'unda çalışır; menü/ikon önbelleği araçları çağrılmaz
+    monkeypatch.setenv('HOME', str(tmp_path))
+    for key in ('XDG_CACHE_HOME', 'XDG_DATA_HOME', 'XDG_CONFIG_HOME'):
+        monkeypatch.delenv(key, raising=False)
+    monkeypatch.setattr(appimage_installer.cache_refresh, 'runner', lambda folders: None)
+    yield tmp_path
+    appimage_installer.cache_refresh.flush()
@@ -0,0 +1,109 @@
+import json
+import os
+
+import pytest
+
+import appimage_installer
+import benchmark
+
+
+def write_desktop(path, name, exec_path="/usr/bin/tool"):
+    with open(path, 'w') as f:
+        f.write(f"[Desktop Entry]\nType=Application\nName={name}\nExec={exec_path}\n")
+
+
+@pytest.fixture
+def apps_dir(home):
+    folder = appimage_installer.desktop_dir()
+    benchmark.make_desktop_corpus(folder, 20)
+    return folder
+
+
+def fresh():
+    return appimage_installer.AppCatalog().load()
+
+
+def test_unchanged_files_are_not_parsed(apps_dir):
+    catalog = fresh()
+    added, changed, removed = catalog.refresh()
+    assert (len(added), changed, removed, catalog.parsed) == (20, set(), set(), 20)
+    catalog = fresh()
+    assert catalog.refresh() == (set(), set(), set())
+    assert catalog.parsed == 0
+    assert len(catalog.entries) == 20
+
+
+def test_mtime_or_size_change_reparses_only_that_file(apps_dir):
+    fresh().refresh()
+    names = sorted(os.listdir(apps_dir))
+    touched, grown = (os.path.join(apps_dir, name) for name in names[:2])
+    st = os.stat(touched)
+    os.utime(touched, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    # Aynı mtime ile boyutu değişen dosya da yakalanır
+    st = os.stat(grown)
+    with open(grown, 'a') as f:
+        f.write("# grown\n")
+    os.utime(grown, ns=(st.st_atime_ns, st.st_mtime_ns))
+    catalog = fresh()
+    assert catalog.refresh() == (set(), {touched, grown}, set())
+    assert catalog.parsed == 2
+
+
+def test_content_change_updates_record(apps_dir):
+    fresh().refresh()
+    path = os.path.join(apps_dir, sorted(os.listdir(apps_dir))[0])
+    write_desktop(path, "Renamed Tool")
+    catalog = fresh()
+    catalog.refresh()
+    assert catalog.entries[path]['name'] == "Renamed Tool"
+
+
+def test_entries_deleted_outside_the_tool(apps_dir):
+    fresh().refresh()
+    gone = [os.path.join(apps_dir, name) for name in sorted(os.listdir(apps_dir))[:3]]
+    for path in gone:
+        os.remove(path)
+    new = os.path.join(apps_dir, "new.desktop")
+    write_desktop(new, "New")
+    catalog = fresh()
+    assert catalog.refresh() == ({new}, set(), set(gone))
+    assert fresh().refresh() == (set(), set(), set())
+    assert not set(gone) & set(fresh().entries)
+
+
+def test_missing_apps_dir_removes_everything(apps_dir):
+    fresh().refresh()
+    for name in os.listdir(apps_dir):
+        os.remove(os.path.join(apps_dir, name))
+    os.rmdir(apps_dir)
+    catalog = fresh()
+    added, changed, removed = catalog.refresh()
+    assert (added, changed, len(removed)) == (set(), set(), 20)
+    assert catalog.entries == {}
+
+
+BAD_INDEXES = {
+    'truncated': lambda apps_dir: '{"version": 2, "apps_dir": "',
+    'list': lambda apps_dir: '[1, 2, 3]',
+    'null': lambda apps_dir: 'null',
+    'old-version': lambda apps_dir: json.dumps({'version': 1, 'apps_dir': apps_dir, 'entries': {}}),
+    'other-dir': lambda apps_dir: json.dumps({'version': 2, 'apps_dir': '/elsewhere', 'entries': {}}),
+    'entries-list': lambda apps_dir: json.dumps({'version': 2, 'apps_dir': apps_dir, 'entries': ['x']}),
+    'entry-without-stat': lambda apps_dir: json.dumps({'version': 2, 'apps_dir': apps_dir, 'entries': {
+        os.path.join(apps_dir, "app-00000.desktop"): {'name': 'X'}}}),
+}
+
+
+@pytest.mark.parametrize('kind', BAD_INDEXES)
+def test_bad_index_falls_back_to_full_scan(apps_dir, kind):
+    index_path = fresh().index_path
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    with open(index_path, 'w') as f:
+        f.write(BAD_INDEXES[kind](apps_dir))
+    catalog = fresh()
+    added, changed, removed = catalog.refresh()
+    assert len(added) + len(changed) == 20
+    assert catalog.parsed == 20
+    assert len(catalog.entries) == 20
+    # Tam taramadan sonra dizin yeniden yazılır ve geçerlidir
+    assert fresh().refresh() == (set(), set(), set())
@@ -0,0 +1,144 @@
+import compileall
+import errno
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import appimage_installer
+import benchmark
+from conftest import ROOT
+
+# `list` soğuk başlatmasının çıplak yorumlayıcıya göre izin verilen ek süresi
+LIST_BUDGET_MS = 50
+
+
+@pytest.mark.parametrize('argv,expected', [
+    (['list'], False),
+    (['--json', 'list'], True),
+    (['list', '--json'], True),
+    (['edit', 'App', '--name=--json'], False),
+])
+def test_json_flag(argv, expected):
+    args = appimage_installer.build_parser().parse_args(argv)
+    assert args.json is expected
+
+
+def test_json_as_option_value_is_kept():
+    args = appimage_installer.build_parser().parse_args(['edit', 'App', '--name=--json', '--json'])
+    assert (args.name, args.json) == ('--json', True)
+
+
+def test_edit_to_name_json_via_main(home, capsys):
+    source = os.path.join(str(home), "Tool.AppImage")
+    benchmark.make_appimage(source, "Tool")
+    assert appimage_installer.main(['install', source, '--name', 'Tool']) == appimage_installer.EXIT_OK
+    capsys.readouterr()
+    assert appimage_installer.main(['edit', 'Tool', '--name=Renamed', '--json']) == appimage_installer.EXIT_OK
+    assert json.loads(capsys.readouterr().out)
+    assert os.path.isfile(os.path.join(appimage_installer.desktop_dir(), "Renamed.desktop"))
+
+
+@pytest.mark.parametrize('argv,expected', [
+    (['--trace', 'run.json', 'list'], 'run.json'),
+    (['list', '--trace', 'run.json'], 'run.json'),
+    (['list', '--trace=run.json', '--json'], 'run.json'),
+    (['edit', 'App', '--name=--trace'], None),
+])
+def test_trace_flag(argv, expected):
+    assert appimage_installer.build_parser().parse_args(argv).trace == expected
+
+
+def test_trailing_trace_needs_a_file(capsys):
+    with pytest.raises(SystemExit):
+        appimage_installer.build_parser().parse_args(['list', '--trace'])
+    assert '--trace' in capsys.readouterr().err
+
+
+def test_unwritable_trace_file_disables_tracing(tmp_path, capsys):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    tracer = appimage_installer.Tracer()
+    tracer.start(str(blocker / "trace.json"))
+    assert not tracer.enabled
+    assert 'trace disabled' in capsys.readouterr().err
+    with tracer.span('noop'):
+        pass
+
+
+
+def batch_sources(home, *names):
+    folder = os.path.join(str(home), "src")
+    os.makedirs(folder, exist_ok=True)
+    for name in names:
+        benchmark.make_appimage(os.path.join(folder, f"{name}.AppImage"), name)
+    return [os.path.join(folder, f"{name}.AppImage") for name in names]
+
+
+def test_batch_install_reports_bad_items(home, capsys):
+    good, = batch_sources(home, "Good")
+    missing = os.path.join(str(home), "src", "Missing.AppImage")
+    blocker = os.path.join(str(home), "src", "file")
+    open(blocker, 'w').close()
+    argv = ['install', good, missing, "Bad\0Name.AppImage", os.path.join(blocker, "folder.AppImage"), '--json']
+    assert appimage_installer.main(argv) == appimage_installer.EXIT_ERROR
+    output = json.loads(capsys.readouterr().out)
+    assert output['ok'] is False
+    results = {item['name']: item for item in output['results']}
+    assert set(results) == {"Good", "Missing", "Bad\0Name", "folder"}
+    assert results["Good"]['error'] is None and os.path.isfile(results["Good"]['desktop'])
+    for name in ("Missing", "Bad\0Name", "folder"):
+        assert results[name]['error'] and results[name]['desktop'] is None
+    assert results["Missing"]['error'] == str(FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), missing))
+
+
+def test_batch_install_transaction_failure_fails_every_item(home, capsys, monkeypatch):
+    sources = batch_sources(home, "One", "Two")
+
+    error = OSError(errno.ENOSPC, os.strerror(errno.ENOSPC))
+
+    def commit(self):
+        raise error
+    monkeypatch.setattr(appimage_installer.Transaction, 'commit', commit)
+    assert appimage_installer.main(['install', *sources, '--json']) == appimage_installer.EXIT_ERROR
+    results = json.loads(capsys.readouterr().out)['results']
+    assert [(item['name'], item['desktop'], item['error']) for item in results] == [
+        (name, None, str(error)) for name in ("One", "Two")]
+    assert not any(name.endswith('.desktop') for name in os.listdir(appimage_installer.desktop_dir()))
+
+def run_list(home, *argv):
+    env = dict(os.environ, HOME=str(home), PYTHONPATH=ROOT)
+    return subprocess.run([sys.executable, *argv], env=env, capture_output=True, text=True, check=True)
+
+
+def test_list_skips_heavy_modules(home):
+    benchmark.make_desktop_corpus(appimage_installer.desktop_dir(), 50)
+    proc = run_list(home, '-c', "import io, sys, contextlib, appimage_installer\n"
+                    "with contextlib.redirect_stdout(io.StringIO()):\n"
+                    "    appimage_installer.main(['list', '--json'])\n"
+                    "print(sorted(m for m in ('http.client', 'multiprocessing', 'concurrent.futures', "
+                    "'subprocess', 'difflib', 'hashlib', 'urllib.parse', 'gi') if m in sys.modules))")
+    assert proc.stdout.strip() == '[]'
+
+
+def test_list_cold_start_budget(home):
+    # Önbellekteki bayt koduyla (-m) en iyi çalıştırma; ilk çalıştırma dosya önbelleğini ısıtır
+    compileall.compile_file(os.path.join(ROOT, "appimage_installer.py"), quiet=1)
+    benchmark.make_desktop_corpus(appimage_installer.desktop_dir(), 200)
+
+    def run_ms(*argv):
+        start = time.perf_counter()
+        run_list(home, *argv)
+        return (time.perf_counter() - start) * 1000.0
+    run_ms('-m', 'appimage_installer', 'list', '--json')
+    # Çalıştırmalar çıplak yorumlayıcıyla sırayla değişir. Makine kısa süreliğine meşgulse
+    # tur (en çok beş kez) tekrarlanır.
+    for _ in range(5):
+        samples = [(run_ms('-m', 'appimage_installer', 'list', '--json'), run_ms('-c', 'pass')) for _ in range(10)]
+        overhead = min(list_ms for list_ms, _bare in samples) - min(bare for _list, bare in samples)
+        if overhead < LIST_BUDGET_MS:
+            break
+    assert overhead < LIST_BUDGET_MS, f"list cold start {overhead:.1f} ms over the bare interpreter"
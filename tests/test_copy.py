@@ -0,0 +1,98 @@
+import errno
+import os
+
+import pytest
+
+import appimage_installer
+
+METHODS = ('reflink', 'copy_file_range', 'sendfile', 'chunked')
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    # Birkaç parçalık dosya: döngüler ilerleme ve ofsetlerle birden çok kez döner
+    monkeypatch.setattr(appimage_installer, 'COPY_CHUNK', 64 * 1024)
+    path = tmp_path / "src" / "Tool.AppImage"
+    path.parent.mkdir()
+    path.write_bytes(os.urandom(300 * 1024 + 123))
+    return str(path)
+
+
+def fail(monkeypatch, method, code):
+    def raise_(*args, **kwargs):
+        raise OSError(code, os.strerror(code))
+    if method == 'reflink':
+        monkeypatch.setattr(appimage_installer.fcntl, 'ioctl', raise_)
+    else:
+        monkeypatch.setattr(os, method, raise_)
+
+
+def leftovers(folder):
+    return [name for name in os.listdir(folder) if name.endswith('.part')]
+
+
+@pytest.mark.parametrize('code', [errno.EXDEV, errno.EOPNOTSUPP, errno.ENOSYS], ids=['EXDEV', 'EOPNOTSUPP', 'ENOSYS'])
+@pytest.mark.parametrize('failing', [1, 2, 3], ids=['no-reflink', 'no-copy_file_range', 'no-sendfile'])
+def test_fallback_chain(tmp_path, source, monkeypatch, code, failing):
+    for method in METHODS[:failing]:
+        fail(monkeypatch, method, code)
+    dest = str(tmp_path / "App" / "Tool.AppImage")
+    os.makedirs(os.path.dirname(dest))
+    calls = []
+    method = appimage_installer.copy_file(source, dest, progress=lambda done, total: calls.append((done, total)))
+    assert method == METHODS[failing]
+    assert open(dest, 'rb').read() == open(source, 'rb').read()
+    assert calls[-1] == (os.path.getsize(source),) * 2
+    assert os.stat(dest).st_mode == os.stat(source).st_mode
+    assert leftovers(os.path.dirname(dest)) == []
+
+
+def test_chunked_copy_when_kernel_copies_are_missing(tmp_path, source, monkeypatch):
+    fail(monkeypatch, 'reflink', errno.ENOTTY)
+    monkeypatch.delattr(os, 'copy_file_range', raising=False)
+    monkeypatch.delattr(os, 'sendfile', raising=False)
+    dest = str(tmp_path / "Tool.AppImage")
+    assert appimage_installer.copy_file(source, dest) == 'chunked'
+    assert open(dest, 'rb').read() == open(source, 'rb').read()
+
+
+@pytest.mark.parametrize('method', ['reflink', 'copy_file_range', 'sendfile'])
+def test_other_errors_are_not_swallowed(tmp_path, source, monkeypatch, method):
+    for earlier in METHODS[:METHODS.index(method)]:
+        fail(monkeypatch, earlier, errno.EXDEV)
+    fail(monkeypatch, method, errno.EIO)
+    dest = str(tmp_path / "Tool.AppImage")
+    with pytest.raises(OSError) as raised:
+        appimage_installer.copy_file(source, dest)
+    assert raised.value.errno == errno.EIO
+    assert not os.path.exists(dest)
+    assert leftovers(str(tmp_path)) == []
+
+
+def test_fallback_after_partial_write_is_an_error(tmp_path, source, monkeypatch):
+    # Veri yazıldıktan sonra gelen "desteklenmiyor" hatası sessizce başka yönteme geçmez
+    fail(monkeypatch, 'reflink', errno.EXDEV)
+    original = os.copy_file_range
+    calls = [0]
+
+    def copy_file_range(*args):
+        calls[0] += 1
+        if calls[0] == 2:
+            raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+        return original(*args)
+    monkeypatch.setattr(os, 'copy_file_range', copy_file_range)
+    dest = str(tmp_path / "Tool.AppImage")
+    with pytest.raises(OSError):
+        appimage_installer.copy_file(source, dest)
+    assert not os.path.exists(dest)
+    assert leftovers(str(tmp_path)) == []
+
+
+def test_cancel_removes_part_file(tmp_path, source, monkeypatch):
+    fail(monkeypatch, 'reflink', errno.EXDEV)
+    cancel = appimage_installer.threading.Event()
+    dest = str(tmp_path / "Tool.AppImage")
+    with pytest.raises(appimage_installer.CopyCancelled):
+        appimage_installer.copy_file(source, dest, progress=lambda done, total: cancel.set(), cancel=cancel)
+    assert not os.path.exists(dest)
+    assert leftovers(str(tmp_path)) == []
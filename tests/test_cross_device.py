@@ -0,0 +1,54 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+
+import appimage_installer
+import benchmark
+
+
+@pytest.fixture
+def other_device(home):
+    # Ev klasöründen farklı bir dosya sistemi (çoğu sistemde tmpfs olan /dev/shm)
+    root = '/dev/shm'
+    if not os.access(root, os.W_OK) or os.stat(root).st_dev == os.stat(str(home)).st_dev:
+        pytest.skip("no second writable filesystem")
+    folder = tempfile.mkdtemp(prefix="appimage-test-", dir=root)
+    yield folder
+    shutil.rmtree(folder, ignore_errors=True)
+
+
+def installed(home, extract=False, move=False):
+    source = os.path.join(str(home), "Tool.AppImage")
+    benchmark.make_appimage(source, "Tool")
+    return source, appimage_installer.install_app(source, None, "Tool", extract=extract, move=move)
+
+
+def test_edit_moves_extracted_app_to_other_filesystem(home, other_device):
+    _source, desktop = installed(home, extract=True)
+    before = appimage_installer.read_desktop_entry(desktop)
+    result = appimage_installer.edit_app(desktop, "Tool", before['appimage'], before.get('icon'), other_device)
+    after = appimage_installer.read_desktop_entry(result)
+    assert after['mode'] == 'extracted'
+    assert os.path.dirname(after['appdir']) == other_device
+    assert os.path.isfile(os.path.join(after['appdir'], "AppRun"))
+    assert not os.path.exists(before['appdir'])
+    assert not os.path.exists(before['appimage'])
+
+
+def test_undo_of_cross_device_move(home, other_device):
+    # Başka dosya sisteminden taşınarak kurulan dosya geri almada yerine kopyalanır
+    source = os.path.join(other_device, "Tool.AppImage")
+    benchmark.make_appimage(source, "Tool")
+    data = open(source, 'rb').read()
+    plan = appimage_installer.plan_app(source, None, "Tool", appimage_installer.default_install_dir())
+    txn = appimage_installer.Transaction('install')
+    txn.prepare(appimage_installer.plan_paths(plan))
+    appimage_installer.journal_moves(txn, [plan])
+    appimage_installer.stage_app(plan, appimage_installer.ProgressTracker(lambda fraction, label: None, 1), move=True)
+    assert not os.path.exists(source)
+    txn.rollback()
+    assert open(source, 'rb').read() == data
+    assert not os.path.exists(plan['appimage_dest'])
+    assert os.listdir(os.path.join(appimage_installer.default_install_dir(), ".store")) == []
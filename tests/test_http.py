@@ -0,0 +1,86 @@
+import http.server
+import socket
+import threading
+import time
+
+import pytest
+
+import appimage_installer
+
+
+@pytest.fixture
+def server():
+    # /icon: ETag'li 200, eşleşen If-None-Match'e 304; /slow: zaman aşımından sonra yanıt
+    connections = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def setup(self):
+            super().setup()
+            connections.append(self.client_address)
+
+        def do_GET(self):
+            if self.path == '/slow':
+                time.sleep(0.5)
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                self.send_header('ETag', '"v1"')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            body = b'icon-data'
+            self.send_response(200)
+            self.send_header('ETag', '"v1"')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", connections
+    httpd.shutdown()
+
+
+def test_conditional_requests_reuse_connection(server):
+    base, connections = server
+    session = appimage_installer.HttpSession(timeout=5)
+    try:
+        response, url = session.get(base + '/icon')
+        assert (response.status, response.read(), url) == (200, b'icon-data', base + '/icon')
+        response, _url = session.get(base + '/icon', {'If-None-Match': response.getheader('ETag')})
+        assert (response.status, response.read()) == (304, b'')
+    finally:
+        session.close()
+    assert len(connections) == 1
+
+
+def test_timeout_drops_connection(server):
+    base, connections = server
+    session = appimage_installer.HttpSession(timeout=0.2)
+    try:
+        with pytest.raises(socket.timeout):
+            session.get(base + '/slow')
+        assert session.connections == {}
+        # Sonraki istek yeni bir bağlantıyla başarılı olur
+        response, _url = session.get(base + '/icon')
+        assert (response.status, response.read()) == (200, b'icon-data')
+    finally:
+        session.close()
+    assert len(connections) == 2
+
+
+def test_half_read_response_is_retried_on_fresh_connection(server):
+    base, connections = server
+    session = appimage_installer.HttpSession(timeout=5)
+    try:
+        session.get(base + '/icon')
+        response, _url = session.get(base + '/icon')
+        assert (response.status, response.read()) == (200, b'icon-data')
+    finally:
+        session.close()
+    assert len(connections) == 2
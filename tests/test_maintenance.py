@@ -0,0 +1,47 @@
+import os
+
+import appimage_installer
+import benchmark
+
+
+def orphan_paths(result):
+    return {item['path'] for category in result['categories'].values() for item in category['items']}
+
+
+def test_hand_copied_files_are_not_orphans(home):
+    install_dir = appimage_installer.default_install_dir()
+    os.makedirs(os.path.join(install_dir, "Project.AppDir"))
+    benchmark.make_appimage(os.path.join(install_dir, "MyTool.AppImage"), "MyTool")
+    with open(os.path.join(install_dir, "logo.png"), 'wb') as f:
+        f.write(benchmark.make_png(32))
+    result = appimage_installer.scan_orphans()
+    assert orphan_paths(result) == set()
+
+
+def test_installed_files_left_behind_are_orphans(home):
+    source = os.path.join(str(home), "Tool.AppImage")
+    benchmark.make_appimage(source, "Tool")
+    icon = os.path.join(str(home), "tool.png")
+    with open(icon, 'wb') as f:
+        f.write(benchmark.make_png(48))
+    desktop = appimage_installer.install_app(source, icon, "Tool")
+    os.remove(desktop)
+    install_dir = appimage_installer.default_install_dir()
+    result = appimage_installer.scan_orphans()
+    assert orphan_paths(result) == {os.path.join(install_dir, "Tool.AppImage"), os.path.join(install_dir, "Tool.png")}
+    appimage_installer.remove_orphans([item for category in result['categories'].values() for item in category['items']])
+    assert sorted(os.listdir(install_dir)) == [".store"]
+
+
+def test_unrecorded_files_survive_without_hardlinks(home, monkeypatch):
+    # Hardlink olmayan dosya sistemi: kurulu dosyalar bütünlük kaydıyla tanınır
+    monkeypatch.setattr(appimage_installer.BlobStore, 'supports_links', lambda self: False)
+    source = os.path.join(str(home), "Tool.AppImage")
+    benchmark.make_appimage(source, "Tool")
+    desktop = appimage_installer.install_app(source, None, "Tool")
+    os.remove(desktop)
+    install_dir = appimage_installer.default_install_dir()
+    benchmark.make_appimage(os.path.join(install_dir, "Mine.AppImage"), "Mine")
+    result = appimage_installer.scan_orphans()
+    assert os.path.join(install_dir, "Tool.AppImage") in orphan_paths(result)
+    assert os.path.join(install_dir, "Mine.AppImage") not in orphan_paths(result)
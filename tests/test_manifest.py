@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+import appimage_installer
+import benchmark
+
+
+@pytest.mark.parametrize('data', [
+    {'version': '2', 'apps': []},
+    {'version': True, 'apps': []},
+    {'apps': [{'name': 'Tool', 'source': '/x.AppImage', 'sha256': 5}]},
+    {'apps': [{'name': 'Tool', 'source': '/x.AppImage', 'folder': 7}]},
+    {'apps': [{'name': 'Tool', 'source': '/x.AppImage', 'categories': ['A']}]},
+    {'apps': [{'name': 'Tool', 'source': '/x.AppImage', 'icon': {'path': 'x'}}]},
+    {'apps': [{'name': 'Tool', 'source': '/x.AppImage', 'extract': 'false'}]},
+], ids=['version-str', 'version-bool', 'sha256', 'folder', 'categories', 'icon', 'extract'])
+def test_wrong_types_are_manifest_errors(data):
+    with pytest.raises(appimage_installer.ManifestError):
+        appimage_installer.parse_manifest(data)
+
+
+def make_source(home, name):
+    source = os.path.join(str(home), "src", f"{name}.AppImage")
+    os.makedirs(os.path.dirname(source), exist_ok=True)
+    benchmark.make_appimage(source, name)
+    return source
+
+
+def test_reconfigure_and_install_share_one_transaction(home, monkeypatch):
+    # Tema ikonları üç boyutta kurulu bir uygulama başka klasöre ve kategoriye taşınır,
+    # aynı bildirimle yeni bir uygulama kurulur
+    icon = benchmark.make_icon_set(os.path.join(str(home), "icons"), "tool", sizes=(16, 48, 128))
+    desktop = appimage_installer.install_app(make_source(home, "Tool"), icon, "Tool")
+    before = appimage_installer.read_desktop_entry(desktop)
+    theme = appimage_installer.theme_icon_files(before['theme_icon'])
+    assert len(theme) == 3
+    folder = os.path.join(str(home), "Apps")
+    entries = appimage_installer.parse_manifest({'apps': [
+        {'name': 'Tool', 'source': before['appimage'], 'categories': 'Graphics;', 'folder': folder},
+        {'name': 'New', 'source': make_source(home, "New")},
+    ]})
+    labels = []
+    original = appimage_installer.Transaction.__init__
+
+    def init(self, label='', *args, **kwargs):
+        labels.append(label)
+        original(self, label, *args, **kwargs)
+    monkeypatch.setattr(appimage_installer.Transaction, '__init__', init)
+    plan = appimage_installer.apply_manifest(entries)
+    assert [(item['name'], item['action'], item['error']) for item in plan] == \
+        [('Tool', 'reconfigure', None), ('New', 'install', None)]
+    assert labels == ['manifest']
+    after = appimage_installer.read_desktop_entry(desktop)
+    assert after['appimage'] == os.path.join(folder, "Tool.AppImage")
+    assert after['categories'] == 'Graphics;'
+    assert after['theme_icon'] == before['theme_icon']
+    assert appimage_installer.theme_icon_files(after['theme_icon']) == theme
+    assert [name for name in os.listdir(os.path.dirname(before['appimage'])) if name.startswith("Tool")] == []
+
+
+def test_reconfigure_moves_extracted_folder(home, monkeypatch):
+    desktop = appimage_installer.install_app(make_source(home, "Tool"), None, "Tool", extract=True)
+    before = appimage_installer.read_desktop_entry(desktop)
+    folder = os.path.join(str(home), "Apps")
+
+    def extract_into(*args, **kwargs):
+        raise AssertionError("extracted folder should be moved, not extracted again")
+    monkeypatch.setattr(appimage_installer, 'extract_into', extract_into)
+    plan = appimage_installer.apply_manifest(appimage_installer.parse_manifest(
+        {'apps': [{'name': 'Tool', 'source': before['appimage'], 'folder': folder, 'extract': True}]}))
+    assert [(item['action'], item['error']) for item in plan] == [('reconfigure', None)]
+    after = appimage_installer.read_desktop_entry(desktop)
+    assert after['mode'] == 'extracted'
+    assert os.path.isfile(os.path.join(after['appdir'], "AppRun"))
+    assert os.path.dirname(after['appdir']) == folder
+    assert not os.path.exists(before['appdir'])
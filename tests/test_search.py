@@ -0,0 +1,143 @@
+import os
+
+import pytest
+
+import appimage_installer
+import benchmark
+
+SearchIndex = appimage_installer.SearchIndex
+
+
+def build(records):
+    index = SearchIndex()
+    for path, record in records.items():
+        index.add(path, record)
+    return index
+
+
+def tables(index):
+    return index.docs, index.names, index.grams, index.prefixes
+
+
+@pytest.mark.parametrize('text,expected', [
+    ("Çizim Aracı", "cizim araci"),
+    ("ŞEKİL Düzenleyici", "sekil duzenleyici"),
+    ("Café Crème", "cafe creme"),
+    ("Plain ASCII", "plain ascii"),
+    (None, ""),
+])
+def test_normalize_text(text, expected):
+    assert appimage_installer.normalize_text(text) == expected
+
+
+def test_case_and_diacritics_are_ignored():
+    index = build({'/a.desktop': {'name': "Çizim Aracı", 'categories': "Graphics;"},
+                   '/b.desktop': {'name': "Terminal"}})
+    for query in ("cizim", "ÇİZİM", "araci", "Aracı", "ciz ara", "ÇI"):
+        assert index.search(query) == ['/a.desktop'], query
+
+
+def test_short_queries_use_word_prefixes():
+    index = build({
+        '/code.desktop': {'name': "Visual Studio Code", 'exec': "/usr/bin/code %F"},
+        '/vlc.desktop': {'name': "VLC", 'categories': "AudioVideo;Player;"},
+        '/gimp.desktop': {'name': "GIMP", 'keywords': "image;vector;"},
+        '/go.desktop': {'name': "Go", 'categories': "Development;"},
+    })
+    # İki harflik kelime tam eşleşmesi, önek eşleşmesinden önce gelir
+    assert index.search("go") == ['/go.desktop']
+    # İsim başı (8 x 2) eşit puanda isme göre, anahtar kelime başı (3 x 2) sonra
+    assert index.search("v") == ['/code.desktop', '/vlc.desktop', '/gimp.desktop']
+    assert index.search("vs") == ['/code.desktop']
+    # Kısa kelime uzun kelimenin adayları içinde aranır
+    assert index.search("v studio") == ['/code.desktop']
+    assert index.search("zz") == []
+    assert index.search("  ") is None
+
+
+def test_ranking_follows_field_weights_and_match_kind():
+    records = {
+        '/exact-name.desktop': {'name': "Paint"},
+        '/prefix-name.desktop': {'name': "Painter"},
+        '/infix-name.desktop': {'name': "Mspaint"},
+        '/keyword.desktop': {'name': "Canvas", 'keywords': "paint;draw;"},
+        '/category.desktop': {'name': "Sketch", 'categories': "Paint;Graphics;"},
+        '/exec.desktop': {'name': "Other", 'exec': "/usr/bin/paint --new"},
+        '/none.desktop': {'name': "Editor"},
+    }
+    index = build(records)
+    # isim 8 x (tam 3, başı 2, içi 1), anahtar kelime 3 x 3, kategori 2 x 3, komut 1 x 3
+    assert index.search("paint") == ['/exact-name.desktop', '/prefix-name.desktop', '/keyword.desktop',
+                                     '/infix-name.desktop', '/category.desktop', '/exec.desktop']
+    fields = dict(SearchIndex.FIELDS)
+    assert [index.word_score(index.docs[path], "paint") for path in index.search("paint")] == [
+        fields['name'] * SearchIndex.EXACT, fields['name'] * SearchIndex.PREFIX, fields['keywords'] * SearchIndex.EXACT,
+        fields['name'] * SearchIndex.INFIX, fields['categories'] * SearchIndex.EXACT, fields['exec'] * SearchIndex.EXACT]
+
+
+def test_initials_and_multiple_words_add_up():
+    index = build({
+        '/code.desktop': {'name': "Visual Studio Code"},
+        '/studio.desktop': {'name': "Studio", 'keywords': "visual;"},
+    })
+    assert index.search("vsc") == ['/code.desktop']
+    # İki kelime de isimde olan, biri anahtar kelimede olandan önce gelir
+    assert index.search("visual studio") == ['/code.desktop', '/studio.desktop']
+
+
+def test_equal_scores_sort_by_name():
+    index = build({f'/{name}.desktop': {'name': name} for name in ("Zeta Tool", "alpha tool", "Mid Tool")})
+    assert index.search("tool") == ['/alpha tool.desktop', '/Mid Tool.desktop', '/Zeta Tool.desktop']
+    assert index.search("tool", limit=2) == ['/alpha tool.desktop', '/Mid Tool.desktop']
+
+
+def test_typo_falls_back_to_fuzzy_match():
+    index = build({'/firefox.desktop': {'name': "Firefox"}, '/files.desktop': {'name': "Files"}})
+    assert index.search("firefx") == ['/firefox.desktop']
+
+
+def test_add_and_remove_touch_only_their_terms():
+    first = {'name': "Çizim Aracı", 'keywords': "draw;paint;", 'categories': "Graphics;"}
+    second = {'name': "Paint Studio", 'categories': "Graphics;", 'exec': "/opt/paint/bin/studio"}
+    index = build({'/a.desktop': first})
+    before = [{key: set(value) if isinstance(value, set) else value for key, value in table.items()}
+              for table in tables(index)]
+    index.add('/b.desktop', second)
+    assert index.search("paint") == ['/b.desktop', '/a.desktop']
+    index.remove('/b.desktop')
+    assert list(tables(index)) == before
+    # Aynı yolun yeniden eklenmesi eski terimlerini bırakmaz
+    index.add('/a.desktop', {'name': "Renamed"})
+    assert index.search("cizim") == []
+    assert tables(index) == tables(build({'/a.desktop': {'name': "Renamed"}}))
+    index.remove('/a.desktop')
+    index.remove('/missing.desktop')
+    assert tables(index) == ({}, {}, {}, {})
+
+
+def test_index_follows_install_and_delete(home):
+    # Arayüzdeki gibi: katalog değişiklikleri (eklenen/değişen/silinen) dizine uygulanır
+    catalog = appimage_installer.AppCatalog().load()
+    catalog.refresh()
+    index = SearchIndex()
+
+    def sync():
+        added, changed, removed = catalog.refresh()
+        for path in removed:
+            index.remove(path)
+        for path in added | changed:
+            index.add(path, catalog.entries[path])
+    sources = {}
+    for name in ("Çizim Aracı", "Terminal"):
+        source = os.path.join(str(home), "src", f"{name}.AppImage")
+        os.makedirs(os.path.dirname(source), exist_ok=True)
+        benchmark.make_appimage(source, "Tool")
+        sources[name] = appimage_installer.install_app(source, None, name)
+    sync()
+    assert index.search("cizim") == [sources["Çizim Aracı"]]
+    assert index.search("te") == [sources["Terminal"]]
+    appimage_installer.remove_app(sources["Terminal"])
+    sync()
+    assert index.search("te") == []
+    assert len(index) == 1
+    assert tables(index) == tables(build({path: catalog.entries[path] for path in index.docs}))
@@ -0,0 +1,130 @@
+import struct
+import sys
+
+import pytest
+
+import appimage_installer
+import benchmark
+
+
+def write_image(path, files, **kwargs):
+    runtime = benchmark.make_elf_runtime()
+    with open(path, 'wb') as f:
+        f.write(runtime)
+        f.write(benchmark.make_squashfs(files, **kwargs))
+    return len(runtime)
+
+
+def patch_superblock(path, offset, fmt, value):
+    with open(path, 'r+b') as f:
+        f.seek(appimage_installer.elf_end_offset(path) + offset)
+        f.write(struct.pack(fmt, value))
+
+
+@pytest.mark.parametrize('sections', [(), [('.upd_info', b'zsync|https://example.org/Tool.AppImage.zsync')],
+                                      [('.sha256_sig', bytes(1024)), ('.sig_key', bytes(3000))]],
+                         ids=['plain', 'update-info', 'signature'])
+def test_elf_end_offset_is_squashfs_start(tmp_path, sections):
+    runtime = benchmark.make_elf_runtime(sections)
+    path = str(tmp_path / "Tool.AppImage")
+    benchmark.make_appimage(path, "Tool", sections=sections)
+    assert appimage_installer.elf_end_offset(path) == len(runtime)
+    with appimage_installer.open_appimage(path) as image:
+        assert image.offset == len(runtime)
+
+
+def test_elf_end_offset_rejects_other_files(tmp_path):
+    path = tmp_path / "script.AppImage"
+    path.write_bytes(b"#!/bin/sh\necho not an AppImage\n" * 4)
+    with pytest.raises(appimage_installer.SquashFSError, match="ELF"):
+        appimage_installer.elf_end_offset(str(path))
+
+
+@pytest.mark.parametrize('offset,fmt,value', [(0, '<I', 0x12345678), (28, '<H', 3)], ids=['magic', 'version'])
+def test_superblock_is_checked(tmp_path, offset, fmt, value):
+    path = str(tmp_path / "Tool.AppImage")
+    benchmark.make_appimage(path, "Tool")
+    patch_superblock(path, offset, fmt, value)
+    with pytest.raises(appimage_installer.SquashFSError, match="SquashFS 4.0"):
+        appimage_installer.open_appimage(path)
+
+
+def test_short_image_is_rejected(tmp_path):
+    path = tmp_path / "Tool.AppImage"
+    path.write_bytes(benchmark.make_elf_runtime() + b'hsqs')
+    with pytest.raises(appimage_installer.SquashFSError):
+        appimage_installer.open_appimage(str(path))
+
+
+@pytest.mark.parametrize('compressor', ['gzip', 'xz'])
+def test_root_desktop_and_icon_lookup(tmp_path, compressor):
+    path = str(tmp_path / "Tool.AppImage")
+    files = benchmark.make_appimage(path, "Tool", compressor=compressor,
+                                    extra_files={"usr/lib/data.bin": b'tool data ' * 40000})
+    with appimage_installer.open_appimage(path) as image:
+        assert image.compressor == {'gzip': 1, 'xz': 4}[compressor]
+        names = {name for name, _ref, _kind in image.listdir(image.root())}
+        assert names == {'tool.desktop', 'tool.png', '.DirIcon', 'AppRun', 'usr'}
+        assert image.read_file(image.lookup('tool.desktop')) == files['tool.desktop']
+        # .DirIcon sembolik bağı takip edilir; follow=False bağın kendisini döndürür
+        assert image.read_file(image.lookup('.DirIcon')) == files['tool.png']
+        assert image.lookup('.DirIcon', follow=False)['target'] == 'tool.png'
+        # Birden çok blok: sonuncusu blok boyutundan kısa
+        data = image.lookup('usr/lib/data.bin')
+        assert len(data['block_sizes']) == 4
+        assert image.read_file(data) == files['usr/lib/data.bin']
+        assert image.read_file(data, limit=10) == b'tool data '
+        assert image.lookup('usr/lib/missing.bin') is None
+        assert image.lookup('tool.png/child') is None
+
+
+def test_metadata_prefers_hicolor_icon_named_by_desktop(tmp_path, monkeypatch):
+    icon = benchmark.make_png(256)
+    path = str(tmp_path / "Paint.AppImage")
+    write_image(path, {
+        "paint.desktop": b"[Desktop Entry]\nName=Paint\nIcon=paint-icon\nCategories=Graphics;\n"
+                         b"[Desktop Action new]\nName=New\n",
+        "usr/share/icons/hicolor/256x256/apps/paint-icon.png": icon,
+        "AppRun": b"#!/bin/sh\n",
+    })
+    meta = appimage_installer.extract_appimage_metadata(path, str(tmp_path / "cache"))
+    assert (meta['name'], meta['categories']) == ('Paint', 'Graphics;')
+    assert open(meta['icon'], 'rb').read() == icon
+
+    # İkinci çağrı önbellekten; imaj açılmaz
+    def open_appimage(path):
+        raise AssertionError("cached metadata should not open the image")
+    monkeypatch.setattr(appimage_installer, 'open_appimage', open_appimage)
+    assert appimage_installer.extract_appimage_metadata(path, str(tmp_path / "cache")) == meta
+
+
+def test_large_directory_spans_metadata_blocks(tmp_path):
+    files = {f"share/file-{i:04d}.txt": f"file {i}\n".encode() for i in range(700)}
+    path = str(tmp_path / "Many.AppImage")
+    write_image(path, files)
+    with appimage_installer.open_appimage(path) as image:
+        share = image.lookup('share')
+        assert len(image.listdir(share)) == 700
+        for name in ("file-0000.txt", "file-0255.txt", "file-0256.txt", "file-0699.txt"):
+            assert image.read_file(image.lookup(f"share/{name}")) == files[f"share/{name}"]
+
+
+def test_zstd_without_zstandard_is_a_clear_error(tmp_path, monkeypatch):
+    # gzip bloklu imaj zstd olarak işaretlenir; 'zstandard' modülü yokmuş gibi davranılır
+    path = str(tmp_path / "Tool.AppImage")
+    benchmark.make_appimage(path, "Tool", extra_files={"usr/lib/data.bin": b'x' * 100000})
+    patch_superblock(path, 20, '<H', 6)
+    monkeypatch.setitem(sys.modules, 'zstandard', None)
+    with appimage_installer.open_appimage(path) as image:
+        assert image.compressor == 6
+        with pytest.raises(appimage_installer.SquashFSError, match="zstandard"):
+            image.read_file(image.lookup('usr/lib/data.bin'))
+
+
+def test_unknown_compressor(tmp_path):
+    path = str(tmp_path / "Tool.AppImage")
+    benchmark.make_appimage(path, "Tool", extra_files={"usr/lib/data.bin": b'y' * 4096})
+    patch_superblock(path, 20, '<H', 9)
+    with appimage_installer.open_appimage(path) as image:
+        with pytest.raises(appimage_installer.SquashFSError, match="9"):
+            image.read_file(image.lookup('usr/lib/data.bin'))
@@ -0,0 +1,53 @@
+import errno
+import os
+import threading
+
+import appimage_installer
+
+
+def failing_link(error):
+    def link(*args, **kwargs):
+        raise OSError(error, os.strerror(error))
+    return link
+
+
+def test_concurrent_probe_runs_once(home, monkeypatch):
+    store = appimage_installer.BlobStore(str(home))
+    probes = []
+    original = os.link
+
+    def link(src, dst, *args, **kwargs):
+        probes.append(src)
+        return original(src, dst, *args, **kwargs)
+    monkeypatch.setattr(os, 'link', link)
+    barrier = threading.Barrier(16)
+    results = []
+
+    def probe():
+        barrier.wait()
+        results.append(appimage_installer.BlobStore(str(home)).supports_links())
+    threads = [threading.Thread(target=probe) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [True] * 16
+    assert len(probes) == 1
+    assert os.listdir(store.root) == []
+
+
+def test_transient_probe_error_is_not_cached(home, monkeypatch):
+    store = appimage_installer.BlobStore(str(home))
+    with monkeypatch.context() as m:
+        m.setattr(os, 'link', failing_link(errno.ENOSPC))
+        assert store.supports_links() is False
+    assert store.supports_links() is True
+    assert os.listdir(store.root) == []
+
+
+def test_unsupported_links_are_cached(home, monkeypatch):
+    store = appimage_installer.BlobStore(str(home))
+    with monkeypatch.context() as m:
+        m.setattr(os, 'link', failing_link(errno.EPERM))
+        assert store.supports_links() is False
+    assert store.supports_links() is False
@@ -0,0 +1,37 @@
+import os
+
+import appimage_installer
+import benchmark
+
+
+def make_app(home, name):
+    source = os.path.join(str(home), "src", f"{name}.AppImage")
+    os.makedirs(os.path.dirname(source), exist_ok=True)
+    benchmark.make_appimage(source, "Tool")
+    icon = os.path.join(str(home), "src", f"{name}.png")
+    with open(icon, 'wb') as f:
+        f.write(benchmark.make_png(48))
+    return source, icon
+
+
+def test_similar_names_keep_their_own_theme_icons(home):
+    assert appimage_installer.theme_icon_name("Foo Bar") != appimage_installer.theme_icon_name("Foo-Bar")
+    desktops = [appimage_installer.install_app(*make_app(home, name), name) for name in ("Foo Bar", "Foo-Bar")]
+    icons = [appimage_installer.read_desktop_entry(desktop)['theme_icon'] for desktop in desktops]
+    assert all(appimage_installer.theme_icon_files(icon) for icon in icons)
+    appimage_installer.remove_app(desktops[0])
+    assert appimage_installer.theme_icon_files(icons[0]) == []
+    assert appimage_installer.theme_icon_files(icons[1])
+
+
+def test_many_installs_refresh_caches_once(home, monkeypatch):
+    calls = []
+    refresher = appimage_installer.CacheRefresher(runner=calls.append, delay=60, max_delay=60)
+    monkeypatch.setattr(appimage_installer, 'cache_refresh', refresher)
+    for index in range(100):
+        name = f"App{index}"
+        appimage_installer.install_app(*make_app(home, name), name)
+    assert refresher.runs == 0
+    assert refresher.flush()
+    assert refresher.runs == 1
+    assert calls == [{appimage_installer.desktop_dir(), appimage_installer.theme_dir()}]
@@ -0,0 +1,66 @@
+import os
+import time
+
+import pytest
+
+import appimage_installer
+import benchmark
+
+
+def wait_idle(cache, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with cache._cond:
+            if not cache.pending:
+                break
+        time.sleep(0.01)
+    time.sleep(0.1)
+
+
+def test_failed_keys_are_bounded(tmp_path):
+    cache = appimage_installer.ThumbnailCache(max_items=4, directory=str(tmp_path / "cache"))
+    cache._load = lambda key, path: None
+    icons = []
+    for index in range(10):
+        icon = tmp_path / f"broken-{index}.png"
+        icon.write_bytes(b'not a png')
+        icons.append(str(icon))
+        assert cache.get(str(icon)) is None
+        wait_idle(cache)
+    assert len(cache.failed) == 4
+    assert cache.key(icons[-1]) in cache.failed
+    # Başarısız olduğu bilinen ikon yeniden kuyruğa girmez
+    assert cache.get(icons[-1]) is None
+    assert not cache.pending
+
+
+@pytest.fixture
+def pixbuf():
+    pytest.importorskip('gi')
+    try:
+        appimage_installer.import_gtk()
+    except (ImportError, ValueError) as e:
+        pytest.skip(f"GTK 3 not available: {e}")
+    return appimage_installer.GdkPixbuf
+
+
+def test_disk_hits_survive_pruning(tmp_path, pixbuf):
+    # Diskte en eski yazılan ama son kullanılan küçük resim silinmemeli
+    directory = str(tmp_path / "cache")
+    icons = []
+    for index in range(3):
+        icon = tmp_path / f"icon-{index}.png"
+        icon.write_bytes(benchmark.make_png(48, (index * 60, 100, 100)))
+        icons.append(str(icon))
+    cache = appimage_installer.ThumbnailCache(max_items=1, directory=directory)
+    cache.max_disk_items = 2
+    for index, icon in enumerate(icons):
+        assert cache._load(cache.key(icon), icon) is not None
+        disk_path = os.path.join(directory, f"{cache.key(icon)}.png")
+        os.utime(disk_path, (1000 + index, 1000 + index))
+    assert cache._load(cache.key(icons[0]), icons[0]) is not None
+    cache.prune_disk()
+    kept = set(os.listdir(directory))
+    assert f"{cache.key(icons[0])}.png" in kept
+    assert f"{cache.key(icons[1])}.png" not in kept
+    assert len(kept) == 2
@@ -0,0 +1,134 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import appimage_installer
+from conftest import ROOT
+
+
+def read_chrome(path):
+    # Dizi biçimi: kapanış köşeli parantezi ve son virgül isteğe bağlıdır
+    text = open(path).read().rstrip()
+    assert text.startswith('[')
+    if not text.endswith(']'):
+        text = text.rstrip(',') + ']'
+    return json.loads(text)
+
+
+def read_jsonl(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def record(tracer):
+    # Ana iş parçacığında iç içe iki span, bir işçide ayrı bir span, sayaçlar ve hatalı span
+    worker_tid = []
+
+    def worker():
+        worker_tid.append(threading.get_native_id())
+        with tracer.span('worker.job', item=1):
+            tracer.count('bytes', 10)
+    with tracer.span('outer', label='x') as span:
+        with tracer.span('outer.inner'):
+            tracer.count('bytes', 5)
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        span.set(files=2)
+    with pytest.raises(KeyError):
+        with tracer.span('failing'):
+            raise KeyError('x')
+    tracer.close()
+    return worker_tid[0]
+
+
+def check_events(events, worker_tid):
+    assert events[0]['ph'] == 'M' and events[0]['name'] == 'process_name'
+    assert events[-1]['name'] == 'summary'
+    assert events[-1]['args']['counters'] == {'bytes': 15}
+    spans = {event['name']: event for event in events if event['ph'] == 'X'}
+    assert set(spans) == {'outer', 'outer.inner', 'worker.job', 'failing'}
+    outer, inner, job = spans['outer'], spans['outer.inner'], spans['worker.job']
+    assert outer['args'] == {'label': 'x', 'files': 2}
+    assert (outer['cat'], inner['cat']) == ('outer', 'outer')
+    # İç span dıştakinin içinde kalır
+    assert outer['ts'] <= inner['ts'] and inner['ts'] + inner['dur'] <= outer['ts'] + outer['dur']
+    assert outer['tid'] == inner['tid'] == threading.get_native_id()
+    assert job['tid'] == worker_tid != outer['tid']
+    assert spans['failing']['args'] == {'error': 'KeyError'}
+    counters = [event['args']['bytes'] for event in events if event['ph'] == 'C']
+    assert counters == [5, 15]
+    assert {event['pid'] for event in events} == {os.getpid()}
+
+
+def test_chrome_trace_is_a_json_array(tmp_path):
+    path = str(tmp_path / "trace.json")
+    tracer = appimage_installer.Tracer()
+    tracer.start(path)
+    worker_tid = record(tracer)
+    check_events(read_chrome(path), worker_tid)
+
+
+def test_jsonl_trace_has_one_event_per_line(tmp_path):
+    path = str(tmp_path / "trace.jsonl")
+    tracer = appimage_installer.Tracer()
+    tracer.start(path)
+    worker_tid = record(tracer)
+    check_events(read_jsonl(path), worker_tid)
+
+
+def test_rotated_chrome_files_stay_valid(tmp_path, monkeypatch):
+    monkeypatch.setattr(appimage_installer.Tracer, 'MAX_BYTES', 2048)
+    path = str(tmp_path / "trace.json")
+    tracer = appimage_installer.Tracer()
+    tracer.start(path)
+    for i in range(200):
+        with tracer.span('step', i=i):
+            pass
+    tracer.close()
+    files = [path] + [f"{path}.{index}" for index in range(1, tracer.BACKUPS + 1)]
+    assert all(os.path.exists(name) for name in files)
+    assert not os.path.exists(f"{path}.{tracer.BACKUPS + 1}")
+    # Her döndürülmüş dosya kendi başına açılabilir; özet en yeni dosyanın sonundadır
+    chunks = [read_chrome(name) for name in files]
+    assert all(len(events) > 10 for events in chunks[1:])
+    assert chunks[0][-1]['name'] == 'summary'
+    steps = [event['args']['i'] for events in reversed(chunks) for event in events if event['name'] == 'step']
+    assert steps == list(range(steps[0], 200))
+
+
+def test_disabled_tracer_costs_nothing(monkeypatch):
+    tracer = appimage_installer.Tracer()
+    # Her çağrı aynı paylaşılan nesneyi döndürür; hiçbir şey yazılmaz ya da sayılmaz
+    assert tracer.span('a', size=1) is tracer.span('b') is appimage_installer.NULL_SPAN
+    with tracer.span('a') as span:
+        span.set(files=3)
+    tracer.count('bytes', 10)
+    assert tracer.counters == {}
+    assert tracer.file is None
+
+    def emit(event):
+        raise AssertionError("disabled tracer should not emit")
+    monkeypatch.setattr(tracer, 'emit', emit)
+    tracer.count('bytes')
+    tracer.close()
+    monkeypatch.setattr(appimage_installer, 'trace', tracer)
+    calls = []
+    wrapped = appimage_installer.traced('op')(lambda value: calls.append(value) or value)
+    assert wrapped(7) == 7 and calls == [7]
+
+
+def test_trace_option_records_cli_command(home):
+    path = os.path.join(str(home), "run.json")
+    env = dict(os.environ, HOME=str(home), PYTHONPATH=ROOT)
+    env.pop(appimage_installer.Tracer.ENV, None)
+    subprocess.run([sys.executable, '-m', 'appimage_installer', 'list', '--trace', path, '--json'],
+                   env=env, check=True, capture_output=True)
+    events = read_chrome(path)
+    assert events[0]['args']['argv'] == ['list', '--trace', path, '--json']
+    assert 'cli.list' in {event['name'] for event in events if event['ph'] == 'X'}
+    assert events[-1]['name'] == 'summary'
@@ -0,0 +1,171 @@
+import errno
+import os
+import subprocess
+import sys
+
+import pytest
+
+import appimage_installer
+import benchmark
+from conftest import ROOT
+
+# Düzenleme işleminin günlük adımları: (fonksiyon, kaçıncı çağrı, önce/sonra, commit kaydı yazıldı mı)
+STEPS = [
+    ('Transaction._append', 1, 'before', False),
+    ('Transaction._append', 1, 'after', False),
+    ('install_theme_icon', 1, 'before', False),
+    ('store_file', 1, 'after', False),
+    ('store_file', 2, 'after', False),
+    ('write_desktop_file', 1, 'after', False),
+    ('Transaction.commit', 1, 'before', False),
+    ('Transaction.finish', 1, 'before', True),
+    ('finish_records', 1, 'before', True),
+]
+
+# Adımda süreci öldüren (os._exit) ya da hata fırlatan küçük bir düzenleme betiği
+EDIT_SCRIPT = '''
+import errno, os, sys
+sys.path.insert(0, {root!r})
+import appimage_installer
+
+def inject(target, nth, when, action, no_links):
+    owner, _, name = target.rpartition('.')
+    owner = getattr(appimage_installer, owner) if owner else appimage_installer
+    original = getattr(owner, name)
+    calls = [0]
+
+    def wrapper(*args, **kwargs):
+        calls[0] += 1
+        if calls[0] == nth and when == 'before':
+            action()
+        result = original(*args, **kwargs)
+        if calls[0] == nth and when == 'after':
+            action()
+        return result
+    setattr(owner, name, wrapper)
+    if no_links:
+        def link(*args, **kwargs):
+            raise OSError(errno.EPERM, 'Operation not permitted')
+        os.link = link
+
+if __name__ == '__main__':
+    target, nth, when, no_links, desktop, appimage, icon, folder = sys.argv[1:]
+    inject(target, int(nth), when, lambda: os._exit(17), no_links == '1')
+    appimage_installer.edit_app(desktop, 'Renamed', appimage, icon, folder)
+'''
+
+
+def no_links(monkeypatch):
+    # FAT benzeri dosya sistemi: hardlink EPERM ile reddedilir
+    def link(*args, **kwargs):
+        raise OSError(errno.EPERM, 'Operation not permitted')
+    monkeypatch.setattr(os, 'link', link)
+    monkeypatch.setattr(appimage_installer.BlobStore, '_link_support', {})
+
+
+def snapshot(home):
+    # Depo ve uygulama verisi dışındaki bütün dosyalar içerikleriyle
+    skip = appimage_installer.data_dir()
+    state = {}
+    for folder, dirs, files in os.walk(str(home)):
+        dirs[:] = [d for d in dirs if d != '.store' and os.path.join(folder, d) != skip]
+        for name in files:
+            path = os.path.join(folder, name)
+            with open(path, 'rb') as f:
+                state[os.path.relpath(path, str(home))] = f.read()
+    return state
+
+
+def installed_app(home):
+    source = os.path.join(str(home), "Tool.AppImage")
+    benchmark.make_appimage(source, "Tool")
+    icon = os.path.join(str(home), "tool.png")
+    with open(icon, 'wb') as f:
+        f.write(benchmark.make_png(48))
+    desktop = appimage_installer.install_app(source, icon, "Tool")
+    new_icon = os.path.join(str(home), "new.png")
+    with open(new_icon, 'wb') as f:
+        f.write(benchmark.make_png(64))
+    return desktop, new_icon
+
+
+def journals():
+    try:
+        return os.listdir(appimage_installer.journal_dir())
+    except OSError:
+        return []
+
+
+def test_edit_in_place_without_hardlinks(home, monkeypatch):
+    # Kaynak ve hedef aynı AppImage: yedek kopyalanır, canlı dosya yerinden oynamaz
+    desktop, new_icon = installed_app(home)
+    no_links(monkeypatch)
+    entry = appimage_installer.read_desktop_entry(desktop)
+    before = open(entry['appimage'], 'rb').read()
+    folder = os.path.dirname(entry['appimage'])
+    result = appimage_installer.edit_app(desktop, "Tool", entry['appimage'], new_icon, folder)
+    entry = appimage_installer.read_desktop_entry(result)
+    assert open(entry['appimage'], 'rb').read() == before
+    assert open(entry['icon'], 'rb').read() == open(new_icon, 'rb').read()
+    assert [name for name in os.listdir(folder) if '.txn-' in name or name.endswith('.part')] == []
+    assert journals() == []
+
+
+@pytest.mark.parametrize('links', [True, False], ids=['links', 'no-links'])
+@pytest.mark.parametrize('target,nth,when,committed', STEPS)
+def test_killed_edit_is_recovered(home, links, target, nth, when, committed):
+    desktop, new_icon = installed_app(home)
+    entry = appimage_installer.read_desktop_entry(desktop)
+    folder = os.path.dirname(entry['appimage'])
+    prior = snapshot(home)
+    script = os.path.join(str(home), "edit.py")
+    with open(script, 'w') as f:
+        f.write(EDIT_SCRIPT.format(root=ROOT))
+    proc = subprocess.run([sys.executable, script, target, str(nth), when, '0' if links else '1',
+                           desktop, entry['appimage'], new_icon, folder],
+                          env=dict(os.environ, HOME=str(home)), capture_output=True, text=True)
+    os.remove(script)
+    assert proc.returncode == 17, proc.stderr
+    recovered = appimage_installer.recover_transactions()
+    # Günlüğün ilk satırından önce ölen süreç geride bir şey bırakmaz
+    journaled = (target, nth, when) != ('Transaction._append', 1, 'before')
+    assert [state for _name, state in recovered] == (['completed'] if committed else ['rolled_back'] if journaled else [])
+    assert journals() == []
+    if committed:
+        after = snapshot(home)
+        assert os.path.join(".local", "share", "applications", "Renamed.desktop") in after
+        assert os.path.join(".local", "share", "applications", "Tool.desktop") not in after
+        assert after[os.path.relpath(os.path.join(folder, "Renamed.png"), str(home))] == prior["new.png"]
+    else:
+        assert snapshot(home) == prior
+
+
+@pytest.mark.parametrize('links', [True, False], ids=['links', 'no-links'])
+@pytest.mark.parametrize('target,nth,when', [step[:3] for step in STEPS if not step[3]])
+def test_failed_edit_is_rolled_back(home, monkeypatch, links, target, nth, when):
+    desktop, new_icon = installed_app(home)
+    entry = appimage_installer.read_desktop_entry(desktop)
+    folder = os.path.dirname(entry['appimage'])
+    prior = snapshot(home)
+    if not links:
+        no_links(monkeypatch)
+    owner, _, name = target.rpartition('.')
+    owner = getattr(appimage_installer, owner) if owner else appimage_installer
+    original = getattr(owner, name)
+    calls = [0]
+
+    def wrapper(*args, **kwargs):
+        calls[0] += 1
+        if calls[0] == nth and when == 'before':
+            raise OSError(errno.EIO, 'injected')
+        result = original(*args, **kwargs)
+        if calls[0] == nth and when == 'after':
+            raise OSError(errno.EIO, 'injected')
+        return result
+    monkeypatch.setattr(owner, name, wrapper)
+    with pytest.raises(OSError, match='injected'):
+        appimage_installer.edit_app(desktop, "Renamed", entry['appimage'], new_icon, folder)
+    monkeypatch.setattr(owner, name, original)
+    assert snapshot(home) == prior
+    assert appimage_installer.recover_transactions() == []
+    assert journals() == []
@@ -0,0 +1,122 @@
+import concurrent.futures
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import appimage_installer
+import benchmark
+
+
+def install(home, name):
+    source = os.path.join(str(home), "src", f"{name}.AppImage")
+    os.makedirs(os.path.dirname(source), exist_ok=True)
+    benchmark.make_appimage(source, name)
+    desktop = appimage_installer.install_app(source, None, name)
+    return appimage_installer.read_desktop_entry(desktop)['appimage']
+
+
+def statuses(**kwargs):
+    return {item['name']: (item['status'], item['cached']) for item in appimage_installer.verify_apps(**kwargs)}
+
+
+def flip_byte(path, offset):
+    with open(path, 'r+b') as f:
+        f.seek(offset)
+        byte = f.read(1)
+        f.seek(offset)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+
+@pytest.fixture
+def app(home):
+    return install(home, "Tool")
+
+
+def test_unchanged_file_uses_cached_result(app, monkeypatch):
+    # Kurulumda kaydedilen imza değişmediyse dosya okunmaz
+    def sha256_file(*args, **kwargs):
+        raise AssertionError("unchanged file should not be read")
+    monkeypatch.setattr(appimage_installer, 'sha256_file', sha256_file)
+    assert statuses() == {'Tool': ('ok', True)}
+    store = appimage_installer.IntegrityStore()
+    assert store.get(app)['checked'] == appimage_installer.DigestCache.signature(os.stat(app))
+
+
+def test_full_rereads_unchanged_file(app, monkeypatch):
+    calls = []
+    original = appimage_installer.sha256_file
+    monkeypatch.setattr(appimage_installer, 'sha256_file', lambda path, **kwargs: calls.append(path) or original(path, **kwargs))
+    assert statuses(full=True) == {'Tool': ('ok', False)}
+    assert calls == [app]
+
+
+def test_touched_file_is_ok_through_digest(app):
+    st = os.stat(app)
+    os.utime(app, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert statuses() == {'Tool': ('ok', False)}
+    # Yeni imza kaydedilir; sonraki doğrulama dosyayı okumaz
+    assert statuses() == {'Tool': ('ok', True)}
+
+
+def test_truncated_file(app):
+    size = os.path.getsize(app)
+    with open(app, 'r+b') as f:
+        f.truncate(size // 2)
+    assert statuses() == {'Tool': ('truncated', False)}
+    assert appimage_installer.integrity_flags(appimage_installer.AppCatalog().load()) != {}
+
+
+def test_flipped_byte_with_same_mtime_is_corrupt(app):
+    st = os.stat(app)
+    flip_byte(app, st.st_size // 2)
+    os.utime(app, ns=(st.st_atime_ns, st.st_mtime_ns))
+    # İmza değişmediği için sadece tam doğrulama (full=True) dosyayı okur
+    assert statuses() == {'Tool': ('ok', True)}
+    assert statuses(full=True) == {'Tool': ('corrupt', False)}
+
+
+def test_flipped_byte_is_modified(app):
+    st = os.stat(app)
+    flip_byte(app, st.st_size // 2)
+    os.utime(app, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert statuses() == {'Tool': ('modified', False)}
+    # Kurulumdaki özet temel kalır: değişen dosya sonraki doğrulamada da sorunlu görünür
+    assert statuses() == {'Tool': ('modified', True)}
+    assert appimage_installer.IntegrityStore().get(app)['size'] == st.st_size
+
+
+def test_missing_file(app):
+    os.remove(app)
+    assert statuses() == {'Tool': ('missing', False)}
+
+
+def test_broken_process_pool_falls_back_to_sha256_file(home, monkeypatch):
+    paths = [install(home, name) for name in ("One", "Two", "Three")]
+
+    class BrokenPool:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def submit(self, fn, *args):
+            future = concurrent.futures.Future()
+            future.set_exception(BrokenProcessPool("worker died"))
+            return future
+
+        def shutdown(self, wait=True, cancel_futures=False):
+            pass
+    calls = []
+    original = appimage_installer.sha256_file
+    monkeypatch.setattr(concurrent.futures, 'ProcessPoolExecutor', BrokenPool)
+    monkeypatch.setattr(appimage_installer, 'VERIFY_POOL_MIN_BYTES', 0)
+    monkeypatch.setattr(appimage_installer, 'sha256_file', lambda path, **kwargs: calls.append(path) or original(path, **kwargs))
+    assert statuses(full=True, workers=2) == {name: ('ok', False) for name in ("One", "Two", "Three")}
+    assert sorted(calls) == sorted(paths)
+
+
+def test_process_pool_detects_truncation(home, monkeypatch):
+    paths = {name: install(home, name) for name in ("One", "Two")}
+    with open(paths['Two'], 'r+b') as f:
+        f.truncate(100)
+    monkeypatch.setattr(appimage_installer, 'VERIFY_POOL_MIN_BYTES', 0)
+    assert statuses(full=True, workers=2) == {'One': ('ok', False), 'Two': ('truncated', False)}
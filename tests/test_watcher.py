@@ -0,0 +1,143 @@
+import os
+import threading
+import time
+
+import pytest
+
+import appimage_installer
+
+
+@pytest.fixture
+def glib():
+    pytest.importorskip('gi')
+    try:
+        appimage_installer.import_gtk()
+    except (ImportError, ValueError) as e:
+        pytest.skip(f"GTK 3 not available: {e}")
+    return appimage_installer.GLib
+
+
+def pump(glib, until, timeout=10.0):
+    context = glib.MainContext.default()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and not until():
+        context.iteration(False)
+        time.sleep(0.01)
+
+
+def test_burst_reaches_on_change_once(tmp_path, glib):
+    # Paket yöneticisi gibi .tmp + rename ile 50 .desktop, yanında süzülmesi gereken dosyalar
+    apps_dir = str(tmp_path / "applications")
+    install_dir = str(tmp_path / "App")
+    os.makedirs(apps_dir)
+    os.makedirs(install_dir)
+    calls = []
+
+    def on_change(paths):
+        calls.append(set(paths))
+        return False
+    watcher = appimage_installer.AppWatcher(apps_dir, on_change, delay=0.3, max_delay=5.0)
+    watcher.watch(apps_dir)
+    watcher.watch(install_dir)
+    expected = set()
+    try:
+        for i in range(50):
+            path = os.path.join(apps_dir, f"burst-{i:02d}.desktop")
+            with open(path + ".tmp", 'w') as f:
+                f.write(f"[Desktop Entry]\nName=Burst {i}\nExec=/usr/bin/burst\nType=Application\n")
+            os.replace(path + ".tmp", path)
+            expected.add(path)
+        with open(os.path.join(apps_dir, "mimeinfo.cache"), 'w') as f:
+            f.write("")
+        part = os.path.join(install_dir, f".Tool.AppImage.{os.getpid()}.1.part")
+        with open(part, 'wb') as f:
+            f.write(b'x')
+        os.replace(part, os.path.join(install_dir, "Tool.AppImage"))
+        expected.add(os.path.join(install_dir, "Tool.AppImage"))
+        pump(glib, lambda: calls)
+        # Sessiz kalan süre boyunca ikinci bir çağrı gelmemeli
+        pump(glib, lambda: len(calls) > 1, timeout=1.0)
+    finally:
+        watcher.close()
+    assert len(calls) == 1
+    assert calls[0] == expected
+
+
+def deliver(debouncer, events, apps_dir):
+    # Gio'nun "changed" sinyalindeki (dosya, diğer dosya, klasör) üçlüleri AppWatcher süzgecinden geçer
+    for gfile, other_file, folder in events:
+        for path in (gfile, other_file):
+            if appimage_installer.is_watched_change(path, folder, apps_dir):
+                debouncer.push(path)
+
+
+def burst_events(apps_dir, install_dir, count):
+    # Her .desktop için .tmp oluşturma, yazma bitti ve .tmp -> asıl ad taşıma olayları;
+    # aralarda süzülmesi gereken önbellek ve yarım kopya dosyaları
+    events, expected = [], set()
+    for i in range(count):
+        path = os.path.join(apps_dir, f"burst-{i:05d}.desktop")
+        events += [(path + ".tmp", None, apps_dir), (path + ".tmp", None, apps_dir), (path + ".tmp", path, apps_dir),
+                   (os.path.join(apps_dir, "mimeinfo.cache"), None, apps_dir)]
+        expected.add(path)
+    for i in range(count // 10):
+        path = os.path.join(install_dir, f"Tool-{i}.AppImage")
+        part = os.path.join(install_dir, f".Tool-{i}.AppImage.{os.getpid()}.1.part")
+        events += [(part, None, install_dir), (part, path, install_dir), (path + "~", None, install_dir)]
+        expected.add(path)
+    return events, expected
+
+
+def test_thousands_of_events_refresh_once():
+    apps_dir, install_dir = "/home/u/.local/share/applications", "/home/u/App"
+    events, expected = burst_events(apps_dir, install_dir, 5000)
+    calls = []
+    received = threading.Event()
+
+    def on_change(paths):
+        calls.append(set(paths))
+        received.set()
+    debouncer = appimage_installer.Debouncer(on_change, delay=0.5, max_delay=60.0)
+    # Gio olayları birden çok klasör izleyicisinden aynı anda gelebilir
+    threads = [threading.Thread(target=deliver, args=(debouncer, events[i::4], apps_dir)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert received.wait(10)
+    # Sessiz kalan süre boyunca ikinci bir çağrı gelmemeli
+    time.sleep(1.0)
+    debouncer.close()
+    assert len(calls) == 1 == debouncer.calls
+    assert calls[0] == expected
+
+
+def test_endless_stream_is_flushed_by_max_delay():
+    apps_dir = "/home/u/.local/share/applications"
+    events, expected = burst_events(apps_dir, "/home/u/App", 2000)
+    calls = []
+    debouncer = appimage_installer.Debouncer(calls.append, delay=0.5, max_delay=0.2)
+    deadline = time.monotonic() + 0.6
+    while time.monotonic() < deadline:
+        deliver(debouncer, events[:400], apps_dir)
+        time.sleep(0.01)
+    deliver(debouncer, events, apps_dir)
+    debouncer.close()
+    debouncer._thread.join(5)
+    # Olaylar hiç durmasa da yenileme en geç max_delay'de yapılır, olay başına değil
+    assert 2 <= len(calls) < 20
+    assert set().union(*calls) == expected
+
+
+@pytest.mark.parametrize('path,folder,watched', [
+    ("/a/applications/tool.desktop", "/a/applications", True),
+    ("/a/applications/tool.desktop.tmp", "/a/applications", False),
+    ("/a/applications/mimeinfo.cache", "/a/applications", False),
+    ("/a/applications/.hidden.desktop", "/a/applications", False),
+    ("/a/App/Tool.AppImage", "/a/App", True),
+    ("/a/App/.Tool.AppImage.1.2.part", "/a/App", False),
+    ("/a/App/Tool.AppImage~", "/a/App", False),
+    (None, "/a/App", False),
+])
+def test_watched_change_filter(path, folder, watched):
+    assert appimage_installer.is_watched_change(path, folder, "/a/applications") is watched
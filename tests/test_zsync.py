@@ -0,0 +1,124 @@
+import functools
+import http.server
+import os
+import threading
+
+import pytest
+
+import appimage_installer
+import benchmark
+
+
+def serve(root, mode, cancel=None):
+    # Range'i desteklemeyen ('ignore') ya da yanlış aralık bildiren ('shifted') sunucu
+    served = {'requests': 0}
+
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            with open(self.translate_path(self.path), 'rb') as f:
+                data = f.read()
+            served['requests'] += 1
+            spec = self.headers.get('Range', '')
+            if mode == 'shifted' and spec.startswith('bytes='):
+                first, last = (int(value) for value in spec[6:].split('-'))
+                self.send_response(206)
+                self.send_header('Content-Range', f"bytes {first + 1}-{last + 1}/{len(data)}")
+                self.send_header('Content-Length', str(last - first + 1))
+                self.end_headers()
+                self.wfile.write(data[first + 1:last + 2])
+                return
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            if cancel is not None and spec:
+                # Gövdenin yarısından sonra iptal edilir
+                self.wfile.write(data[:len(data) // 2])
+                self.wfile.flush()
+                cancel.set()
+                data = data[len(data) // 2:]
+            self.wfile.write(data)
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(Handler, directory=root))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, served
+
+
+@pytest.fixture
+def release(tmp_path):
+    # Kurulu eski sürüm ve iki ayrı yerinde değişmiş yayımlanan sürüm
+    old = os.urandom(256 * 1024)
+    new = old[:40000] + os.urandom(5000) + old[45000:200000] + os.urandom(3000) + old[203000:]
+    target = tmp_path / "installed" / "Tool.AppImage"
+    target.parent.mkdir()
+    target.write_bytes(old)
+    published = tmp_path / "www"
+    published.mkdir()
+    (published / "Tool.AppImage").write_bytes(new)
+    (published / "Tool.AppImage.zsync").write_bytes(benchmark.make_zsync(str(published / "Tool.AppImage"), "Tool.AppImage"))
+    return str(target), str(published), old, new
+
+
+def zsync_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}/Tool.AppImage.zsync"
+
+
+def leftovers(target):
+    return [name for name in os.listdir(os.path.dirname(target)) if name.endswith('.part')]
+
+
+def test_update_downloads_only_changed_ranges(home, release):
+    target, published, old, new = release
+    server, served = benchmark.serve_directory(published)
+    try:
+        result = appimage_installer.zsync_update(target, zsync_url(server))
+    finally:
+        server.shutdown()
+    assert result['updated']
+    assert open(target, 'rb').read() == new
+    assert 0 < result['downloaded'] < len(new) // 4
+    assert result['reused'] + result['downloaded'] == len(new)
+
+
+def test_server_ignoring_ranges_is_downloaded_once(home, release):
+    target, published, old, new = release
+    server, served = serve(published, 'ignore')
+    try:
+        result = appimage_installer.zsync_update(target, zsync_url(server))
+    finally:
+        server.shutdown()
+    assert result['updated']
+    assert open(target, 'rb').read() == new
+    assert result['downloaded'] == len(new)
+    # .zsync + tek tam gövde; ikinci aralık istenmez
+    assert served['requests'] == 2
+
+
+def test_mismatched_content_range_is_rejected(home, release):
+    target, published, old, new = release
+    server, served = serve(published, 'shifted')
+    try:
+        with pytest.raises(appimage_installer.UpdateError, match='aralık'):
+            appimage_installer.zsync_update(target, zsync_url(server))
+    finally:
+        server.shutdown()
+    assert open(target, 'rb').read() == old
+    assert leftovers(target) == []
+
+
+def test_cancel_while_reading_whole_body(home, release):
+    target, published, old, new = release
+    cancel = threading.Event()
+    server, served = serve(published, 'ignore', cancel)
+    try:
+        with pytest.raises(appimage_installer.CopyCancelled):
+            appimage_installer.zsync_update(target, zsync_url(server), cancel=cancel)
+    finally:
+        server.shutdown()
+    assert cancel.is_set()
+    assert open(target, 'rb').read() == old
+    assert leftovers(target) == []